@@ -19,6 +19,16 @@ config = context.config
 target_metadata = BaseModel.metadata
 logger.info(f"Detected tables in metadata: {list(target_metadata.tables.keys())}")
 
+
+def include_object(object, name, type_, reflected, compare_to):
+    """Skip the full-text search objects managed by hand-written migrations."""
+    if type_ == "table" and name.startswith("product_fts"):
+        return False
+    if type_ == "index" and name == "ix_product_search":
+        return False
+    return True
+
+
 def run_migrations_offline() -> None:
     """Run migrations in 'offline' mode."""
     url = database_settings.sqlite_url
@@ -28,6 +38,7 @@ def run_migrations_offline() -> None:
         target_metadata=target_metadata,
         literal_binds=True,
         dialect_opts={"paramstyle": "named"},
+        include_object=include_object,
     )
 
     with context.begin_transaction():
@@ -46,7 +57,8 @@ async def run_migrations_online() -> None:
         await connection.run_sync(
             lambda sync_conn: context.configure(
                 connection=sync_conn,
-                target_metadata=target_metadata
+                target_metadata=target_metadata,
+                include_object=include_object,
             )
         )
         await connection.run_sync(lambda _: context.run_migrations())
@@ -0,0 +1,73 @@
+"""product_search_index
+
+Revision ID: 3c1f7a9e2b54
+Revises: 722ee430aa86
+Create Date: 2026-10-19 13:05:41.512907
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3c1f7a9e2b54'
+down_revision: Union[str, Sequence[str], None] = '722ee430aa86'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    dialect = op.get_bind().dialect.name
+
+    if dialect == "sqlite":
+        # External-content FTS5 index over Product, kept in sync by triggers
+        op.execute(
+            "CREATE VIRTUAL TABLE product_fts USING fts5("
+            "name, description, content='Product', content_rowid='id', "
+            "tokenize='unicode61 remove_diacritics 2')"
+        )
+        op.execute(
+            'CREATE TRIGGER product_fts_ai AFTER INSERT ON "Product" BEGIN '
+            "INSERT INTO product_fts(rowid, name, description) "
+            "VALUES (new.id, new.name, new.description); END"
+        )
+        op.execute(
+            'CREATE TRIGGER product_fts_ad AFTER DELETE ON "Product" BEGIN '
+            "INSERT INTO product_fts(product_fts, rowid, name, description) "
+            "VALUES ('delete', old.id, old.name, old.description); END"
+        )
+        op.execute(
+            'CREATE TRIGGER product_fts_au AFTER UPDATE OF name, description ON "Product" BEGIN '
+            "INSERT INTO product_fts(product_fts, rowid, name, description) "
+            "VALUES ('delete', old.id, old.name, old.description); "
+            "INSERT INTO product_fts(rowid, name, description) "
+            "VALUES (new.id, new.name, new.description); END"
+        )
+        op.execute("INSERT INTO product_fts(product_fts) VALUES ('rebuild')")
+    elif dialect == "postgresql":
+        op.create_index(
+            'ix_product_search',
+            'Product',
+            [
+                sa.text(
+                    "to_tsvector('simple', name || ' ' || coalesce(description, ''))"
+                )
+            ],
+            postgresql_using='gin',
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    dialect = op.get_bind().dialect.name
+
+    if dialect == "sqlite":
+        op.execute("DROP TRIGGER IF EXISTS product_fts_au")
+        op.execute("DROP TRIGGER IF EXISTS product_fts_ad")
+        op.execute("DROP TRIGGER IF EXISTS product_fts_ai")
+        op.execute("DROP TABLE IF EXISTS product_fts")
+    elif dialect == "postgresql":
+        op.drop_index('ix_product_search', table_name='Product')
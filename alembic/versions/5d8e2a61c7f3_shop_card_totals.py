@@ -0,0 +1,53 @@
+"""shop_card_totals
+
+Revision ID: 5d8e2a61c7f3
+Revises: 3c1f7a9e2b54
+Create Date: 2026-10-19 13:40:12.518204
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5d8e2a61c7f3'
+down_revision: Union[str, Sequence[str], None] = '3c1f7a9e2b54'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('shop_cards', sa.Column('items_count', sa.Integer(), server_default='0', nullable=False))
+    op.add_column('shop_cards', sa.Column('lines_count', sa.Integer(), server_default='0', nullable=False))
+    op.add_column('shop_cards', sa.Column('total_price', sa.Float(), server_default='0', nullable=False))
+
+    # Backfill the aggregates of existing carts
+    op.execute(
+        """
+        UPDATE shop_cards SET
+            items_count = COALESCE((
+                SELECT SUM(i.quantity) FROM shop_card_items i
+                WHERE i.shop_card_id = shop_cards.id
+            ), 0),
+            lines_count = (
+                SELECT COUNT(*) FROM shop_card_items i
+                WHERE i.shop_card_id = shop_cards.id
+            ),
+            total_price = COALESCE((
+                SELECT SUM(i.quantity * p.price)
+                FROM shop_card_items i JOIN "Product" p ON p.id = i.product_id
+                WHERE i.shop_card_id = shop_cards.id
+            ), 0)
+        """
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.batch_alter_table('shop_cards') as batch_op:
+        batch_op.drop_column('total_price')
+        batch_op.drop_column('lines_count')
+        batch_op.drop_column('items_count')
@@ -0,0 +1,79 @@
+"""server_timestamps
+
+Revision ID: 614bc4f906c8
+Revises: f134ea53fb58
+Create Date: 2026-10-19 13:32:58.968317
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '614bc4f906c8'
+down_revision: Union[str, Sequence[str], None] = 'f134ea53fb58'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Timestamp columns that used to get the process start time from the client
+TIMESTAMPS = {
+    'Product': ['created_at', 'updated_at'],
+    'Order': ['created_at', 'updated_at'],
+    'dialogs': ['created_at', 'updated_at'],
+    'messages': ['created_at'],
+    'shop_cards': ['created_at', 'updated_at'],
+    'shop_card_items': ['added_at'],
+    'users': ['created_at', 'updated_at'],
+}
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for table, columns in TIMESTAMPS.items():
+        with op.batch_alter_table(table) as batch_op:
+            for column in columns:
+                batch_op.alter_column(
+                    column,
+                    existing_type=sa.DateTime(),
+                    existing_nullable=False,
+                    server_default=sa.func.now(),
+                )
+
+    # The status history has real timestamps: use the last change of an order
+    op.execute(
+        """
+        UPDATE "Order" SET updated_at = (
+            SELECT MAX(e.created_at) FROM order_status_events e
+            WHERE e.order_id = "Order".id
+        )
+        WHERE EXISTS (
+            SELECT 1 FROM order_status_events e
+            WHERE e.order_id = "Order".id AND e.created_at > "Order".updated_at
+        )
+        """
+    )
+
+    op.create_index('ix_order_user_id_created_at_id', 'Order', ['user_id', 'created_at', 'id'], unique=False)
+    op.create_index('ix_dialogs_user2_id_is_read_updated_at_id', 'dialogs', ['user2_id', 'is_read', 'updated_at', 'id'], unique=False)
+    op.create_index('ix_messages_dialog_id_created_at_id', 'messages', ['dialog_id', 'created_at', 'id'], unique=False)
+    op.create_index('ix_shop_cards_user_id_created_at_id', 'shop_cards', ['user_id', 'created_at', 'id'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_shop_cards_user_id_created_at_id', table_name='shop_cards')
+    op.drop_index('ix_messages_dialog_id_created_at_id', table_name='messages')
+    op.drop_index('ix_dialogs_user2_id_is_read_updated_at_id', table_name='dialogs')
+    op.drop_index('ix_order_user_id_created_at_id', table_name='Order')
+
+    for table, columns in TIMESTAMPS.items():
+        with op.batch_alter_table(table) as batch_op:
+            for column in columns:
+                batch_op.alter_column(
+                    column,
+                    existing_type=sa.DateTime(),
+                    existing_nullable=False,
+                    server_default=None,
+                )
@@ -0,0 +1,51 @@
+"""chat_id_bigint
+
+Revision ID: 7a2c9e4d5b81
+Revises: d41b7e9c3a58
+Create Date: 2026-10-19 17:48:02.736514
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '7a2c9e4d5b81'
+down_revision: Union[str, Sequence[str], None] = 'd41b7e9c3a58'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+TABLES = ('messages', 'outbox_messages')
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Earlier versions of message_surrogate_key and order_status_events_outbox
+    # created these columns as INTEGER, int4 on PostgreSQL. SQLite integers
+    # are 64-bit whatever the declared type
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+    for table in TABLES:
+        op.alter_column(
+            table,
+            'chat_id',
+            existing_type=sa.Integer(),
+            type_=sa.BigInteger(),
+            existing_nullable=False,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+    for table in TABLES:
+        op.alter_column(
+            table,
+            'chat_id',
+            existing_type=sa.BigInteger(),
+            type_=sa.Integer(),
+            existing_nullable=False,
+        )
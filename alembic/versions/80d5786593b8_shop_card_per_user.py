@@ -0,0 +1,86 @@
+"""shop_card_per_user
+
+Revision ID: 80d5786593b8
+Revises: ae541f872a63
+Create Date: 2026-10-19 13:42:26.212803
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '80d5786593b8'
+down_revision: Union[str, Sequence[str], None] = 'ae541f872a63'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Racing get_or_create calls could give a user several carts: keep the
+    # newest one, move the lines of the others into it, then merge lines of
+    # the same product
+    op.execute(
+        """
+        UPDATE shop_card_items SET shop_card_id = (
+            SELECT MAX(keep.id) FROM shop_cards keep
+            WHERE keep.user_id = (
+                SELECT c.user_id FROM shop_cards c
+                WHERE c.id = shop_card_items.shop_card_id
+            )
+        )
+        WHERE shop_card_id NOT IN (SELECT MAX(id) FROM shop_cards GROUP BY user_id)
+        """
+    )
+    op.execute(
+        "DELETE FROM shop_cards WHERE id NOT IN "
+        "(SELECT MAX(id) FROM shop_cards GROUP BY user_id)"
+    )
+    op.execute(
+        """
+        UPDATE shop_card_items SET quantity = (
+            SELECT SUM(i.quantity) FROM shop_card_items i
+            WHERE i.shop_card_id = shop_card_items.shop_card_id
+              AND i.product_id = shop_card_items.product_id
+        )
+        WHERE id IN (
+            SELECT MIN(id) FROM shop_card_items
+            GROUP BY shop_card_id, product_id HAVING COUNT(*) > 1
+        )
+        """
+    )
+    op.execute(
+        "DELETE FROM shop_card_items WHERE id NOT IN "
+        "(SELECT MIN(id) FROM shop_card_items GROUP BY shop_card_id, product_id)"
+    )
+    op.execute(
+        """
+        UPDATE shop_cards SET
+            items_count = COALESCE((
+                SELECT SUM(i.quantity) FROM shop_card_items i
+                WHERE i.shop_card_id = shop_cards.id
+            ), 0),
+            lines_count = (
+                SELECT COUNT(*) FROM shop_card_items i
+                WHERE i.shop_card_id = shop_cards.id
+            ),
+            total_price = COALESCE((
+                SELECT SUM(i.quantity * p.price)
+                FROM shop_card_items i JOIN "Product" p ON p.id = i.product_id
+                WHERE i.shop_card_id = shop_cards.id
+            ), 0)
+        """
+    )
+
+    op.drop_index('ix_shop_cards_user_id_created_at_id', table_name='shop_cards')
+    op.create_index('ix_shop_cards_updated_at', 'shop_cards', ['updated_at'], unique=False)
+    op.create_index('ux_shop_cards_user_id', 'shop_cards', ['user_id'], unique=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ux_shop_cards_user_id', table_name='shop_cards')
+    op.drop_index('ix_shop_cards_updated_at', table_name='shop_cards')
+    op.create_index('ix_shop_cards_user_id_created_at_id', 'shop_cards', ['user_id', 'created_at', 'id'], unique=False)
@@ -0,0 +1,55 @@
+"""shop_card_item_unique_product
+
+Revision ID: 9b4e2c7d1a36
+Revises: 581d9617290d
+Create Date: 2026-10-19 15:12:40.518337
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '9b4e2c7d1a36'
+down_revision: Union[str, Sequence[str], None] = '581d9617290d'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Concurrent adds could still create a second line of a product: merge
+    # them into the oldest line before the unique index goes in
+    op.execute(
+        """
+        UPDATE shop_card_items SET quantity = (
+            SELECT SUM(i.quantity) FROM shop_card_items i
+            WHERE i.shop_card_id = shop_card_items.shop_card_id
+              AND i.product_id = shop_card_items.product_id
+        )
+        WHERE id IN (
+            SELECT MIN(id) FROM shop_card_items
+            GROUP BY shop_card_id, product_id HAVING COUNT(*) > 1
+        )
+        """
+    )
+    op.execute(
+        "DELETE FROM shop_card_items WHERE id NOT IN "
+        "(SELECT MIN(id) FROM shop_card_items GROUP BY shop_card_id, product_id)"
+    )
+    op.execute(
+        """
+        UPDATE shop_cards SET lines_count = (
+            SELECT COUNT(*) FROM shop_card_items i
+            WHERE i.shop_card_id = shop_cards.id
+        )
+        """
+    )
+
+    op.create_index('ux_shop_card_items_shop_card_id_product_id', 'shop_card_items', ['shop_card_id', 'product_id'], unique=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ux_shop_card_items_shop_card_id_product_id', table_name='shop_card_items')
@@ -0,0 +1,48 @@
+"""message_surrogate_key
+
+Revision ID: cf2dfb6e5f76
+Revises: 614bc4f906c8
+Create Date: 2026-10-19 13:35:49.117228
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'cf2dfb6e5f76'
+down_revision: Union[str, Sequence[str], None] = '614bc4f906c8'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('messages', sa.Column('chat_id', sa.BigInteger(), nullable=True))
+    op.add_column('messages', sa.Column('telegram_message_id', sa.Integer(), nullable=True))
+
+    # Until now the id was the Telegram message id; dialogs are private chats,
+    # whose chat id is the id of the user in it, i.e. the sender
+    op.execute("UPDATE messages SET chat_id = sender_id, telegram_message_id = id")
+
+    with op.batch_alter_table('messages') as batch_op:
+        batch_op.alter_column('chat_id', existing_type=sa.BigInteger(), nullable=False)
+        batch_op.alter_column('telegram_message_id', existing_type=sa.Integer(), nullable=False)
+    op.create_index('ux_messages_chat_id_telegram_message_id', 'messages', ['chat_id', 'telegram_message_id'], unique=True)
+
+    # Explicit ids were inserted, so the serial sequence is behind them
+    if op.get_bind().dialect.name == 'postgresql':
+        op.execute(
+            "SELECT setval(pg_get_serial_sequence('messages', 'id'), "
+            "COALESCE(MAX(id), 0) + 1, false) FROM messages"
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ux_messages_chat_id_telegram_message_id', table_name='messages')
+    with op.batch_alter_table('messages') as batch_op:
+        batch_op.drop_column('telegram_message_id')
+        batch_op.drop_column('chat_id')
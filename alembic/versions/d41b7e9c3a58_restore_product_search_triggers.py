@@ -0,0 +1,52 @@
+"""restore_product_search_triggers
+
+Revision ID: d41b7e9c3a58
+Revises: c5a8e1f04b92
+Create Date: 2026-10-19 17:12:30.418265
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd41b7e9c3a58'
+down_revision: Union[str, Sequence[str], None] = 'c5a8e1f04b92'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    if op.get_bind().dialect.name != "sqlite":
+        return
+
+    # server_timestamps rebuilt "Product" through batch_alter_table, which on
+    # SQLite drops the table's triggers: put them back and reindex the rows
+    # written since
+    op.execute(
+        'CREATE TRIGGER IF NOT EXISTS product_fts_ai AFTER INSERT ON "Product" BEGIN '
+        "INSERT INTO product_fts(rowid, name, description) "
+        "VALUES (new.id, new.name, new.description); END"
+    )
+    op.execute(
+        'CREATE TRIGGER IF NOT EXISTS product_fts_ad AFTER DELETE ON "Product" BEGIN '
+        "INSERT INTO product_fts(product_fts, rowid, name, description) "
+        "VALUES ('delete', old.id, old.name, old.description); END"
+    )
+    op.execute(
+        "CREATE TRIGGER IF NOT EXISTS product_fts_au "
+        'AFTER UPDATE OF name, description ON "Product" BEGIN '
+        "INSERT INTO product_fts(product_fts, rowid, name, description) "
+        "VALUES ('delete', old.id, old.name, old.description); "
+        "INSERT INTO product_fts(rowid, name, description) "
+        "VALUES (new.id, new.name, new.description); END"
+    )
+    op.execute("INSERT INTO product_fts(product_fts) VALUES ('rebuild')")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    # The triggers belong to product_search_index, which drops them
+    pass
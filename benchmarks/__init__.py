@@ -0,0 +1,8 @@
+"""
+Reproducible micro-benchmarks, run from the repository root::
+
+    python -m benchmarks.callback_dispatch
+
+Each module prints its measurements; ``tests/test_benchmarks.py`` runs them
+with a few iterations so they keep working.
+"""
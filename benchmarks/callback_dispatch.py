@@ -0,0 +1,101 @@
+"""
+Dispatch cost per callback: compiled prefix trie vs the old filter chain.
+
+Both dispatchers register one no-op handler per ``CallbackPrefixes`` member.
+The old chain gives every handler a sync ``lambda`` prefix filter, as the
+handlers did before ``CallbackPrefixFilter``; the trie dispatcher resolves the
+data once in ``CallbackArgsMiddleware``. Callbacks cycle through every prefix,
+so late registrations pay for the filters in front of them.
+"""
+
+import argparse
+import asyncio
+from time import perf_counter
+from typing import Callable, Dict, List
+
+from aiogram import Bot, Dispatcher, Router
+from aiogram.types import CallbackQuery, Update, User
+
+from core.internal.enums import CallbackPrefixes
+from filters import CallbackPrefixFilter
+from middleware import CallbackArgsMiddleware
+
+USER = User(id=1, is_bot=False, first_name="Bench")
+
+
+def _updates(count: int) -> List[Update]:
+    prefixes = list(CallbackPrefixes)
+    return [
+        Update(
+            update_id=i,
+            callback_query=CallbackQuery(
+                id=str(i),
+                from_user=USER,
+                chat_instance="bench",
+                data=f"{prefixes[i % len(prefixes)].value}{i}",
+            ),
+        )
+        for i in range(count)
+    ]
+
+
+async def _noop(callback: CallbackQuery) -> None:
+    return None
+
+
+def lambda_chain() -> Dispatcher:
+    router = Router()
+    for prefix in CallbackPrefixes:
+        router.callback_query.register(
+            _noop, lambda c, p=prefix.value: c.data.startswith(p)
+        )
+    dispatcher = Dispatcher()
+    dispatcher.include_router(router)
+    return dispatcher
+
+
+def prefix_trie() -> Dispatcher:
+    router = Router()
+    for prefix in CallbackPrefixes:
+        router.callback_query.register(_noop, CallbackPrefixFilter(prefix))
+    dispatcher = Dispatcher()
+    dispatcher.callback_query.outer_middleware(CallbackArgsMiddleware())
+    dispatcher.include_router(router)
+    return dispatcher
+
+
+DISPATCHERS: Dict[str, Callable[[], Dispatcher]] = {
+    "lambda filter chain": lambda_chain,
+    "prefix trie": prefix_trie,
+}
+
+
+async def run(iterations: int) -> Dict[str, float]:
+    """Microseconds per callback for every dispatcher."""
+    bot = Bot("123456:benchmark")  # handlers make no API calls
+    updates = _updates(iterations)
+    results = {}
+    for name, build in DISPATCHERS.items():
+        dispatcher = build()
+        for update in updates[:50]:  # warm-up
+            await dispatcher.feed_update(bot, update)
+        started = perf_counter()
+        for update in updates:
+            await dispatcher.feed_update(bot, update)
+        results[name] = (perf_counter() - started) / iterations * 1e6
+    await bot.session.close()
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("-n", "--iterations", type=int, default=5000)
+    args = parser.parse_args()
+
+    print(f"{len(CallbackPrefixes)} prefixes, {args.iterations} callbacks")
+    for name, micros in asyncio.run(run(args.iterations)).items():
+        print(f"{name:>20}: {micros:8.1f} us/callback")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+"""
+Memory of one checkout: a cart of products with large images.
+
+Seeds a temporary SQLite database with ``lines`` products carrying
+``image_size`` byte images, puts one of each in a cart twice over, then
+traces the checkout path: the cart summary and total shown before
+confirmation and ``OrderService.checkout``. Cart lines and order lines carry
+product ids only, so the peak stays far below the image bytes.
+"""
+
+import argparse
+import asyncio
+import tempfile
+import tracemalloc
+from pathlib import Path
+from time import perf_counter
+from typing import Dict
+
+from sqlalchemy import create_engine
+
+from config import DatabaseSettings
+from core.infrastructure import repositories
+from core.infrastructure.cache import CartCache
+from core.infrastructure.database import DatabaseManager
+from core.infrastructure.database.models import BaseModel
+from core.infrastructure.services import OrderService, ShopCardService, ShopService
+from core.internal.models import ProductCreate, ShopCardItemCreate, UserCreate
+
+USER_ID = 1
+
+
+def _database(path: Path) -> DatabaseManager:
+    engine = create_engine(f"sqlite:///{path}")
+    BaseModel.metadata.create_all(engine)
+    engine.dispose()
+    return DatabaseManager(
+        DatabaseSettings(name=str(path), user="bench", password="bench"),
+        repositories=[
+            getattr(repositories, name)
+            for name in repositories.__all__
+            if name != "SQLAlchemyRepository"
+        ],
+    )
+
+
+async def _fill_cart(db_manager: DatabaseManager, lines: int, image_size: int) -> None:
+    shop = ShopService(db_manager)
+    cards = ShopCardService(db_manager)
+    await shop.register_user(
+        UserCreate(telegram_id=USER_ID, username=None, full_name="Bench")
+    )
+    for i in range(lines):
+        product = await shop.add_product(
+            ProductCreate(name=f"Product {i}", price=10 + i, image=bytes(image_size))
+        )
+        await cards.add_to_card(
+            USER_ID, ShopCardItemCreate(product_id=product.id, quantity=2)
+        )
+
+
+async def run(lines: int = 30, image_size: int = 200_000) -> Dict[str, float]:
+    """Image bytes in the cart, traced peak bytes, seconds and ordered units."""
+    with tempfile.TemporaryDirectory() as tmp:
+        db_manager = _database(Path(tmp) / "bench.db")
+        try:
+            await _fill_cart(db_manager, lines, image_size)
+            cards = ShopCardService(db_manager)
+            orders = OrderService(db_manager, None, CartCache())
+
+            tracemalloc.start()
+            started = perf_counter()
+            await cards.get_card_summary(USER_ID)
+            await cards.get_card_total(USER_ID)
+            order, _ = await orders.checkout(USER_ID, "bench")
+            elapsed = perf_counter() - started
+            _, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+
+            order = await orders.get_order(order.id)
+            units = sum(line.product_quantity for line in order.order_products)
+        finally:
+            await db_manager.dispose()
+    return {
+        "image_bytes": lines * image_size,
+        "peak_bytes": peak,
+        "seconds": elapsed,
+        "units": units,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("-l", "--lines", type=int, default=30)
+    parser.add_argument("-s", "--image-size", type=int, default=200_000)
+    args = parser.parse_args()
+
+    results = asyncio.run(run(args.lines, args.image_size))
+    print(f"{args.lines} lines, {results['units']} units ordered")
+    print(f"  image bytes in cart: {results['image_bytes'] / 1e6:8.2f} MB")
+    print(f"  checkout peak:       {results['peak_bytes'] / 1e6:8.2f} MB")
+    print(f"  checkout time:       {results['seconds'] * 1000:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,111 @@
+"""
+Startup and per-render cost of ``TextCatalog`` against aiogram's Fluent core.
+
+Startup is measured cold (no parse cache), warm (parse cache file present)
+and for a plain ``FluentRuntimeCore``. Renders cover a message without
+arguments, a text-and-variables template and a longer template, in every
+locale, through ``TextCatalog.get`` and ``FluentRuntimeCore.get``.
+"""
+
+import argparse
+import asyncio
+import tempfile
+from pathlib import Path
+from time import perf_counter
+from typing import Any, Awaitable, Callable, Dict, List, Tuple
+
+from aiogram_i18n.cores.fluent_runtime_core import FluentRuntimeCore
+
+from core.infrastructure.i18n import TextCatalog
+
+LOCALES_PATH = "locales/{locale}/LC_MESSAGES"
+
+PROGRESS = dict(
+    id="7",
+    status="RUNNING",
+    processed="120",
+    total="500",
+    sent="110",
+    blocked="6",
+    failed="4",
+    throughput="28.5",
+    eta="13 min",
+)
+MESSAGES: List[Tuple[str, Dict[str, Any]]] = [
+    ("broadcast_cancelled", {}),
+    ("broadcast_started", dict(id="7", total="500")),
+    ("broadcast_progress", PROGRESS),
+]
+
+
+async def _timed(make: Callable[[], Awaitable[Any]]) -> Tuple[float, Any]:
+    started = perf_counter()
+    value = await make()
+    return perf_counter() - started, value
+
+
+async def _start(core: FluentRuntimeCore) -> FluentRuntimeCore:
+    await core.startup()
+    return core
+
+
+async def measure_startup(cache_path: Path) -> Dict[str, float]:
+    """Seconds to load the catalogs."""
+    cache_path.unlink(missing_ok=True)
+    cold, _ = await _timed(
+        lambda: _start(TextCatalog(LOCALES_PATH, cache_path=cache_path))
+    )
+    warm, _ = await _timed(
+        lambda: _start(TextCatalog(LOCALES_PATH, cache_path=cache_path))
+    )
+    fluent, _ = await _timed(lambda: _start(FluentRuntimeCore(LOCALES_PATH)))
+    return {
+        "TextCatalog, cold": cold,
+        "TextCatalog, parse cache": warm,
+        "FluentRuntimeCore": fluent,
+    }
+
+
+def measure_renders(
+    cores: Dict[str, FluentRuntimeCore], iterations: int
+) -> Dict[Tuple[str, str, str], float]:
+    """Microseconds per render, keyed by (core, locale, message)."""
+    results = {}
+    for core_name, core in cores.items():
+        for locale in sorted(core.locales):
+            for message_id, kwargs in MESSAGES:
+                core.get(message_id, locale, **kwargs)
+                started = perf_counter()
+                for _ in range(iterations):
+                    core.get(message_id, locale, **kwargs)
+                elapsed = perf_counter() - started
+                results[core_name, locale, message_id] = elapsed / iterations * 1e6
+    return results
+
+
+async def run(iterations: int) -> Tuple[Dict[str, float], Dict[Tuple[str, str, str], float]]:
+    with tempfile.TemporaryDirectory() as tmp:
+        startup = await measure_startup(Path(tmp) / "catalog.cache")
+    cores = {
+        "TextCatalog": await _start(TextCatalog(LOCALES_PATH)),
+        "FluentRuntimeCore": await _start(FluentRuntimeCore(LOCALES_PATH)),
+    }
+    return startup, measure_renders(cores, iterations)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("-n", "--iterations", type=int, default=20000)
+    args = parser.parse_args()
+
+    startup, renders = asyncio.run(run(args.iterations))
+    print("Startup")
+    for name, seconds in startup.items():
+        print(f"  {name:>26}: {seconds * 1000:8.2f} ms")
+    print(f"Render ({args.iterations} per message)")
+    for (core, locale, message_id), micros in renders.items():
+        print(f"  {core:>17} {locale} {message_id:<20}: {micros:7.2f} us")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,3 +1,27 @@
-from .config import load_settings, DatabaseSettings, AdminConfig
+from .config import (
+    load_settings,
+    DatabaseSettings,
+    AdminConfig,
+    SendSchedulerConfig,
+    ThrottlingConfig,
+    OutboxConfig,
+    InventoryConfig,
+    AnalyticsConfig,
+    RetentionConfig,
+    CartCleanupConfig,
+    TracingConfig,
+)
 
-__all__ = ["load_settings", "DatabaseSettings", "AdminConfig"]
\ No newline at end of file
+__all__ = [
+    "load_settings",
+    "DatabaseSettings",
+    "AdminConfig",
+    "SendSchedulerConfig",
+    "ThrottlingConfig",
+    "OutboxConfig",
+    "InventoryConfig",
+    "AnalyticsConfig",
+    "RetentionConfig",
+    "CartCleanupConfig",
+    "TracingConfig",
+]
@@ -7,7 +7,7 @@ from pydantic_settings import BaseSettings, SettingsConfigDict
 from dataclasses import dataclass
 from pathlib import Path
 from time import time
-from typing import List
+from typing import FrozenSet, List
 
 from logger import LoggerBuilder
 from utils import StringBuilder
@@ -46,7 +46,7 @@ class DatabaseSettings(ConfigBase):
     user: Optional[str] = Field(..., min_length=1, description="Database user")
     password: Optional[str] = Field(..., min_length=1, description="Database password")
     host: Optional[str] = Field(default="localhost", description="Database host")
-    port: Optional[str] = Field(default=5432, description="Database port")
+    port: Optional[str] = Field(default="5432", description="Database port")
     driver: Optional[str] = Field(default="aiosqlite", description="Database driver")
 
     @field_validator("name", "user", "password")
@@ -107,6 +107,7 @@ class AdminConfig:
 
     def __post_init__(self):
         self._last_updated = 0
+        self._admin_lookup: FrozenSet[int] = frozenset()
         self._load_admin_ids()
 
     def _load_admin_ids(self) -> None:
@@ -115,6 +116,7 @@ class AdminConfig:
                 with open(self.config_path, "r", encoding="utf-8") as f:
                     ids = f.readline().strip().split(",")
                     self.admin_ids = [int(x) for x in ids if x.strip()]
+                    self._refresh_lookup()
                     self._last_updated = time()
                     builder = StringBuilder()
                     for i, admin_id in enumerate(ids, 1):
@@ -126,8 +128,99 @@ class AdminConfig:
             logger.error(f"Failed to load admin IDs: {e}")
             raise
 
+    def _refresh_lookup(self) -> None:
+        self._admin_lookup = frozenset(self.admin_ids)
+
+    def add_admin_id(self, user_id: int) -> bool:
+        """Grant admin rights in memory; False if the user already has them."""
+        if user_id in self._admin_lookup:
+            return False
+        self.admin_ids.append(user_id)
+        self._refresh_lookup()
+        return True
+
     def is_admin(self, user_id: int) -> bool:
         if time() - self._last_updated > self.cache_time:
             self._load_admin_ids()
 
-        return user_id in self.admin_ids
+        return user_id in self._admin_lookup
+
+
+@dataclass(frozen=True)
+class ThrottlingConfig:
+    """Token-bucket limits applied per (user, chat) pair."""
+
+    rate: float = 1.0  # tokens refilled per second
+    burst: int = 5  # bucket capacity
+    max_buckets: int = 10_000  # least recently seen users are evicted first
+
+
+@dataclass(frozen=True)
+class SendSchedulerConfig:
+    """Outbound Bot API pacing, defaults follow Telegram's documented limits."""
+
+    global_rate: float = 30.0  # messages per second across all chats
+    global_burst: int = 30
+    chat_rate: float = 1.0  # messages per second in a private chat
+    chat_burst: int = 3
+    group_rate: float = 20 / 60  # messages per second in a group chat
+    group_burst: int = 3
+    max_retries: int = 3  # RetryAfter retries before the error is raised
+    max_chats: int = 10_000
+
+
+@dataclass(frozen=True)
+class OutboxConfig:
+    """Delivery of outbox messages (customer notifications)."""
+
+    batch_size: int = 50  # messages read per drain
+    poll_interval: float = 5.0  # seconds between drains unless woken up
+    max_attempts: int = 5  # failed attempts before a message is given up
+    retry_delay: float = 10.0  # first retry delay in seconds, doubled on every attempt
+    max_retry_delay: float = 600.0
+
+
+@dataclass(frozen=True)
+class InventoryConfig:
+    """Returning stock reserved by cancelled orders."""
+
+    batch_size: int = 100  # cancelled orders released per transaction
+    poll_interval: float = 60.0  # seconds between passes unless woken up
+
+
+@dataclass(frozen=True)
+class AnalyticsConfig:
+    """Refreshing of the daily sales rollups behind /stats."""
+
+    refresh_interval: float = 300.0  # seconds between rollup refreshes
+    batch_size: int = 500  # source rows folded per transaction
+    report_days: int = 30  # /stats period when no number of days is given
+    max_report_days: int = 366
+    top_products: int = 5
+
+
+@dataclass(frozen=True)
+class RetentionConfig:
+    """Archiving of old dialog messages into compressed blocks."""
+
+    archive_after_days: int = 90  # messages older than this leave the hot table
+    batch_size: int = 500  # messages archived per transaction
+    poll_interval: float = 3600.0  # seconds between passes once caught up
+
+
+@dataclass(frozen=True)
+class CartCleanupConfig:
+    """Deletion of abandoned carts."""
+
+    ttl_days: int = 30  # carts unchanged for longer are deleted with their lines
+    batch_size: int = 200  # carts deleted per transaction
+    interval: float = 3600.0  # seconds between runs
+
+
+@dataclass(frozen=True)
+class TracingConfig:
+    """Per-update latency, SQL and Bot API accounting."""
+
+    slow_threshold: float = 1.0  # seconds; slower updates are kept and logged
+    buffer_size: int = 100  # slow updates kept for /slowupdates, oldest dropped
+    dump_limit: int = 15  # slow updates shown by /slowupdates (one message)
@@ -1,10 +1,19 @@
 from config import AdminConfig, load_settings
 
+from .cache import CartCache, CatalogCache, UserCache
 from .database import DatabaseManager
+from .i18n import TextCatalog
+from .jobs import JobRunner
+from .tracing import UpdateTracer
 from .repositories import (
+    AnalyticsRepository,
+    BroadcastRepository,
     DialogRepository,
+    MessageArchiveRepository,
     MessageRepository,
     OrderRepository,
+    OrderStatusEventRepository,
+    OutboxRepository,
     ProductRepository,
     ShopCardItemRepository,
     ShopCardRepository,
@@ -13,6 +22,16 @@ from .repositories import (
 
 db_settings, _ = load_settings()
 admin_config = AdminConfig()
+job_runner = JobRunner()
+catalog_cache = CatalogCache()
+cart_cache = CartCache()
+user_cache = UserCache()
+update_tracer = UpdateTracer()
+text_catalog = TextCatalog(
+    path="locales/{locale}/LC_MESSAGES",
+    default_locale="ru",
+    cache_path="locales/.catalog.cache",
+)
 
 db_manager = DatabaseManager(
     config=db_settings,
@@ -23,10 +42,24 @@ db_manager = DatabaseManager(
         ProductRepository,
         DialogRepository,
         MessageRepository,
+        MessageArchiveRepository,
         ShopCardRepository,
         ShopCardItemRepository,
         OrderRepository,
+        BroadcastRepository,
+        OrderStatusEventRepository,
+        OutboxRepository,
+        AnalyticsRepository,
     ],
 )
 
-__all__ = ["db_manager", "admin_config"]
+__all__ = [
+    "db_manager",
+    "admin_config",
+    "job_runner",
+    "catalog_cache",
+    "cart_cache",
+    "user_cache",
+    "update_tracer",
+    "text_catalog",
+]
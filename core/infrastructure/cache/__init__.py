@@ -0,0 +1,5 @@
+from .cart_cache import CartCache
+from .catalog_cache import CatalogCache
+from .user_cache import UserCache
+
+__all__ = ["CatalogCache", "CartCache", "UserCache"]
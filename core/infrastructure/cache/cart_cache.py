@@ -0,0 +1,34 @@
+from typing import Iterable, Optional
+
+from core.internal.types.shop_card import ShopCardTotal
+from utils import LRUCache
+
+
+class CartCache:
+    """
+    Process-wide cache of per-user cart views.
+
+    ``ShopCardService`` fills it on read and drops a user's entry on every
+    write to that user's cart. The views carry product names and prices, so
+    renaming, repricing or deleting a product drops the carts that hold it;
+    other product edits leave the cache alone.
+    """
+
+    def __init__(self, maxsize: int = 10_000):
+        self.views: LRUCache[int, ShopCardTotal] = LRUCache(maxsize=maxsize)
+
+    def get(self, user_id: int) -> Optional[ShopCardTotal]:
+        return self.views.get(user_id)
+
+    def set(self, user_id: int, cart: ShopCardTotal) -> None:
+        self.views.set(user_id, cart)
+
+    def invalidate(self, user_id: int) -> None:
+        self.views.pop(user_id)
+
+    def invalidate_many(self, user_ids: Iterable[int]) -> None:
+        for user_id in user_ids:
+            self.views.pop(user_id)
+
+    def clear(self) -> None:
+        self.views.clear()
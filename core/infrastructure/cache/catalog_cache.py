@@ -0,0 +1,84 @@
+from datetime import datetime
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple, TypeVar
+
+from core.infrastructure.database.models import Product
+from core.internal.types.inline_search import InlineSearchPage
+from utils import LRUCache
+
+SearchPageKey = Tuple[int, str, str, int]  # version, locale, query, offset
+RenderKey = Tuple[int, Optional[datetime], int, Hashable]
+
+T = TypeVar("T")
+
+
+class CatalogCache:
+    """
+    Process-wide cache of catalog data shared by every update.
+
+    Services receive the same instance through ``ServiceMiddleware``; any
+    product write must call ``invalidate`` so readers never see stale pages.
+
+    Invalidating bumps version counters instead of clearing: search pages
+    are keyed by the catalog ``version`` and renders by the version of their
+    product, so stale entries become unreachable and age out of the LRUs.
+    Renders of products that were not written stay valid.
+    """
+
+    def __init__(
+        self,
+        search_pages_size: int = 512,
+        products_size: int = 256,
+        renders_size: int = 2048,
+    ):
+        self.version = 0
+        self._product_versions: Dict[int, int] = {}
+        self.search_pages: LRUCache[SearchPageKey, InlineSearchPage] = LRUCache(
+            maxsize=search_pages_size
+        )
+        self.products: LRUCache[int, Product] = LRUCache(maxsize=products_size)
+        self.renders: LRUCache[RenderKey, Any] = LRUCache(maxsize=renders_size)
+
+    def render(self, product: Any, variant: Hashable, build: Callable[[], T]) -> T:
+        """
+        Memoize something rendered from a product (caption, keyboard, ...).
+
+        Entries are keyed by ``(product.id, product.updated_at, variant)`` and
+        the product's version, so ``variant`` must hold every other input of
+        ``build``.
+        """
+        key = (
+            product.id,
+            getattr(product, "updated_at", None),
+            self._product_versions.get(product.id, 0),
+            variant,
+        )
+        value = self.renders.get(key)
+        if value is None:
+            value = build()
+            self.renders.set(key, value)
+        return value
+
+    def search_page_key(self, locale: str, query: str, offset: int) -> SearchPageKey:
+        return self.version, locale, query, offset
+
+    def invalidate(
+        self, product_id: Optional[int] = None, *, search: bool = True
+    ) -> None:
+        """
+        Retire everything derived from the product table.
+
+        ``product_id`` names the written product; None retires every product,
+        for writes that may touch more than one. Pass ``search=False`` when
+        the write changed nothing a search page shows (name, description,
+        price), so the pages of other products stay cached.
+        """
+        if search or product_id is None:
+            self.version += 1
+        if product_id is None:
+            self.products.clear()
+            self.renders.clear()
+            return
+        self.products.pop(product_id)
+        self._product_versions[product_id] = (
+            self._product_versions.get(product_id, 0) + 1
+        )
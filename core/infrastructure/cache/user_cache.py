@@ -0,0 +1,31 @@
+from typing import Iterable, Optional, Tuple
+
+from utils import LRUCache
+
+UserProfile = Tuple[Optional[str], Optional[str]]  # username, full_name
+
+
+class UserCache:
+    """
+    Process-wide cache of users known to be registered, with their profile.
+
+    ``UserRegistrationMiddleware`` skips the database for a user whose cached
+    profile matches the update; services that mark users as blocked must call
+    ``forget`` so the next update from them unblocks the row again.
+    """
+
+    def __init__(self, maxsize: int = 50_000):
+        self.profiles: LRUCache[int, UserProfile] = LRUCache(maxsize=maxsize)
+
+    def is_known(self, user_id: int, profile: UserProfile) -> bool:
+        return self.profiles.get(user_id) == profile
+
+    def remember(self, user_id: int, profile: UserProfile) -> None:
+        self.profiles.set(user_id, profile)
+
+    def forget(self, user_ids: Iterable[int]) -> None:
+        for user_id in user_ids:
+            self.profiles.pop(user_id)
+
+    def clear(self) -> None:
+        self.profiles.clear()
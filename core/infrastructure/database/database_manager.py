@@ -71,9 +71,9 @@ class DatabaseManager:
                 engine_kwargs.setdefault("connect_args", connect_args)
             else:
                 database_url = config.postgresql_url
-                # PostgreSQL-specific optimizations
+                # PostgreSQL-specific optimizations. Sessions stay transactional
+                # (no AUTOCOMMIT): services rely on rollback and row locks
                 engine_kwargs.setdefault("pool_pre_ping", True)
-                engine_kwargs.setdefault("isolation_level", "AUTOCOMMIT")
 
             return create_async_engine(
                 database_url,
@@ -95,7 +95,13 @@ class DatabaseManager:
 
     @asynccontextmanager
     async def get_db_session(self) -> AsyncGenerator[AsyncSession, None]:
-        """Provide a transactional database session context manager."""
+        """
+        Provide a transactional database session context manager.
+
+        Everything the session executes is one transaction, committed when the
+        block exits and rolled back if it raises; row locks are held until
+        then.
+        """
         async with self.session_pool() as session:
             try:
                 yield session
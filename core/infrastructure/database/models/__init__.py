@@ -1,8 +1,15 @@
 from .base import BaseModel
 from .models import (
+    Broadcast,
+    DailyOrderStatus,
+    DailyProductSales,
+    DailySales,
     Dialog,
     Message,
+    MessageArchive,
     Order,
+    OrderStatusEvent,
+    OutboxMessage,
     Product,
     ProductOrder,
     ShopCard,
@@ -18,6 +25,13 @@ __all__ = [
     "User",
     "Dialog",
     "Message",
+    "MessageArchive",
     "ShopCard",
     "ShopCardItem",
+    "Broadcast",
+    "OrderStatusEvent",
+    "OutboxMessage",
+    "DailySales",
+    "DailyProductSales",
+    "DailyOrderStatus",
 ]
@@ -2,4 +2,5 @@ from sqlalchemy.orm import DeclarativeBase
 
 
 class BaseModel(DeclarativeBase):
-    pass
\ No newline at end of file
+    # Fetch server-side defaults (timestamps) on flush instead of expiring them
+    __mapper_args__ = {"eager_defaults": True}
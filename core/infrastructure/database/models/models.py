@@ -1,8 +1,10 @@
-from datetime import datetime, timezone
+from datetime import date, datetime
 from typing import List, Optional
 
 from sqlalchemy import (
+    BigInteger,
     Boolean,
+    Date,
     DateTime,
     Float,
     ForeignKey,
@@ -10,16 +12,31 @@ from sqlalchemy import (
     LargeBinary,
     String,
     Text,
-    Enum
+    Enum,
+    Index,
+    func,
+    false,
+    text,
+    true,
 )
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from .base import BaseModel
-from core.internal.enums import OrderStatus
+from core.internal.enums import BroadcastStatus, OrderStatus, OutboxStatus
 
 
 class Product(BaseModel):
     __tablename__ = "Product"
+    __table_args__ = (
+        # Catalog pages: only products still on sale, in id order. The
+        # predicates match how each dialect renders ``WHERE is_active``
+        Index(
+            "ix_product_active_id",
+            "id",
+            postgresql_where=text("is_active"),
+            sqlite_where=text("is_active = 1"),
+        ),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     name: Mapped[str] = mapped_column(String, nullable=False)
@@ -27,13 +44,18 @@ class Product(BaseModel):
     price: Mapped[float] = mapped_column(Float, nullable=False)
     image: Mapped[Optional[bytes]] = mapped_column(LargeBinary)
     image_file_id: Mapped[Optional[str]] = mapped_column(String)
+    # Units available for new orders, NULL when stock is not tracked
+    stock: Mapped[Optional[int]] = mapped_column(Integer)
+    # Deleted products stay referenced by carts and orders, only hidden
+    is_active: Mapped[bool] = mapped_column(
+        Boolean, default=True, server_default=true(), nullable=False
+    )
+    deleted_at: Mapped[Optional[datetime]] = mapped_column(DateTime)
     created_at: Mapped[datetime] = mapped_column(
-        DateTime, default=datetime.now(timezone.utc)
+        DateTime, server_default=func.now(), nullable=False
     )
     updated_at: Mapped[datetime] = mapped_column(
-        DateTime,
-        default=datetime.now(timezone.utc),
-        onupdate=datetime.now(timezone.utc),
+        DateTime, server_default=func.now(), onupdate=func.now(), nullable=False
     )
 
     # Primary many-to-many relationship to orders
@@ -75,6 +97,19 @@ class ProductOrder(BaseModel):
 
 class Order(BaseModel):
     __tablename__ = "Order"
+    __table_args__ = (
+        # Admin order queue: keyset pages by (created_at, id) within a status
+        Index("ix_order_status_created_at_id", "status", "created_at", "id"),
+        # Order history of a user, newest first
+        Index("ix_order_user_id_created_at_id", "user_id", "created_at", "id"),
+        # Orders the analytics job has not folded yet
+        Index(
+            "ix_order_rollup_pending_id",
+            "id",
+            postgresql_where=text("NOT rolled_up"),
+            sqlite_where=text("rolled_up = 0"),
+        ),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     total_price: Mapped[float] = mapped_column(Float, nullable=False)
@@ -87,13 +122,23 @@ class Order(BaseModel):
         nullable=False
     )
     user_id: Mapped[int] = mapped_column(Integer, ForeignKey("users.telegram_id"))
+    # Idempotency key of the checkout that created the order
+    checkout_key: Mapped[Optional[str]] = mapped_column(
+        String, unique=True, index=True
+    )
+    # Stock was taken for the order lines and has not been returned yet
+    stock_reserved: Mapped[bool] = mapped_column(
+        Boolean, default=False, server_default=false(), nullable=False
+    )
+    # Counted in the sales rollups (set by ``AnalyticsService``)
+    rolled_up: Mapped[bool] = mapped_column(
+        Boolean, default=False, server_default=false(), nullable=False
+    )
     created_at: Mapped[datetime] = mapped_column(
-        DateTime, default=datetime.now(timezone.utc)
+        DateTime, server_default=func.now(), nullable=False
     )
     updated_at: Mapped[datetime] = mapped_column(
-        DateTime,
-        default=datetime.now(timezone.utc),
-        onupdate=datetime.now(timezone.utc),
+        DateTime, server_default=func.now(), onupdate=func.now(), nullable=False
     )
 
     # Many-to-one relationship to user
@@ -112,6 +157,16 @@ class Order(BaseModel):
 
 class Dialog(BaseModel):
     __tablename__ = "dialogs"
+    __table_args__ = (
+        # Unread dialogs of an admin, most recently updated first
+        Index(
+            "ix_dialogs_user2_id_is_read_updated_at_id",
+            "user2_id",
+            "is_read",
+            "updated_at",
+            "id",
+        ),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True)
     user1_id: Mapped[int] = mapped_column(
@@ -122,12 +177,10 @@ class Dialog(BaseModel):
     )
     is_read: Mapped[bool] = mapped_column(Boolean, default=True, nullable=False)
     created_at: Mapped[datetime] = mapped_column(
-        DateTime, default=datetime.now(timezone.utc)
+        DateTime, server_default=func.now(), nullable=False
     )
     updated_at: Mapped[datetime] = mapped_column(
-        DateTime,
-        default=datetime.now(timezone.utc),
-        onupdate=datetime.now(timezone.utc),
+        DateTime, server_default=func.now(), onupdate=func.now(), nullable=False
     )
 
     # Relationships
@@ -145,8 +198,22 @@ class Dialog(BaseModel):
 
 class Message(BaseModel):
     __tablename__ = "messages"
+    __table_args__ = (
+        # Dialog history in send order
+        Index("ix_messages_dialog_id_created_at_id", "dialog_id", "created_at", "id"),
+        # Telegram message ids are only unique within a chat
+        Index(
+            "ux_messages_chat_id_telegram_message_id",
+            "chat_id",
+            "telegram_message_id",
+            unique=True,
+        ),
+    )
 
-    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    # Group and channel ids (-100...) do not fit in 32 bits
+    chat_id: Mapped[int] = mapped_column(BigInteger, nullable=False)
+    telegram_message_id: Mapped[int] = mapped_column(Integer, nullable=False)
     dialog_id: Mapped[int] = mapped_column(
         Integer, ForeignKey("dialogs.id"), nullable=False
     )
@@ -155,7 +222,7 @@ class Message(BaseModel):
     )
     content: Mapped[str] = mapped_column(Text, nullable=False)
     created_at: Mapped[datetime] = mapped_column(
-        DateTime, default=datetime.now(timezone.utc)
+        DateTime, server_default=func.now(), nullable=False
     )
 
     # Relationships
@@ -166,20 +233,62 @@ class Message(BaseModel):
         return f"<Message(id={self.id}, dialog_id={self.dialog_id}, sender_id={self.sender_id}, content='{self.content[:20]}...')>"
 
 
+class MessageArchive(BaseModel):
+    """Compressed block of consecutive old messages of one dialog"""
+
+    __tablename__ = "message_archives"
+    __table_args__ = (
+        # Archived history of a dialog, newest block first
+        Index(
+            "ix_message_archives_dialog_id_last_created_at_id",
+            "dialog_id",
+            "last_created_at",
+            "id",
+        ),
+    )
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    dialog_id: Mapped[int] = mapped_column(
+        Integer, ForeignKey("dialogs.id"), nullable=False
+    )
+    messages_count: Mapped[int] = mapped_column(Integer, nullable=False)
+    first_created_at: Mapped[datetime] = mapped_column(DateTime, nullable=False)
+    last_created_at: Mapped[datetime] = mapped_column(DateTime, nullable=False)
+    # zlib-compressed JSON, see core.internal.types.dialog_history
+    payload: Mapped[bytes] = mapped_column(LargeBinary, nullable=False)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime, server_default=func.now(), nullable=False
+    )
+
+
 class ShopCard(BaseModel):
     __tablename__ = "shop_cards"
+    __table_args__ = (
+        # A user has one cart, reused after checkout
+        Index("ux_shop_cards_user_id", "user_id", unique=True),
+        # Idle carts for the cleanup job
+        Index("ix_shop_cards_updated_at", "updated_at"),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     user_id: Mapped[int] = mapped_column(
         ForeignKey("users.telegram_id"), nullable=False
     )
+    # Aggregates kept in step with shop_card_items by ShopCardService
+    items_count: Mapped[int] = mapped_column(
+        Integer, default=0, server_default="0", nullable=False
+    )
+    lines_count: Mapped[int] = mapped_column(
+        Integer, default=0, server_default="0", nullable=False
+    )
+    total_price: Mapped[float] = mapped_column(
+        Float, default=0.0, server_default="0", nullable=False
+    )
     created_at: Mapped[datetime] = mapped_column(
-        DateTime, default=datetime.now(timezone.utc)
+        DateTime, server_default=func.now(), nullable=False
     )
     updated_at: Mapped[datetime] = mapped_column(
-        DateTime,
-        default=datetime.now(timezone.utc),
-        onupdate=datetime.now(timezone.utc),
+        DateTime, server_default=func.now(), onupdate=func.now(), nullable=False
     )
 
     user: Mapped["User"] = relationship(back_populates="shop_cards")
@@ -193,13 +302,22 @@ class ShopCard(BaseModel):
 
 class ShopCardItem(BaseModel):
     __tablename__ = "shop_card_items"
+    __table_args__ = (
+        # One line per product: adding it again raises the quantity
+        Index(
+            "ux_shop_card_items_shop_card_id_product_id",
+            "shop_card_id",
+            "product_id",
+            unique=True,
+        ),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     shop_card_id: Mapped[int] = mapped_column(ForeignKey("shop_cards.id"))
     product_id: Mapped[int] = mapped_column(ForeignKey("Product.id"))
     quantity: Mapped[int] = mapped_column(Integer, default=1)
     added_at: Mapped[datetime] = mapped_column(
-        DateTime, default=datetime.now(timezone.utc)
+        DateTime, server_default=func.now(), nullable=False
     )
 
     shop_card: Mapped["ShopCard"] = relationship(back_populates="items")
@@ -215,13 +333,14 @@ class User(BaseModel):
     telegram_id: Mapped[int] = mapped_column(Integer, primary_key=True)
     username: Mapped[Optional[str]] = mapped_column(String)
     full_name: Mapped[Optional[str]] = mapped_column(String)
+    is_blocked: Mapped[bool] = mapped_column(
+        Boolean, default=False, server_default=false(), nullable=False
+    )
     created_at: Mapped[datetime] = mapped_column(
-        DateTime, default=datetime.now(timezone.utc)
+        DateTime, server_default=func.now(), nullable=False
     )
     updated_at: Mapped[datetime] = mapped_column(
-        DateTime,
-        default=datetime.now(timezone.utc),
-        onupdate=datetime.now(timezone.utc),
+        DateTime, server_default=func.now(), onupdate=func.now(), nullable=False
     )
 
     # One-to-many relationship to orders
@@ -239,3 +358,130 @@ class User(BaseModel):
 
     def __repr__(self):
         return f"<User(telegram_id={self.telegram_id}, full_name={self.full_name})>"
+
+
+class Broadcast(BaseModel):
+    __tablename__ = "broadcasts"
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    admin_id: Mapped[int] = mapped_column(Integer, nullable=False)
+    text: Mapped[str] = mapped_column(Text, nullable=False)
+    status: Mapped[BroadcastStatus] = mapped_column(
+        Enum(BroadcastStatus), default=BroadcastStatus.RUNNING, nullable=False
+    )
+    # Keyset checkpoint: every user with telegram_id <= last_user_id was processed
+    last_user_id: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    total: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    sent_count: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    failed_count: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    blocked_count: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    created_at: Mapped[datetime] = mapped_column(DateTime, server_default=func.now())
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime, server_default=func.now(), onupdate=func.now()
+    )
+
+    @property
+    def processed_count(self) -> int:
+        return self.sent_count + self.failed_count + self.blocked_count
+
+    def __repr__(self):
+        return f"<Broadcast(id={self.id}, status={self.status}, last_user_id={self.last_user_id})>"
+
+
+class OrderStatusEvent(BaseModel):
+    """Append-only history of order status changes"""
+
+    __tablename__ = "order_status_events"
+    __table_args__ = (
+        # Events the analytics job has not folded yet
+        Index(
+            "ix_order_status_events_rollup_pending_id",
+            "id",
+            postgresql_where=text("NOT rolled_up"),
+            sqlite_where=text("rolled_up = 0"),
+        ),
+    )
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    order_id: Mapped[int] = mapped_column(
+        Integer,
+        ForeignKey("Order.id", ondelete="CASCADE"),
+        nullable=False,
+        index=True,
+    )
+    old_status: Mapped[Optional[OrderStatus]] = mapped_column(Enum(OrderStatus))
+    new_status: Mapped[OrderStatus] = mapped_column(Enum(OrderStatus), nullable=False)
+    # Telegram id of the admin who made the change
+    changed_by: Mapped[Optional[int]] = mapped_column(Integer)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime, server_default=func.now(), nullable=False
+    )
+    # Counted in the status rollup (set by ``AnalyticsService``)
+    rolled_up: Mapped[bool] = mapped_column(
+        Boolean, default=False, server_default=false(), nullable=False
+    )
+
+
+class OutboxMessage(BaseModel):
+    """
+    Message to deliver to a user, written in the transaction that caused it.
+
+    Drained by ``OutboxService``; a row leaves PENDING once it is sent or
+    has used up its attempts.
+    """
+
+    __tablename__ = "outbox_messages"
+    __table_args__ = (
+        Index(
+            "ix_outbox_messages_status_next_attempt_at", "status", "next_attempt_at"
+        ),
+    )
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    chat_id: Mapped[int] = mapped_column(BigInteger, nullable=False)
+    text: Mapped[str] = mapped_column(Text, nullable=False)
+    status: Mapped[OutboxStatus] = mapped_column(
+        Enum(OutboxStatus), default=OutboxStatus.PENDING, nullable=False
+    )
+    attempts: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    next_attempt_at: Mapped[datetime] = mapped_column(
+        DateTime, server_default=func.now(), nullable=False
+    )
+    last_error: Mapped[Optional[str]] = mapped_column(Text)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime, server_default=func.now(), nullable=False
+    )
+    sent_at: Mapped[Optional[datetime]] = mapped_column(DateTime)
+
+
+class DailySales(BaseModel):
+    """Order totals per day (rollup maintained by ``AnalyticsService``)"""
+
+    __tablename__ = "daily_sales"
+
+    day: Mapped[date] = mapped_column(Date, primary_key=True)
+    orders_count: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    units: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    revenue: Mapped[float] = mapped_column(Float, default=0, nullable=False)
+
+
+class DailyProductSales(BaseModel):
+    """Units and revenue per product and day (rollup)"""
+
+    __tablename__ = "daily_product_sales"
+
+    day: Mapped[date] = mapped_column(Date, primary_key=True)
+    # No foreign key: sales history outlives deleted products
+    product_id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    units: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    revenue: Mapped[float] = mapped_column(Float, default=0, nullable=False)
+
+
+class DailyOrderStatus(BaseModel):
+    """Status transitions per day (rollup), a new order counts as entering PENDING"""
+
+    __tablename__ = "daily_order_status"
+
+    day: Mapped[date] = mapped_column(Date, primary_key=True)
+    status: Mapped[OrderStatus] = mapped_column(Enum(OrderStatus), primary_key=True)
+    orders_count: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
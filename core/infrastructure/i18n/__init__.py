@@ -0,0 +1,4 @@
+from .display_formatter import DisplayFormatter
+from .text_catalog import TextCatalog
+
+__all__ = ["DisplayFormatter", "TextCatalog"]
@@ -0,0 +1,44 @@
+from dataclasses import dataclass, field, fields
+from typing import TYPE_CHECKING, Any, ClassVar, Type, TypeVar
+
+if TYPE_CHECKING:
+    from .text_catalog import TextCatalog
+
+F = TypeVar("F", bound="DisplayFormatter")
+
+
+@dataclass(frozen=True)
+class DisplayFormatter:
+    """
+    Base for per-locale text formatters backed by a ``TextCatalog``.
+
+    Every ``str`` field is filled from the ``<prefix>_<field>`` message when the
+    formatter is built; methods render messages with variables through ``text``.
+    """
+
+    prefix: ClassVar[str]
+
+    catalog: "TextCatalog" = field(repr=False, compare=False)
+    locale: str
+
+    @classmethod
+    def from_catalog(cls: Type[F], catalog: "TextCatalog", locale: str) -> F:
+        texts = {
+            f.name: catalog.get(f"{cls.prefix}_{f.name}", locale)
+            for f in fields(cls)
+            if f.name not in ("catalog", "locale")
+        }
+        return cls(catalog, locale, **texts)
+
+    def text(self, name: str, /, **kwargs: Any) -> str:
+        """
+        Render the ``<prefix>_<name>`` message.
+
+        Arguments are passed as strings so ids and prices keep their plain
+        form instead of Fluent's locale number formatting.
+        """
+        return self.catalog.get(
+            f"{self.prefix}_{name}",
+            self.locale,
+            **{key: str(value) for key, value in kwargs.items()},
+        )
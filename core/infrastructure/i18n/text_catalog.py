@@ -0,0 +1,208 @@
+import hashlib
+import pickle
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple, Type, TypeVar, Union
+
+from aiogram_i18n.cores.fluent_runtime_core import FluentRuntimeCore
+from fluent.runtime import FluentBundle, FluentResource
+from fluent.syntax import ast as FTL
+
+from logger import LoggerBuilder
+
+from .display_formatter import DisplayFormatter
+
+logger = LoggerBuilder("TextCatalog").add_stream_handler().build()
+
+F = TypeVar("F", bound=DisplayFormatter)
+
+
+class MessageTemplate:
+    """
+    Message made of text and ``{ $variable }`` placeables only.
+
+    Rendered by joining its parts, without going through the Fluent resolver.
+    """
+
+    __slots__ = ("message", "parts")
+
+    def __init__(self, message: Any, parts: Tuple[Tuple[bool, str], ...]):
+        self.message = message
+        self.parts = parts
+
+    @classmethod
+    def compile(
+        cls, message: Any, source: FTL.Message
+    ) -> Optional["MessageTemplate"]:
+        parts = []
+        for element in source.value.elements:
+            if isinstance(element, FTL.TextElement):
+                parts.append((False, element.value))
+            elif isinstance(element, FTL.Placeable) and isinstance(
+                element.expression, FTL.VariableReference
+            ):
+                parts.append((True, element.expression.id.name))
+            else:
+                return None
+        return cls(message, tuple(parts))
+
+    def render(self, kwargs: Dict[str, Any]) -> Optional[str]:
+        """Rendered text, None if an argument is missing or is not a string."""
+        chunks = []
+        for is_variable, value in self.parts:
+            if is_variable:
+                value = kwargs.get(value)
+                if not isinstance(value, str):
+                    return None
+            chunks.append(value)
+        return "".join(chunks)
+
+
+# Pre-rendered string, template or compiled message (fluent.runtime resolver)
+CatalogEntry = Union[str, MessageTemplate, Any]
+
+
+class TextCatalog(FluentRuntimeCore):
+    """
+    Fluent core that prepares every message once, at startup.
+
+    ``find_locales`` parses the ``.ftl`` files (or loads the parsed resources
+    from ``cache_path`` when the sources did not change), compiles every
+    message and renders the ones that take no arguments. ``get`` then resolves
+    a message with a single dict lookup. Messages built only from text and
+    variables are joined directly when every argument is a string; anything
+    else (selectors, functions, numbers) goes through Fluent.
+
+    Formatters are built per locale on first use and shared afterwards.
+    """
+
+    cache_version: int = 1
+
+    def __init__(
+        self,
+        path: Union[str, Path],
+        default_locale: Optional[str] = None,
+        cache_path: Optional[Union[str, Path]] = None,
+        **kwargs: Any,
+    ):
+        super().__init__(path=path, default_locale=default_locale, **kwargs)
+        self.cache_path = Path(cache_path) if cache_path else None
+        self._entries: Dict[str, Dict[str, CatalogEntry]] = {}
+        self._formatters: Dict[
+            Tuple[Type[DisplayFormatter], str], DisplayFormatter
+        ] = {}
+
+    def _read_sources(self) -> Dict[str, List[Tuple[Path, str]]]:
+        locales = self._extract_locales(self.path)
+        return {
+            locale: [
+                (path, path.read_text(encoding="utf8")) for path in sorted(paths)
+            ]
+            for locale, paths in self._find_locales(
+                self.path, locales, ".ftl"
+            ).items()
+        }
+
+    def _parse(
+        self, sources: Dict[str, List[Tuple[Path, str]]]
+    ) -> Dict[str, List[FTL.Resource]]:
+        digest = hashlib.sha256(str(self.cache_version).encode())
+        for locale, files in sorted(sources.items()):
+            for path, text in files:
+                digest.update(f"{locale}\0{path.as_posix()}\0{text}\0".encode())
+        digest = digest.hexdigest()
+
+        if self.cache_path and self.cache_path.exists():
+            try:
+                with self.cache_path.open("rb") as fp:
+                    cached = pickle.load(fp)
+                if cached["digest"] == digest:
+                    return cached["resources"]
+            except Exception as e:
+                logger.warning(
+                    f"Ignoring unreadable catalog cache {self.cache_path}: {e}"
+                )
+
+        resources = {
+            locale: [FluentResource(text) for _, text in files]
+            for locale, files in sources.items()
+        }
+        if self.cache_path:
+            try:
+                self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+                with self.cache_path.open("wb") as fp:
+                    pickle.dump({"digest": digest, "resources": resources}, fp)
+            except OSError as e:
+                logger.warning(f"Could not write catalog cache {self.cache_path}: {e}")
+        return resources
+
+    def find_locales(self) -> Dict[str, FluentBundle]:
+        translations: Dict[str, FluentBundle] = {}
+        self._entries.clear()
+        self._formatters.clear()
+
+        for locale, resources in self._parse(self._read_sources()).items():
+            bundle = FluentBundle(
+                locales=[locale],
+                use_isolating=self.use_isolating,
+                functions=self.functions,
+            )
+            for resource in resources:
+                bundle.add_resource(resource)
+
+            entries: Dict[str, CatalogEntry] = {}
+            for message_id, source in bundle._messages.items():  # noqa: SLF001
+                message = bundle.get_message(message_id)
+                if message.value is None:
+                    continue
+                text, errors = bundle.format_pattern(message.value)
+                if not errors:
+                    entries[message_id] = text
+                elif self.use_isolating:
+                    entries[message_id] = message
+                else:
+                    entries[message_id] = (
+                        MessageTemplate.compile(message, source) or message
+                    )
+
+            translations[locale] = bundle
+            self._entries[locale] = entries
+
+        logger.info(
+            "Loaded locales: "
+            + ", ".join(
+                f"{locale} ({len(self._entries[locale])})" for locale in translations
+            )
+        )
+        return translations
+
+    def get(
+        self, message_id: str, locale: Optional[str] = None, /, **kwargs: Any
+    ) -> str:
+        locale = self.get_locale(locale=locale)
+        entry = self._entries.get(locale, {}).get(message_id)
+        if entry is None:
+            return super().get(message_id, locale, **kwargs)
+        if isinstance(entry, str):
+            return entry
+        if isinstance(entry, MessageTemplate):
+            text = entry.render(kwargs)
+            if text is not None:
+                return text
+            entry = entry.message
+
+        text, errors = self.locales[locale].format_pattern(entry.value, kwargs)
+        if errors:
+            return super().get(message_id, locale, **kwargs)
+        return text
+
+    def formatter(self, formatter_type: Type[F], locale: Optional[str] = None) -> F:
+        """Shared ``formatter_type`` instance for ``locale`` (default locale if None)."""
+        if locale not in self.locales:
+            locale = self.default_locale
+
+        key = (formatter_type, locale)
+        formatter = self._formatters.get(key)
+        if formatter is None:
+            formatter = formatter_type.from_catalog(self, locale)
+            self._formatters[key] = formatter
+        return formatter
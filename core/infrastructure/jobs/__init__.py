@@ -0,0 +1,4 @@
+from .job_runner import JobRunner
+from .periodic_job import PeriodicJob
+
+__all__ = ["JobRunner", "PeriodicJob"]
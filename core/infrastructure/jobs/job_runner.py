@@ -0,0 +1,53 @@
+import asyncio
+from typing import Coroutine, Dict, Optional
+
+from logger import LoggerBuilder
+
+logger = LoggerBuilder("JobRunner").add_stream_handler().build()
+
+
+class JobRunner:
+    """Owns background tasks so they outlive the handler that started them."""
+
+    def __init__(self):
+        self._tasks: Dict[str, asyncio.Task] = {}
+
+    def is_running(self, name: str) -> bool:
+        task = self._tasks.get(name)
+        return task is not None and not task.done()
+
+    def spawn(self, name: str, coro: Coroutine) -> Optional[asyncio.Task]:
+        """
+        Start ``coro`` as a named background task.
+
+        Returns None (and closes the coroutine) if a task with the same name is
+        already running.
+        """
+        if self.is_running(name):
+            coro.close()
+            logger.warning(f"Job {name} is already running")
+            return None
+
+        task = asyncio.create_task(coro, name=name)
+        self._tasks[name] = task
+        task.add_done_callback(lambda t: self._on_done(name, t))
+        logger.info(f"Job {name} started")
+        return task
+
+    def _on_done(self, name: str, task: asyncio.Task) -> None:
+        if self._tasks.get(name) is task:
+            del self._tasks[name]
+
+        if task.cancelled():
+            logger.info(f"Job {name} cancelled")
+        elif task.exception():
+            logger.error(f"Job {name} failed: {task.exception()}")
+        else:
+            logger.info(f"Job {name} finished")
+
+    async def stop(self) -> None:
+        """Cancel every running job and wait for them to unwind."""
+        tasks = list(self._tasks.values())
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
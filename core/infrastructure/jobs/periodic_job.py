@@ -0,0 +1,72 @@
+import asyncio
+from abc import ABC, abstractmethod
+from contextlib import asynccontextmanager, suppress
+from typing import Any, AsyncIterator, ClassVar
+
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from core.infrastructure.database import DatabaseManager
+from logger import LoggerBuilder
+
+from .job_runner import JobRunner
+
+logger = LoggerBuilder("PeriodicJob").add_stream_handler().build()
+
+
+class PeriodicJob(ABC):
+    """
+    Base of services that work in the background under ``job_name``.
+
+    ``run`` calls ``run_batch`` again right away while it reports more work
+    waiting, otherwise after ``interval`` seconds or as soon as ``wake`` is
+    called. A failed batch is logged and retried after the interval.
+    Subclasses implement ``run_batch``; arguments given to ``start`` are
+    passed on to it.
+    """
+
+    job_name: ClassVar[str]
+
+    def __init__(self, db_manager: DatabaseManager, interval: float):
+        self._db_manager = db_manager
+        self._interval = interval
+        self._wakeup = asyncio.Event()
+
+    @property
+    def db_manager(self) -> DatabaseManager:
+        return self._db_manager
+
+    @asynccontextmanager
+    async def _get_session(self) -> AsyncIterator[AsyncSession]:
+        async with self.db_manager.get_db_session() as session:
+            try:
+                yield session
+            except SQLAlchemyError as e:
+                logger.error(f"Job {self.job_name} database operation failed: {e}")
+                raise
+
+    def wake(self) -> None:
+        """Run the next batch now instead of after the interval (call after a commit)."""
+        self._wakeup.set()
+
+    def start(self, job_runner: JobRunner, *args: Any) -> bool:
+        return job_runner.spawn(self.job_name, self.run(*args)) is not None
+
+    async def run(self, *args: Any) -> None:
+        while True:
+            self._wakeup.clear()
+            try:
+                more = await self.run_batch(*args)
+            except Exception as e:
+                logger.error(f"Job {self.job_name} batch failed: {e}")
+                more = False
+
+            if more:
+                continue
+            with suppress(asyncio.TimeoutError):
+                await asyncio.wait_for(self._wakeup.wait(), self._interval)
+
+    @abstractmethod
+    async def run_batch(self, *args: Any) -> bool:
+        """Do one unit of work. Returns True if more is waiting right away."""
+        raise NotImplementedError
@@ -1,10 +1,14 @@
 from .abstract_repository import SQLAlchemyRepository
+from .analytics_repository import AnalyticsRepository
+from .broadcast_repository import BroadcastRepository
 from .dialog_repository import DialogRepository
-from .message_repository import MessageRepository
+from .message_repository import MessageArchiveRepository, MessageRepository
 from .product_repository import ProductRepository
 from .shop_card_repository import ShopCardItemRepository, ShopCardRepository
 from .user_repository import UserRepository
 from .order_repository import OrderRepository
+from .order_status_event_repository import OrderStatusEventRepository
+from .outbox_repository import OutboxRepository
 
 __all__ = [
     "SQLAlchemyRepository",
@@ -12,7 +16,12 @@ __all__ = [
     "ProductRepository",
     "DialogRepository",
     "MessageRepository",
+    "MessageArchiveRepository",
     "ShopCardRepository",
     "ShopCardItemRepository",
-    "OrderRepository"
+    "OrderRepository",
+    "BroadcastRepository",
+    "OrderStatusEventRepository",
+    "OutboxRepository",
+    "AnalyticsRepository",
 ]
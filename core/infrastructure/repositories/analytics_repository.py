@@ -0,0 +1,223 @@
+from datetime import date
+from typing import Any, Dict, List, Optional, Sequence, Type
+
+from sqlalchemy import Row, desc, func, select, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from core.internal.enums import OrderStatus
+from core.internal.models import DailySalesCreate
+
+from ..database.models import (
+    BaseModel,
+    DailyOrderStatus,
+    DailyProductSales,
+    DailySales,
+    Order,
+    OrderStatusEvent,
+    Product,
+    ProductOrder,
+)
+from .abstract_repository import SQLAlchemyRepository
+
+
+class AnalyticsRepository(
+    SQLAlchemyRepository[DailySales, DailySalesCreate, DailySalesCreate]
+):
+    """
+    Daily sales rollups and the source rows they are built from.
+
+    Rollup rows are only incremented (``col = col + excluded.col``), so
+    folding the same source row twice counts it twice: source rows are
+    claimed (``take_*`` sets their ``rolled_up`` flag) in the same
+    transaction as the increments.
+    """
+
+    def __init__(self, session: AsyncSession):
+        super().__init__(model=DailySales, session=session)
+
+    def _insert(self, model: Type[BaseModel]):
+        if self.session.bind.dialect.name == "postgresql":
+            return pg_insert(model)
+        return sqlite_insert(model)
+
+    async def _increment(
+        self,
+        model: Type[BaseModel],
+        rows: List[Dict[str, Any]],
+        keys: Sequence[str],
+        values: Sequence[str],
+    ) -> None:
+        if not rows:
+            return
+        query = self._insert(model)
+        query = query.on_conflict_do_update(
+            index_elements=keys,
+            set_={
+                column: getattr(model, column) + getattr(query.excluded, column)
+                for column in values
+            },
+        )
+        await self.session.execute(query, rows)
+
+    # Sources
+
+    async def take_orders(self, limit: int) -> List[Row]:
+        """
+        Mark up to ``limit`` orders not folded yet as ``rolled_up``.
+
+        Returns ``(id, created_at, total_price, total_count)`` of the orders
+        this call marked. Rows are claimed by their flag, not by an id
+        watermark, so an order committed after a higher id is still folded.
+        """
+        pending = (
+            select(Order.id).where(~Order.rolled_up).order_by(Order.id).limit(limit)
+        )
+        query = (
+            update(Order)
+            .where(Order.id.in_(pending.scalar_subquery()), ~Order.rolled_up)
+            # Bookkeeping, not a change of the order
+            .values(rolled_up=True, updated_at=Order.updated_at)
+            .returning(
+                Order.id, Order.created_at, Order.total_price, Order.total_count
+            )
+            .execution_options(synchronize_session=False)
+        )
+        result = await self.session.execute(query)
+        return result.all()
+
+    async def get_orders(self, order_ids: Sequence[int]) -> List[Row]:
+        """``(id, created_at, total_price, total_count)`` of the orders."""
+        if not order_ids:
+            return []
+        query = select(
+            Order.id, Order.created_at, Order.total_price, Order.total_count
+        ).where(Order.id.in_(order_ids))
+        result = await self.session.execute(query)
+        return result.all()
+
+    async def get_order_lines(self, order_ids: Sequence[int]) -> List[Row]:
+        """``(order_id, product_id, quantity, price)``, price is the current one."""
+        if not order_ids:
+            return []
+        query = (
+            select(
+                ProductOrder.order_id,
+                ProductOrder.product_id,
+                ProductOrder.product_quantity.label("quantity"),
+                Product.price,
+            )
+            .join(Product, Product.id == ProductOrder.product_id)
+            .where(ProductOrder.order_id.in_(order_ids))
+        )
+        result = await self.session.execute(query)
+        return result.all()
+
+    async def take_status_events(self, limit: int) -> List[Row]:
+        """
+        Mark up to ``limit`` status events not folded yet as ``rolled_up``.
+
+        Returns ``(id, order_id, created_at, old_status, new_status)`` of the
+        events this call marked.
+        """
+        pending = (
+            select(OrderStatusEvent.id)
+            .where(~OrderStatusEvent.rolled_up)
+            .order_by(OrderStatusEvent.id)
+            .limit(limit)
+        )
+        query = (
+            update(OrderStatusEvent)
+            .where(
+                OrderStatusEvent.id.in_(pending.scalar_subquery()),
+                ~OrderStatusEvent.rolled_up,
+            )
+            .values(rolled_up=True)
+            .returning(
+                OrderStatusEvent.id,
+                OrderStatusEvent.order_id,
+                OrderStatusEvent.created_at,
+                OrderStatusEvent.old_status,
+                OrderStatusEvent.new_status,
+            )
+            .execution_options(synchronize_session=False)
+        )
+        result = await self.session.execute(query)
+        return result.all()
+
+    # Increments
+
+    async def add_daily_sales(self, rows: List[Dict[str, Any]]) -> None:
+        await self._increment(
+            DailySales, rows, ["day"], ["orders_count", "units", "revenue"]
+        )
+
+    async def add_product_sales(self, rows: List[Dict[str, Any]]) -> None:
+        await self._increment(
+            DailyProductSales, rows, ["day", "product_id"], ["units", "revenue"]
+        )
+
+    async def add_status_counts(self, rows: List[Dict[str, Any]]) -> None:
+        await self._increment(
+            DailyOrderStatus, rows, ["day", "status"], ["orders_count"]
+        )
+
+    # Reports
+
+    async def get_totals(self, start: date, end: date) -> Row:
+        """``(orders_count, units, revenue)`` summed over the days."""
+        query = select(
+            func.coalesce(func.sum(DailySales.orders_count), 0).label("orders_count"),
+            func.coalesce(func.sum(DailySales.units), 0).label("units"),
+            func.coalesce(func.sum(DailySales.revenue), 0).label("revenue"),
+        ).where(DailySales.day.between(start, end))
+        result = await self.session.execute(query)
+        return result.one()
+
+    async def get_best_day(self, start: date, end: date) -> Optional[Row]:
+        query = (
+            select(DailySales.day, DailySales.revenue)
+            .where(DailySales.day.between(start, end), DailySales.revenue > 0)
+            .order_by(desc(DailySales.revenue), desc(DailySales.day))
+            .limit(1)
+        )
+        result = await self.session.execute(query)
+        return result.first()
+
+    async def get_top_products(
+        self, start: date, end: date, limit: int
+    ) -> List[Row]:
+        """``(product_id, name, units, revenue)`` by revenue, name None if deleted."""
+        sales = (
+            select(
+                DailyProductSales.product_id,
+                func.sum(DailyProductSales.units).label("units"),
+                func.sum(DailyProductSales.revenue).label("revenue"),
+            )
+            .where(DailyProductSales.day.between(start, end))
+            .group_by(DailyProductSales.product_id)
+            # Products whose every sale was cancelled
+            .having(func.sum(DailyProductSales.units) > 0)
+            .order_by(desc("revenue"), DailyProductSales.product_id)
+            .limit(limit)
+            .subquery()
+        )
+        query = (
+            select(sales.c.product_id, Product.name, sales.c.units, sales.c.revenue)
+            .outerjoin(Product, Product.id == sales.c.product_id)
+            .order_by(desc(sales.c.revenue), sales.c.product_id)
+        )
+        result = await self.session.execute(query)
+        return result.all()
+
+    async def get_status_counts(
+        self, start: date, end: date
+    ) -> Dict[OrderStatus, int]:
+        query = (
+            select(DailyOrderStatus.status, func.sum(DailyOrderStatus.orders_count))
+            .where(DailyOrderStatus.day.between(start, end))
+            .group_by(DailyOrderStatus.status)
+        )
+        result = await self.session.execute(query)
+        return {status: count for status, count in result.all()}
@@ -0,0 +1,66 @@
+from typing import List, Optional
+
+from sqlalchemy import select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from core.internal.enums import BroadcastStatus
+from core.internal.models import BroadcastCreate, BroadcastUpdate
+
+from ..database.models import Broadcast
+from .abstract_repository import SQLAlchemyRepository
+
+
+class BroadcastRepository(
+    SQLAlchemyRepository[Broadcast, BroadcastCreate, BroadcastUpdate]
+):
+    def __init__(self, session: AsyncSession):
+        super().__init__(model=Broadcast, session=session)
+
+    async def get_running(self) -> List[Broadcast]:
+        query = (
+            select(Broadcast)
+            .where(Broadcast.status == BroadcastStatus.RUNNING)
+            .order_by(Broadcast.id)
+        )
+        result = await self.session.execute(query)
+        return result.scalars().all()
+
+    async def save_progress(
+        self,
+        broadcast_id: int,
+        *,
+        last_user_id: int,
+        sent: int = 0,
+        failed: int = 0,
+        blocked: int = 0,
+    ) -> None:
+        """Advance the keyset checkpoint and add the batch counters."""
+        query = (
+            update(Broadcast)
+            .where(Broadcast.id == broadcast_id)
+            .values(
+                last_user_id=last_user_id,
+                sent_count=Broadcast.sent_count + sent,
+                failed_count=Broadcast.failed_count + failed,
+                blocked_count=Broadcast.blocked_count + blocked,
+            )
+        )
+        await self.session.execute(query)
+
+    async def set_status(
+        self,
+        broadcast_id: int,
+        status: BroadcastStatus,
+        *,
+        expected: Optional[BroadcastStatus] = None,
+    ) -> bool:
+        """
+        Set the status, only if it is ``expected`` when given.
+
+        Returns False when the broadcast is missing or in another status.
+        """
+        query = update(Broadcast).where(Broadcast.id == broadcast_id)
+        if expected is not None:
+            query = query.where(Broadcast.status == expected)
+        result = await self.session.execute(query.values(status=status))
+        return result.rowcount > 0
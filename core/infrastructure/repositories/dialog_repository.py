@@ -1,6 +1,6 @@
 from typing import Any, List, Optional
 
-from sqlalchemy import func, select
+from sqlalchemy import func, select, update
 from sqlalchemy.orm import joinedload
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -16,11 +16,10 @@ class DialogRepository(SQLAlchemyRepository[Dialog, DialogCreate, DialogUpdate])
         super().__init__(model=Dialog, session=session)
 
     async def get(self, id: Any) -> Optional[Dialog]:
-        query = select(self.model).where(self.model.id == id).options(joinedload(self.model.messages), joinedload(self.model.user1))
+        # Messages are not loaded here: history is read page by page
+        query = select(self.model).where(self.model.id == id).options(joinedload(self.model.user1))
         result = await self.session.execute(query)
-        return result.scalars().unique().one()
-
-        
+        return result.scalar_one_or_none()
 
     async def find_dialog_between_users(
         self, user1_id: int, user2_id: int
@@ -33,6 +32,21 @@ class DialogRepository(SQLAlchemyRepository[Dialog, DialogCreate, DialogUpdate])
         result = await self.session.execute(query)
         return result.scalars().first()
 
+    async def exists(self, dialog_id: int) -> bool:
+        result = await self.session.execute(
+            select(Dialog.id).where(Dialog.id == dialog_id)
+        )
+        return result.scalar_one_or_none() is not None
+
+    async def mark_unread(self, dialog_id: int) -> None:
+        """Flag a dialog as unread, without writing a dialog that already is."""
+        query = (
+            update(Dialog)
+            .where((Dialog.id == dialog_id) & (Dialog.is_read.is_(True)))
+            .values(is_read=False)
+        )
+        await self.session.execute(query)
+
     async def count_unread_dialogs(self, admin_id: int) -> int:
         query = select(func.count(Dialog.id)).where(
             (Dialog.user2_id == admin_id) & (Dialog.is_read == 0)
@@ -46,7 +60,7 @@ class DialogRepository(SQLAlchemyRepository[Dialog, DialogCreate, DialogUpdate])
             .where(
                 (Dialog.user2_id == admin_id) & (Dialog.is_read == 0)
             )
-            .order_by(Dialog.updated_at.desc())
+            .order_by(Dialog.updated_at.desc(), Dialog.id.desc())
             .limit(limit)
             .offset(offset)
         )
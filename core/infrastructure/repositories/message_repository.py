@@ -1,11 +1,136 @@
+from datetime import datetime
+from typing import List, Optional, Sequence, Tuple
+
+from sqlalchemy import Row, delete, insert, literal, select, tuple_
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from core.internal.models import MessageCreate, MessageUpdate
+from core.internal.models import MessageArchiveCreate, MessageCreate, MessageUpdate
 
-from ..database.models import Message
+from ..database.models import Dialog, Message, MessageArchive
 from .abstract_repository import SQLAlchemyRepository
 
 
 class MessageRepository(SQLAlchemyRepository[Message, MessageCreate, MessageUpdate]):
     def __init__(self, session: AsyncSession):
         super().__init__(model=Message, session=session)
+
+    async def add(self, obj_in: MessageCreate) -> Optional[int]:
+        """
+        Store a message if its dialog exists, in one INSERT ... SELECT.
+
+        Returns the new id, or None when the dialog does not exist or the
+        Telegram message was already stored (redelivered update).
+        """
+        if self.session.bind.dialect.name == "postgresql":
+            query = pg_insert(Message)
+        else:
+            query = sqlite_insert(Message)
+        query = (
+            query.from_select(
+                [
+                    Message.chat_id,
+                    Message.telegram_message_id,
+                    Message.dialog_id,
+                    Message.sender_id,
+                    Message.content,
+                ],
+                select(
+                    literal(obj_in.chat_id),
+                    literal(obj_in.telegram_message_id),
+                    Dialog.id,
+                    literal(obj_in.sender_id),
+                    literal(obj_in.content),
+                ).where(Dialog.id == obj_in.dialog_id),
+            )
+            .on_conflict_do_nothing(
+                index_elements=[Message.chat_id, Message.telegram_message_id]
+            )
+            .returning(Message.id)
+        )
+        result = await self.session.execute(query)
+        return result.scalar_one_or_none()
+
+    async def get_recent(self, dialog_id: int, limit: int) -> List[Row]:
+        """``(id, sender_id, content, created_at)`` of the newest messages, newest first."""
+        query = (
+            select(Message.id, Message.sender_id, Message.content, Message.created_at)
+            .where(Message.dialog_id == dialog_id)
+            .order_by(Message.created_at.desc(), Message.id.desc())
+            .limit(limit)
+        )
+        result = await self.session.execute(query)
+        return result.all()
+
+    async def get_archivable(
+        self, before: datetime, limit: int, *, from_dialog_id: int = 0
+    ) -> List[Row]:
+        """
+        ``(id, dialog_id, sender_id, content, created_at)`` older than ``before``.
+
+        Rows are ordered by dialog, then oldest first, starting at dialog
+        ``from_dialog_id``, so a batch holds long runs of few dialogs.
+        """
+        query = (
+            select(
+                Message.id,
+                Message.dialog_id,
+                Message.sender_id,
+                Message.content,
+                Message.created_at,
+            )
+            .where(
+                (Message.dialog_id >= from_dialog_id) & (Message.created_at < before)
+            )
+            .order_by(Message.dialog_id, Message.created_at, Message.id)
+            .limit(limit)
+        )
+        result = await self.session.execute(query)
+        return result.all()
+
+    async def delete_many(self, message_ids: Sequence[int]) -> None:
+        if not message_ids:
+            return
+        await self.session.execute(delete(Message).where(Message.id.in_(message_ids)))
+
+
+class MessageArchiveRepository(
+    SQLAlchemyRepository[MessageArchive, MessageArchiveCreate, MessageArchiveCreate]
+):
+    def __init__(self, session: AsyncSession):
+        super().__init__(model=MessageArchive, session=session)
+
+    async def add_many(self, archives: Sequence[MessageArchiveCreate]) -> None:
+        if not archives:
+            return
+        await self.session.execute(
+            insert(MessageArchive), [archive.model_dump() for archive in archives]
+        )
+
+    async def get_recent(
+        self,
+        dialog_id: int,
+        limit: int,
+        *,
+        before: Optional[Tuple[datetime, int]] = None,
+    ) -> List[Row]:
+        """
+        ``(id, last_created_at, payload)`` of archive blocks, newest first.
+
+        Pass ``before`` (``last_created_at`` and ``id`` of the last block
+        read) for the next page.
+        """
+        query = select(
+            MessageArchive.id, MessageArchive.last_created_at, MessageArchive.payload
+        ).where(MessageArchive.dialog_id == dialog_id)
+        if before is not None:
+            query = query.where(
+                tuple_(MessageArchive.last_created_at, MessageArchive.id)
+                < tuple_(*before)
+            )
+        query = query.order_by(
+            MessageArchive.last_created_at.desc(), MessageArchive.id.desc()
+        ).limit(limit)
+        result = await self.session.execute(query)
+        return result.all()
@@ -1,13 +1,15 @@
-from typing import Any, Dict, List, Optional
+from datetime import datetime
+from typing import Any, AsyncIterator, Dict, List, Optional, Sequence
 
-from sqlalchemy import select, text, update
+from sqlalchemy import Row, func, insert, literal, select, text, tuple_, update
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
 from core.internal.enums import OrderStatus
 from core.internal.models import OrderCreate, OrderUpdate
+from core.internal.types.order_queue import OrderCursor
 
-from ..database.models import Order
+from ..database.models import Order, Product, ProductOrder, ShopCard, ShopCardItem
 from .abstract_repository import SQLAlchemyRepository
 
 
@@ -40,6 +42,90 @@ class OrderRepository(SQLAlchemyRepository[Order, OrderCreate, OrderUpdate]):
         result = await self.session.execute(query)
         return result.scalars().all()
 
+    async def get_queue(
+        self,
+        status: OrderStatus,
+        *,
+        after: Optional[OrderCursor] = None,
+        before: Optional[OrderCursor] = None,
+        limit: int = 10,
+    ) -> List[Row]:
+        """
+        Keyset page of orders with ``status``, oldest first.
+
+        Rows hold only ``id`` and ``created_at``. Pass ``after`` (last row of
+        the current page) for the next page or ``before`` (its first row) for
+        the previous one; both are served by the (status, created_at, id) index.
+        """
+        key = tuple_(Order.created_at, Order.id)
+        query = select(Order.id, Order.created_at).where(Order.status == status)
+
+        if before is not None:
+            query = query.where(key < self._queue_key(before)).order_by(
+                Order.created_at.desc(), Order.id.desc()
+            )
+        else:
+            if after is not None:
+                query = query.where(key > self._queue_key(after))
+            query = query.order_by(Order.created_at, Order.id)
+
+        result = await self.session.execute(query.limit(limit))
+        rows = result.all()
+        return rows[::-1] if before is not None else rows
+
+    def _queue_key(self, cursor: OrderCursor):
+        """``(created_at, id)`` of ``cursor`` as the database stores them."""
+        created_at = cursor.created_at
+        if self.session.bind.dialect.name == "sqlite":
+            # SQLite keeps timestamps as text and compares them as strings:
+            # CURRENT_TIMESTAMP has no fraction, a bound datetime always has
+            # six digits, so bind the text the server default would store
+            timespec = "microseconds" if created_at.microsecond else "seconds"
+            created_at = literal(created_at.isoformat(" ", timespec))
+        return tuple_(created_at, cursor.id)
+
+    async def count_by_status(self) -> Dict[OrderStatus, int]:
+        result = await self.session.execute(
+            select(Order.status, func.count()).group_by(Order.status)
+        )
+        return dict(result.all())
+
+    async def stream_lines(
+        self, *, since: Optional[datetime] = None, chunk_size: int = 1000
+    ) -> AsyncIterator[Sequence[Row]]:
+        """
+        Order lines joined with their order and product, in chunks of rows.
+
+        Rows are read through a server-side cursor (``yield_per``) and hold
+        plain column values, so memory depends on ``chunk_size`` only. An
+        order without lines yields one row with empty product columns.
+        """
+        query = (
+            select(
+                Order.id.label("order_id"),
+                Order.created_at,
+                Order.status,
+                Order.user_id,
+                Order.total_price,
+                Order.total_count,
+                Order.delivery_address,
+                ProductOrder.product_id,
+                Product.name.label("product_name"),
+                Product.price,
+                ProductOrder.product_quantity.label("quantity"),
+            )
+            .outerjoin(ProductOrder, ProductOrder.order_id == Order.id)
+            .outerjoin(Product, Product.id == ProductOrder.product_id)
+            .order_by(Order.id, ProductOrder.product_id)
+            .execution_options(yield_per=chunk_size)
+        )
+        if since is not None:
+            query = query.where(Order.created_at >= since)
+
+        result = await self.session.stream(query)
+        async for chunk in result.partitions():
+            yield chunk
+
     async def get_with_products(self, order_id: int) -> Optional[Order]:
         query = (
             select(Order)
@@ -58,13 +144,89 @@ class OrderRepository(SQLAlchemyRepository[Order, OrderCreate, OrderUpdate]):
             select(Order)
             .where(Order.user_id == user_id)
             .options(selectinload(Order.products))
-            .order_by(Order.created_at.desc())
+            .order_by(Order.created_at.desc(), Order.id.desc())
         )
 
         result = await self.session.execute(query)
         return result.scalars().all()
 
+    async def get_by_checkout_key(self, checkout_key: str) -> Optional[Order]:
+        result = await self.session.execute(
+            select(Order).where(Order.checkout_key == checkout_key)
+        )
+        return result.scalar_one_or_none()
+
+    async def create_from_card(
+        self,
+        card: ShopCard,
+        *,
+        checkout_key: Optional[str] = None,
+        delivery_address: Optional[str] = None,
+        order_note: Optional[str] = None,
+        stock_reserved: bool = False,
+    ) -> Order:
+        """
+        Pending order holding the card's lines, not committed.
+
+        Totals come from the card aggregates and the lines are copied with
+        one ``INSERT ... SELECT`` from the card items.
+        """
+        order = Order(
+            user_id=card.user_id,
+            total_price=card.total_price,
+            total_count=card.items_count,
+            delivery_address=delivery_address,
+            order_note=order_note,
+            status=OrderStatus.PENDING,
+            checkout_key=checkout_key,
+            stock_reserved=stock_reserved,
+        )
+        self.session.add(order)
+        await self.session.flush()
+
+        lines = select(
+            ShopCardItem.product_id, literal(order.id), ShopCardItem.quantity
+        ).where(ShopCardItem.shop_card_id == card.id)
+        await self.session.execute(
+            insert(ProductOrder).from_select(
+                ["product_id", "order_id", "product_quantity"], lines
+            )
+        )
+        return order
+
+    async def take_cancelled_reservations(self, limit: int) -> List[int]:
+        """
+        Clear ``stock_reserved`` on up to ``limit`` cancelled orders.
+
+        Returns the ids whose flag this call cleared, so their stock is
+        returned exactly once.
+        """
+        pending = (
+            select(Order.id)
+            .where(Order.status == OrderStatus.CANCELLED, Order.stock_reserved)
+            .limit(limit)
+        )
+        query = (
+            update(Order)
+            .where(Order.id.in_(pending.scalar_subquery()), Order.stock_reserved)
+            .values(stock_reserved=False)
+            .returning(Order.id)
+            .execution_options(synchronize_session=False)
+        )
+        result = await self.session.execute(query)
+        return result.scalars().all()
+
+    async def get_status(
+        self, order_id: int, *, for_update: bool = False
+    ) -> Optional[OrderStatus]:
+        query = select(Order.status).where(Order.id == order_id)
+        if for_update:
+            query = query.with_for_update()
+        result = await self.session.execute(query)
+        return result.scalar_one_or_none()
+
     async def update_status(self, id: int, order_status: OrderStatus) -> Optional[Order]:
+        """Set the status; committed by the caller together with its event."""
         query = (
             update(Order)
             .where(Order.id == id)
@@ -73,6 +235,4 @@ class OrderRepository(SQLAlchemyRepository[Order, OrderCreate, OrderUpdate]):
         )
 
         result = await self.session.execute(query)
-        await self.session.commit()
-        return result.scalar_one()
-        
+        return result.scalar_one_or_none()
@@ -0,0 +1,29 @@
+from typing import List
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from core.internal.models import OrderStatusEventCreate
+
+from ..database.models import OrderStatusEvent
+from .abstract_repository import SQLAlchemyRepository
+
+
+class OrderStatusEventRepository(
+    SQLAlchemyRepository[
+        OrderStatusEvent, OrderStatusEventCreate, OrderStatusEventCreate
+    ]
+):
+    """Append-only: events are created and read, never updated."""
+
+    def __init__(self, session: AsyncSession):
+        super().__init__(model=OrderStatusEvent, session=session)
+
+    async def get_by_order(self, order_id: int) -> List[OrderStatusEvent]:
+        query = (
+            select(OrderStatusEvent)
+            .where(OrderStatusEvent.order_id == order_id)
+            .order_by(OrderStatusEvent.id)
+        )
+        result = await self.session.execute(query)
+        return result.scalars().all()
@@ -0,0 +1,67 @@
+from datetime import datetime
+from typing import List, Sequence
+
+from sqlalchemy import select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from core.internal.enums import OutboxStatus
+from core.internal.models import OutboxMessageCreate, OutboxMessageUpdate
+
+from ..database.models import OutboxMessage
+from .abstract_repository import SQLAlchemyRepository
+
+
+class OutboxRepository(
+    SQLAlchemyRepository[OutboxMessage, OutboxMessageCreate, OutboxMessageUpdate]
+):
+    def __init__(self, session: AsyncSession):
+        super().__init__(model=OutboxMessage, session=session)
+
+    async def get_due(self, now: datetime, limit: int) -> List[OutboxMessage]:
+        """Pending messages whose next attempt is due, oldest first."""
+        query = (
+            select(OutboxMessage)
+            .where(
+                OutboxMessage.status == OutboxStatus.PENDING,
+                OutboxMessage.next_attempt_at <= now,
+            )
+            .order_by(OutboxMessage.next_attempt_at, OutboxMessage.id)
+            .limit(limit)
+        )
+        result = await self.session.execute(query)
+        return result.scalars().all()
+
+    async def mark_sent(self, message_ids: Sequence[int], now: datetime) -> None:
+        if not message_ids:
+            return
+        query = (
+            update(OutboxMessage)
+            .where(OutboxMessage.id.in_(message_ids))
+            .values(
+                status=OutboxStatus.SENT,
+                sent_at=now,
+                attempts=OutboxMessage.attempts + 1,
+            )
+        )
+        await self.session.execute(query)
+
+    async def mark_attempt_failed(
+        self,
+        message_id: int,
+        error: str,
+        *,
+        next_attempt_at: datetime,
+        give_up: bool = False,
+    ) -> None:
+        """Record a failed attempt; ``give_up`` moves the message to FAILED."""
+        query = (
+            update(OutboxMessage)
+            .where(OutboxMessage.id == message_id)
+            .values(
+                status=OutboxStatus.FAILED if give_up else OutboxStatus.PENDING,
+                attempts=OutboxMessage.attempts + 1,
+                next_attempt_at=next_attempt_at,
+                last_error=error,
+            )
+        )
+        await self.session.execute(query)
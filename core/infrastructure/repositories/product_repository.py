@@ -1,10 +1,241 @@
+import re
+from typing import Any, Dict, List, Optional, Sequence
+
+from sqlalchemy import (
+    Row,
+    column,
+    func,
+    literal_column,
+    or_,
+    select,
+    table,
+    update,
+)
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import defer
 
 from core.internal.models import ProductCreate, ProductUpdate
 
-from ..database.models import Product
+from ..database.models import Product, ProductOrder, ShopCardItem
 from .abstract_repository import SQLAlchemyRepository
 
+_WORD_RE = re.compile(r"\w+", re.UNICODE)
+
+# SQLite FTS5 external-content index created by the product_search_index migration
+product_fts = table("product_fts", column("rowid"), column("rank"))
+
+
 class ProductRepository(SQLAlchemyRepository[Product, ProductCreate, ProductUpdate]):
     def __init__(self, session: AsyncSession):
-        super().__init__(model=Product, session=session)
\ No newline at end of file
+        super().__init__(model=Product, session=session)
+
+    async def get_price(
+        self, product_id: int, *, active_only: bool = False
+    ) -> Optional[float]:
+        query = select(Product.price).where(Product.id == product_id)
+        if active_only:
+            query = query.where(Product.is_active)
+        result = await self.session.execute(query)
+        return result.scalar_one_or_none()
+
+    async def get_active(self, product_id: int) -> Optional[Product]:
+        """The product unless it was deleted, without its image (see ``get_image``)."""
+        query = (
+            select(Product)
+            .where(Product.id == product_id, Product.is_active)
+            .options(defer(Product.image, raiseload=True))
+        )
+        result = await self.session.execute(query)
+        return result.scalar_one_or_none()
+
+    async def get_image(self, product_id: int) -> Optional[bytes]:
+        result = await self.session.execute(
+            select(Product.image).where(Product.id == product_id)
+        )
+        return result.scalar_one_or_none()
+
+    async def get_active_multi(
+        self,
+        *,
+        skip: int = 0,
+        limit: int = 100,
+        filters: Optional[Dict[str, Any]] = None,
+    ) -> List[Product]:
+        """Products on sale in id order (images deferred), via the partial index."""
+        query = (
+            select(Product)
+            .where(Product.is_active)
+            .options(defer(Product.image, raiseload=True))
+        )
+        if filters:
+            query = self._apply_filters(query, filters)
+        query = query.order_by(Product.id).offset(skip).limit(limit)
+        result = await self.session.execute(query)
+        return result.scalars().all()
+
+    async def soft_delete(self, product_id: int) -> bool:
+        """
+        Take a product off sale, keeping the row for carts and orders.
+
+        Returns False when the product does not exist or is already deleted.
+        """
+        query = (
+            update(Product)
+            .where(Product.id == product_id, Product.is_active)
+            .values(is_active=False, deleted_at=func.now())
+            .execution_options(synchronize_session=False)
+        )
+        result = await self.session.execute(query)
+        return result.rowcount > 0
+
+    async def update_fields(
+        self, product_id: int, product_data: ProductUpdate
+    ) -> Optional[Product]:
+        """
+        Write the fields set in ``product_data`` without committing.
+
+        Unlike ``update``, the change stays in the session's transaction, so
+        it commits together with whatever depends on it.
+        """
+        query = (
+            update(Product)
+            .where(Product.id == product_id)
+            .values(**product_data.model_dump(exclude_unset=True))
+            .returning(Product)
+        )
+        result = await self.session.execute(query)
+        return result.scalar_one_or_none()
+
+    @staticmethod
+    def _card_quantities(card_id: int):
+        """``(product_id, quantity)`` of a cart, summed per product."""
+        return (
+            select(
+                ShopCardItem.product_id,
+                func.sum(ShopCardItem.quantity).label("quantity"),
+            )
+            .where(ShopCardItem.shop_card_id == card_id)
+            .group_by(ShopCardItem.product_id)
+            .subquery()
+        )
+
+    async def reserve_stock(self, card_id: int) -> Optional[int]:
+        """
+        Take the quantities of a cart's lines from stock with one statement.
+
+        The conditional ``UPDATE ... SET stock = stock - quantity WHERE stock
+        >= quantity`` only touches products that fit, so concurrent checkouts
+        cannot oversell. Quantities are summed per product first, so every
+        product is updated once. Returns the number of reserved products (0
+        when no product is tracked), or None when a product is short and the
+        caller must roll back its transaction.
+        """
+        lines = self._card_quantities(card_id)
+        tracked = await self.session.scalar(
+            select(func.count())
+            .select_from(lines)
+            .join(Product, Product.id == lines.c.product_id)
+            .where(Product.stock.is_not(None))
+        )
+        if not tracked:
+            return 0
+
+        query = (
+            update(Product)
+            .where(
+                Product.id == lines.c.product_id,
+                Product.stock >= lines.c.quantity,
+            )
+            .values(stock=Product.stock - lines.c.quantity)
+            .execution_options(synchronize_session=False)
+        )
+        result = await self.session.execute(query)
+        return tracked if result.rowcount == tracked else None
+
+    async def get_shortages(self, card_id: int) -> List[str]:
+        """Names of the cart's products with less stock than the cart holds."""
+        lines = self._card_quantities(card_id)
+        query = (
+            select(Product.name)
+            .join(lines, lines.c.product_id == Product.id)
+            .where(Product.stock < lines.c.quantity)
+            .order_by(Product.id)
+        )
+        result = await self.session.execute(query)
+        return result.scalars().all()
+
+    async def release_stock(self, order_ids: Sequence[int]) -> None:
+        """Return the quantities of the orders' lines to stock."""
+        if not order_ids:
+            return
+        lines = (
+            select(
+                ProductOrder.product_id,
+                func.sum(ProductOrder.product_quantity).label("quantity"),
+            )
+            .where(ProductOrder.order_id.in_(order_ids))
+            .group_by(ProductOrder.product_id)
+            .subquery()
+        )
+        query = (
+            update(Product)
+            .where(Product.id == lines.c.product_id, Product.stock.is_not(None))
+            .values(stock=Product.stock + lines.c.quantity)
+            .execution_options(synchronize_session=False)
+        )
+        await self.session.execute(query)
+
+    @staticmethod
+    def search_terms(query: str) -> List[str]:
+        """Normalize a free-text query into lower-case word tokens."""
+        return _WORD_RE.findall(query.lower())
+
+    async def search(
+        self, terms: Sequence[str], *, offset: int = 0, limit: int = 50
+    ) -> List[Row]:
+        """
+        Prefix-aware full-text search over product name and description.
+
+        Every term must match the start of a word. Rows carry only the columns
+        needed to render a result (never the image BLOB). With no terms, all
+        products are returned in id order. Deleted products never match.
+        """
+        columns = (Product.id, Product.name, Product.description, Product.price)
+        query = select(*columns).where(Product.is_active)
+
+        if not terms:
+            query = query.order_by(Product.id)
+        else:
+            dialect = self.session.bind.dialect.name
+
+            if dialect == "sqlite":
+                match = " ".join(f'"{term}"*' for term in terms)
+                query = (
+                    query.join(product_fts, product_fts.c.rowid == Product.id)
+                    .where(literal_column("product_fts").op("MATCH")(match))
+                    .order_by(product_fts.c.rank, Product.id)
+                )
+            elif dialect == "postgresql":
+                document = func.to_tsvector(
+                    "simple",
+                    Product.name + " " + func.coalesce(Product.description, ""),
+                )
+                ts_query = func.to_tsquery(
+                    "simple", " & ".join(f"{term}:*" for term in terms)
+                )
+                query = query.where(document.op("@@")(ts_query)).order_by(
+                    func.ts_rank(document, ts_query).desc(), Product.id
+                )
+            else:
+                for term in terms:
+                    pattern = f"%{term}%"
+                    query = query.where(
+                        or_(
+                            Product.name.ilike(pattern),
+                            Product.description.ilike(pattern),
+                        )
+                    )
+                query = query.order_by(Product.id)
+
+        result = await self.session.execute(query.offset(offset).limit(limit))
+        return result.all()
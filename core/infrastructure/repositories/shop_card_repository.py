@@ -1,8 +1,10 @@
-from typing import Optional
+from datetime import datetime
+from typing import List, Optional, Sequence, Tuple
 
-from sqlalchemy import select
+from sqlalchemy import ColumnElement, Row, delete, func, select, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
 
 from core.internal.models import (
     ShopCardCreate,
@@ -11,7 +13,7 @@ from core.internal.models import (
     ShopCardUpdate,
 )
 
-from ..database.models import ShopCard, ShopCardItem
+from ..database.models import Product, ShopCard, ShopCardItem
 from .abstract_repository import SQLAlchemyRepository
 
 
@@ -21,28 +23,181 @@ class ShopCardRepository(
     def __init__(self, session: AsyncSession):
         super().__init__(model=ShopCard, session=session)
 
-    async def get_active_card(self, user_id: int) -> Optional[ShopCard]:
+    async def get_active_card(
+        self, user_id: int, *, for_update: bool = False
+    ) -> Optional[ShopCard]:
+        query = select(ShopCard).where(ShopCard.user_id == user_id)
+        if for_update:
+            query = query.with_for_update()
+
+        result = await self.session.execute(query)
+        return result.scalar_one_or_none()
+
+    async def get_or_create(
+        self, user_id: int, *, for_update: bool = False
+    ) -> ShopCard:
+        """
+        The cart of a user, created if missing; concurrent calls get the same one.
+
+        With ``for_update`` the cart stays locked until the transaction ends,
+        so the cleanup job (which skips locked carts) cannot delete it under a
+        write.
+        """
+        card = await self.get_active_card(user_id, for_update=for_update)
+        if card is not None:
+            return card
+
+        if self.session.bind.dialect.name == "postgresql":
+            query = pg_insert(ShopCard)
+        else:
+            query = sqlite_insert(ShopCard)
+        query = query.values(user_id=user_id).on_conflict_do_nothing(
+            index_elements=[ShopCard.user_id]
+        )
+        await self.session.execute(query)
+        return await self.get_active_card(user_id, for_update=for_update)
+
+    async def get_idle(self, before: datetime, limit: int) -> List[Row]:
+        """
+        ``(id, user_id)`` of carts last changed before ``before``.
+
+        The rows are locked until the transaction ends; carts another
+        transaction is writing are skipped.
+        """
         query = (
-            select(ShopCard)
-            .where((ShopCard.user_id == user_id))
-            .order_by(ShopCard.created_at.desc())
-            .limit(1)
+            select(ShopCard.id, ShopCard.user_id)
+            .where(ShopCard.updated_at < before)
+            .order_by(ShopCard.updated_at, ShopCard.id)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+        )
+        result = await self.session.execute(query)
+        return result.all()
+
+    async def delete_many(self, card_ids: Sequence[int]) -> int:
+        """Delete carts and their lines, returns the number of lines deleted."""
+        if not card_ids:
+            return 0
+        result = await self.session.execute(
+            delete(ShopCardItem).where(ShopCardItem.shop_card_id.in_(card_ids))
         )
+        await self.session.execute(delete(ShopCard).where(ShopCard.id.in_(card_ids)))
+        return result.rowcount
 
+    async def get_holders(self, product_id: int) -> List[int]:
+        """Ids of the users whose cart holds ``product_id``."""
+        query = (
+            select(ShopCard.user_id)
+            .join(ShopCardItem, ShopCardItem.shop_card_id == ShopCard.id)
+            .where(ShopCardItem.product_id == product_id)
+        )
         result = await self.session.execute(query)
-        return result.scalars().first()
+        return result.scalars().all()
 
-    async def get_active_card_with_items(self, user_id: int) -> Optional[ShopCard]:
+    async def get_lines(self, card_id: int) -> List[Row]:
+        """
+        ``(id, product_id, name, price, quantity)`` of every line, no ORM objects.
+
+        Lines of deleted products are left out; the cart's ``lines_count``
+        then disagrees until ``drop_inactive_lines`` repairs it.
+        """
         query = (
-            select(ShopCard)
-            .where((ShopCard.user_id == user_id))
-            .options(selectinload(ShopCard.items).selectinload(ShopCardItem.product))
-            .order_by(ShopCard.created_at.desc())
-            .limit(1)
+            select(
+                ShopCardItem.id,
+                ShopCardItem.product_id,
+                Product.name,
+                Product.price,
+                ShopCardItem.quantity,
+            )
+            .join(Product, Product.id == ShopCardItem.product_id)
+            .where(ShopCardItem.shop_card_id == card_id, Product.is_active)
+            .order_by(ShopCardItem.id)
         )
 
         result = await self.session.execute(query)
-        return result.scalars().first()
+        return result.all()
+
+    async def apply_delta(
+        self, card_id: int, *, items: int = 0, lines: int = 0, price: float = 0.0
+    ) -> None:
+        """Shift the stored cart aggregates by the effect of one write."""
+        query = (
+            update(ShopCard)
+            .where(ShopCard.id == card_id)
+            .values(
+                items_count=ShopCard.items_count + items,
+                lines_count=ShopCard.lines_count + lines,
+                total_price=func.round(ShopCard.total_price + price, 2),
+            )
+        )
+        await self.session.execute(query)
+
+    async def reset_totals(self, card_id: int) -> None:
+        query = (
+            update(ShopCard)
+            .where(ShopCard.id == card_id)
+            .values(items_count=0, lines_count=0, total_price=0.0)
+        )
+        await self.session.execute(query)
+
+    async def drop_inactive_lines(self, card_id: int) -> int:
+        """
+        Delete the card's lines of deleted products and recompute its totals.
+
+        Loaded ``ShopCard`` objects are not updated, refresh them. Returns the
+        number of lines removed.
+        """
+        inactive = select(Product.id).where(
+            Product.id == ShopCardItem.product_id, Product.is_active.is_(False)
+        )
+        result = await self.session.execute(
+            delete(ShopCardItem).where(
+                ShopCardItem.shop_card_id == card_id,
+                inactive.exists(),
+            )
+        )
+        await self._refresh(ShopCard.id == card_id)
+        return result.rowcount
+
+    async def refresh_totals(self, product_id: int) -> None:
+        """Recompute the aggregates of every cart holding ``product_id``."""
+        holders = select(ShopCardItem.shop_card_id).where(
+            ShopCardItem.product_id == product_id
+        )
+        await self._refresh(ShopCard.id.in_(holders))
+
+    async def _refresh(self, condition: ColumnElement[bool]) -> None:
+        items = ShopCardItem.__table__.alias("items")
+        total_price = (
+            select(func.coalesce(func.sum(items.c.quantity * Product.price), 0.0))
+            .select_from(items.join(Product, Product.id == items.c.product_id))
+            .where(items.c.shop_card_id == ShopCard.id)
+            .scalar_subquery()
+        )
+        items_count = (
+            select(func.coalesce(func.sum(items.c.quantity), 0))
+            .where(items.c.shop_card_id == ShopCard.id)
+            .scalar_subquery()
+        )
+        lines_count = (
+            select(func.count())
+            .select_from(items)
+            .where(items.c.shop_card_id == ShopCard.id)
+            .scalar_subquery()
+        )
+        query = (
+            update(ShopCard)
+            .where(condition)
+            .values(
+                items_count=items_count,
+                lines_count=lines_count,
+                total_price=func.round(total_price, 2),
+                # Not the user's activity: keep the idle time cleanup reads
+                updated_at=ShopCard.updated_at,
+            )
+            .execution_options(synchronize_session=False)
+        )
+        await self.session.execute(query)
 
 
 class ShopCardItemRepository(
@@ -61,3 +216,50 @@ class ShopCardItemRepository(
 
         result = await self.session.execute(query)
         return result.scalars().first()
+
+    async def add_quantity(
+        self, card_id: int, product_id: int, quantity: int
+    ) -> Tuple[ShopCardItem, bool]:
+        """
+        Add ``quantity`` of a product to the card in one statement.
+
+        An upsert on the (card, product) unique index: concurrent adds of the
+        same product land on one line and none of them is lost. Returns the
+        line and whether it was created.
+        """
+        if self.session.bind.dialect.name == "postgresql":
+            query = pg_insert(ShopCardItem)
+        else:
+            query = sqlite_insert(ShopCardItem)
+        query = query.values(
+            shop_card_id=card_id, product_id=product_id, quantity=quantity
+        )
+        query = query.on_conflict_do_update(
+            index_elements=[ShopCardItem.shop_card_id, ShopCardItem.product_id],
+            set_={"quantity": ShopCardItem.quantity + query.excluded.quantity},
+        ).returning(ShopCardItem)
+
+        result = await self.session.scalars(
+            query, execution_options={"populate_existing": True}
+        )
+        item = result.one()
+        # Stored quantities are positive, so only a new line holds exactly
+        # the added quantity
+        return item, item.quantity == quantity
+
+    async def remove_product(self, card_id: int, product_id: int) -> Optional[int]:
+        """Delete the card's line of ``product_id``, returns its quantity."""
+        result = await self.session.execute(
+            delete(ShopCardItem)
+            .where(
+                ShopCardItem.shop_card_id == card_id,
+                ShopCardItem.product_id == product_id,
+            )
+            .returning(ShopCardItem.quantity)
+        )
+        return result.scalar_one_or_none()
+
+    async def delete_by_card(self, card_id: int) -> None:
+        await self.session.execute(
+            delete(ShopCardItem).where(ShopCardItem.shop_card_id == card_id)
+        )
@@ -1,6 +1,8 @@
-from typing import Any, Optional
+from typing import Any, List, Optional, Sequence
 
-from sqlalchemy import select
+from sqlalchemy import func, or_, select, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.exc import NoResultFound
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -21,3 +23,59 @@ class UserRepository(SQLAlchemyRepository[User, UserCreate, UserUpdate]):
             return result.scalar_one()
         except NoResultFound:
             return None
+
+    async def upsert(self, obj_in: UserCreate) -> None:
+        """
+        Register a user or refresh its profile in one statement.
+
+        An existing row is only written when the username or full name changed
+        or the user was marked as blocked: talking to the bot unblocks it.
+        """
+        if self.session.bind.dialect.name == "postgresql":
+            query = pg_insert(User)
+        else:
+            query = sqlite_insert(User)
+        query = query.values(**obj_in.model_dump())
+        query = query.on_conflict_do_update(
+            index_elements=[User.telegram_id],
+            set_={
+                "username": query.excluded.username,
+                "full_name": query.excluded.full_name,
+                "is_blocked": False,
+                "updated_at": func.now(),
+            },
+            where=or_(
+                User.username.is_distinct_from(query.excluded.username),
+                User.full_name.is_distinct_from(query.excluded.full_name),
+                User.is_blocked.is_(True),
+            ),
+        )
+        await self.session.execute(query)
+
+    async def get_reachable_ids_after(self, last_id: int, limit: int) -> List[int]:
+        """Keyset page of telegram ids greater than ``last_id``, skipping blocked users."""
+        query = (
+            select(User.telegram_id)
+            .where((User.telegram_id > last_id) & (User.is_blocked.is_(False)))
+            .order_by(User.telegram_id)
+            .limit(limit)
+        )
+        result = await self.session.execute(query)
+        return result.scalars().all()
+
+    async def count_reachable_after(self, last_id: int = 0) -> int:
+        query = select(func.count(User.telegram_id)).where(
+            (User.telegram_id > last_id) & (User.is_blocked.is_(False))
+        )
+        result = await self.session.execute(query)
+        return result.scalar() or 0
+
+    async def mark_blocked(self, telegram_ids: Sequence[int]) -> None:
+        if not telegram_ids:
+            return
+        query = (
+            update(User)
+            .where(User.telegram_id.in_(telegram_ids))
+            .values(is_blocked=True)
+        )
+        await self.session.execute(query)
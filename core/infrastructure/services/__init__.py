@@ -1,15 +1,28 @@
 from .admin_service import AdminService
+from .analytics_service import AnalyticsService, StatsDisplayFormatter
+from .broadcast_service import BroadcastDisplayFormatter, BroadcastService
+from .cart_cleanup_service import CartCleanupService
 from .catalog_service import (
     CaptionStrategyType,
     CatalogService,
     DeleteCaptionArgs,
     ErrorCaptionArg,
     ProductCaptionArgs,
+    ProductDisplayFormatter,
 )
-from .dialog_service import DialogService
+from .dialog_service import DialogDisplayFormatter, DialogService
 from .shop_card_service import ShopCardService
 from .shop_service import ShopService
-from .order_service import OrderService
+from .inventory_service import InventoryService
+from .order_service import (
+    OrderDisplayFormatter,
+    OrderService,
+    OrderStatusError,
+    OutOfStockError,
+)
+from .order_export_service import OrderExportService
+from .outbox_service import OutboxService
+from .retention_service import RetentionService
 
 __all__ = [
     "ShopService",
@@ -22,5 +35,19 @@ __all__ = [
     "DialogService",
     "AdminService",
     "ShopCardService",
-    "OrderService"
+    "OrderService",
+    "BroadcastService",
+    "OutboxService",
+    "AnalyticsService",
+    "OrderExportService",
+    "InventoryService",
+    "OutOfStockError",
+    "OrderStatusError",
+    "RetentionService",
+    "CartCleanupService",
+    "ProductDisplayFormatter",
+    "DialogDisplayFormatter",
+    "OrderDisplayFormatter",
+    "BroadcastDisplayFormatter",
+    "StatsDisplayFormatter",
 ]
@@ -14,8 +14,7 @@ class AdminService:
         self.admin_config._load_admin_ids()
 
     async def add_admin(self, user_id: int) -> bool:
-        if user_id not in self.admin_config.admin_ids:
-            self.admin_config.admin_ids.append(user_id)
+        if self.admin_config.add_admin_id(user_id):
             self._save_admin_ids()
             return True
         return False
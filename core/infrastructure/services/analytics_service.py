@@ -0,0 +1,282 @@
+from collections import defaultdict
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta, timezone
+from typing import ClassVar, Dict, List, Optional, Tuple
+
+from sqlalchemy import Row
+
+from config import AnalyticsConfig
+from core.infrastructure.database import DatabaseManager
+from core.infrastructure.i18n import DisplayFormatter
+from core.infrastructure.jobs import PeriodicJob
+from core.infrastructure.repositories import AnalyticsRepository
+from core.internal.enums import OrderStatus
+from core.internal.types import (
+    ORDER_STATUSES,
+    OrderExport,
+    ProductSales,
+    SalesReport,
+)
+from logger import LoggerBuilder
+
+logger = LoggerBuilder("Analytics - Service").add_stream_handler().build()
+
+
+def _day(moment: datetime) -> date:
+    # Rollup days are UTC days, like the naive UTC timestamps they come from
+    if moment.tzinfo is not None:
+        moment = moment.astimezone(timezone.utc)
+    return moment.date()
+
+
+@dataclass(frozen=True)
+class StatsDisplayFormatter(DisplayFormatter):
+    prefix: ClassVar[str] = "stats"
+
+    no_data: str
+    error: str
+    usage: str
+    export_usage: str
+    export_empty: str
+    export_error: str
+
+    async def get_export_caption(self, export: OrderExport) -> str:
+        if export.since is None:
+            return self.text(
+                "export_caption_all", orders=export.orders, rows=export.rows
+            )
+        return self.text(
+            "export_caption",
+            orders=export.orders,
+            rows=export.rows,
+            since=export.since.strftime("%d.%m.%Y"),
+        )
+
+    async def get_report_text(self, report: SalesReport) -> str:
+        if not report.orders_count and not report.status_counts:
+            return self.text(
+                "empty",
+                start=report.start.strftime("%d.%m.%Y"),
+                end=report.end.strftime("%d.%m.%Y"),
+            )
+
+        products = "\n".join(
+            self.text(
+                "product_line",
+                position=position,
+                name=product.name or f"#{product.product_id}",
+                units=product.units,
+                revenue=f"{product.revenue:.2f}",
+            )
+            for position, product in enumerate(report.top_products, start=1)
+        )
+        statuses = "\n".join(
+            self.text(
+                "status_line",
+                status=status.value,
+                count=report.status_counts.get(status, 0),
+            )
+            for status in ORDER_STATUSES
+        )
+        best_day = (
+            self.text(
+                "best_day",
+                date=report.best_day.strftime("%d.%m.%Y"),
+                revenue=f"{report.best_day_revenue:.2f}",
+            )
+            if report.best_day
+            else self.no_data
+        )
+        return self.text(
+            "report",
+            start=report.start.strftime("%d.%m.%Y"),
+            end=report.end.strftime("%d.%m.%Y"),
+            days=report.days,
+            orders=report.orders_count,
+            units=report.units,
+            revenue=f"{report.revenue:.2f}",
+            average=f"{report.average_check:.2f}",
+            best_day=best_day,
+            products=products or self.no_data,
+            statuses=statuses,
+        )
+
+
+class AnalyticsService(PeriodicJob):
+    """
+    Sales reports served from daily rollup tables.
+
+    ``refresh`` folds orders and order status events not counted yet into
+    ``daily_sales``, ``daily_product_sales`` and ``daily_order_status``.
+    Each batch is claimed (its rows flagged ``rolled_up``) in the transaction
+    that writes its increments, so every source row is counted exactly once,
+    whatever order the rows were committed in. Reports only read the
+    rollups: a period costs one row per day, however many orders it had.
+
+    Sales count orders by their creation day; cancelling an order takes it
+    back out of the sales of that day. ``daily_order_status`` counts status
+    transitions, a new order counting as entering PENDING.
+
+    Product revenue uses the product price at refresh time (order lines do
+    not store the price they were sold at); order totals are exact.
+    """
+
+    job_name: ClassVar[str] = "analytics"
+
+    def __init__(
+        self,
+        db_manager: DatabaseManager,
+        formatter: StatsDisplayFormatter,
+        config: Optional[AnalyticsConfig] = None,
+    ):
+        self.config = config or AnalyticsConfig()
+        super().__init__(db_manager, self.config.refresh_interval)
+        self._formatter = formatter
+
+    @property
+    def formatter(self) -> StatsDisplayFormatter:
+        return self._formatter
+
+    async def run_batch(self) -> bool:
+        await self.refresh()
+        return False
+
+    async def refresh(self) -> int:
+        """Fold every new source row into the rollups. Returns the number folded."""
+        folded = 0
+        while True:
+            orders = await self._fold_orders()
+            events = await self._fold_status_events()
+            folded += orders + events
+            if orders < self.config.batch_size and events < self.config.batch_size:
+                break
+        if folded:
+            logger.info(f"Folded {folded} orders and status events into rollups")
+        return folded
+
+    async def _fold_orders(self) -> int:
+        async with self._get_session() as session:
+            repo = self.db_manager.get_repo(AnalyticsRepository, session)
+            orders = await repo.take_orders(self.config.batch_size)
+            if not orders:
+                return 0
+
+            sales = await self._add_sales(repo, orders, 1)
+            # A new order enters the PENDING status without a status event
+            await repo.add_status_counts(
+                [
+                    {"day": day, "status": OrderStatus.PENDING, "orders_count": count}
+                    for day, count in sales.items()
+                ]
+            )
+            return len(orders)
+
+    async def _fold_status_events(self) -> int:
+        async with self._get_session() as session:
+            repo = self.db_manager.get_repo(AnalyticsRepository, session)
+            events = await repo.take_status_events(self.config.batch_size)
+            if not events:
+                return 0
+
+            counts: Dict[Tuple[date, OrderStatus], int] = defaultdict(int)
+            # Cancelling takes an order out of the sales; leaving CANCELLED
+            # (possible in history written before it became final) puts it back
+            signs: Dict[int, int] = defaultdict(int)
+            for event in events:
+                counts[_day(event.created_at), event.new_status] += 1
+                if event.new_status == OrderStatus.CANCELLED:
+                    signs[event.order_id] -= 1
+                elif event.old_status == OrderStatus.CANCELLED:
+                    signs[event.order_id] += 1
+
+            await repo.add_status_counts(
+                [
+                    {"day": day, "status": status, "orders_count": count}
+                    for (day, status), count in counts.items()
+                ]
+            )
+            # Events of one order alternate in and out of CANCELLED, so the
+            # sum per order is -1, 0 or 1
+            orders = await repo.get_orders([i for i, sign in signs.items() if sign])
+            for sign in (-1, 1):
+                await self._add_sales(
+                    repo, [order for order in orders if signs[order.id] == sign], sign
+                )
+            return len(events)
+
+    @staticmethod
+    async def _add_sales(
+        repo: AnalyticsRepository, orders: List[Row], sign: int
+    ) -> Dict[date, int]:
+        """
+        Add ``sign`` times the orders to the sales rollups of their creation day.
+
+        Returns the number of orders per day.
+        """
+        order_days = {order.id: _day(order.created_at) for order in orders}
+        sales: Dict[date, List[float]] = defaultdict(lambda: [0, 0, 0.0])
+        for order in orders:
+            totals = sales[order_days[order.id]]
+            totals[0] += sign
+            totals[1] += sign * order.total_count
+            totals[2] += sign * order.total_price
+
+        products: Dict[Tuple[date, int], List[float]] = defaultdict(lambda: [0, 0.0])
+        for line in await repo.get_order_lines(list(order_days)):
+            totals = products[order_days[line.order_id], line.product_id]
+            totals[0] += sign * line.quantity
+            totals[1] += sign * line.quantity * line.price
+
+        await repo.add_daily_sales(
+            [
+                {"day": day, "orders_count": count, "units": units, "revenue": revenue}
+                for day, (count, units, revenue) in sales.items()
+            ]
+        )
+        await repo.add_product_sales(
+            [
+                {
+                    "day": day,
+                    "product_id": product_id,
+                    "units": units,
+                    "revenue": revenue,
+                }
+                for (day, product_id), (units, revenue) in products.items()
+            ]
+        )
+        return {day: count for day, (count, _, _) in sales.items()}
+
+    async def get_report(self, days: Optional[int] = None) -> SalesReport:
+        """Sales of the last ``days`` UTC days, today included."""
+        days = min(
+            max(days or self.config.report_days, 1), self.config.max_report_days
+        )
+        end = datetime.now(timezone.utc).date()
+        start = end - timedelta(days=days - 1)
+
+        async with self._get_session() as session:
+            repo = self.db_manager.get_repo(AnalyticsRepository, session)
+            totals = await repo.get_totals(start, end)
+            best_day = await repo.get_best_day(start, end)
+            top_products = await repo.get_top_products(
+                start, end, self.config.top_products
+            )
+            status_counts = await repo.get_status_counts(start, end)
+
+        return SalesReport(
+            start=start,
+            end=end,
+            orders_count=totals.orders_count,
+            units=totals.units,
+            revenue=totals.revenue,
+            best_day=best_day.day if best_day else None,
+            best_day_revenue=best_day.revenue if best_day else 0.0,
+            top_products=[
+                ProductSales(row.product_id, row.name, row.units, row.revenue)
+                for row in top_products
+            ],
+            status_counts=status_counts,
+        )
+
+    async def get_report_text(self, days: Optional[int] = None) -> str:
+        return await self.formatter.get_report_text(await self.get_report(days))
@@ -0,0 +1,287 @@
+import asyncio
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from time import monotonic
+from typing import AsyncIterator, ClassVar, List, Optional, Tuple
+
+from aiogram import Bot
+from aiogram.exceptions import TelegramAPIError, TelegramForbiddenError
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from core.infrastructure.cache import UserCache
+from core.infrastructure.database import DatabaseManager
+from core.infrastructure.database.models import Broadcast
+from core.infrastructure.i18n import DisplayFormatter
+from core.infrastructure.jobs import JobRunner
+from core.infrastructure.repositories import BroadcastRepository, UserRepository
+from core.internal.enums import BroadcastStatus, SendPriority
+from core.internal.models import BroadcastCreate
+from logger import LoggerBuilder
+from utils import send_priority
+
+logger = LoggerBuilder("Broadcast - Service").add_stream_handler().build()
+
+
+@dataclass(frozen=True)
+class BroadcastDisplayFormatter(DisplayFormatter):
+    prefix: ClassVar[str] = "broadcast"
+
+    input_text: str
+    text_only: str
+    cancelled: str
+    no_users: str
+    error: str
+    cancel_usage: str
+    not_running: str
+
+    async def get_already_running_text(self, broadcast_id: int) -> str:
+        return self.text("already_running", id=broadcast_id)
+
+    async def get_stopping_text(self, broadcast_id: int) -> str:
+        return self.text("stopping", id=broadcast_id)
+
+    async def get_started_text(self, broadcast: Broadcast) -> str:
+        return self.text("started", id=broadcast.id, total=broadcast.total)
+
+    async def get_progress_text(
+        self, broadcast: Broadcast, throughput: float, eta: Optional[float]
+    ) -> str:
+        eta_text = (
+            self.text("eta", minutes=int(eta // 60), seconds=int(eta % 60))
+            if eta is not None
+            else "—"
+        )
+        return self.text(
+            "progress",
+            id=broadcast.id,
+            status=broadcast.status.value,
+            processed=broadcast.processed_count,
+            total=broadcast.total,
+            sent=broadcast.sent_count,
+            blocked=broadcast.blocked_count,
+            failed=broadcast.failed_count,
+            throughput=f"{throughput:.1f}",
+            eta=eta_text,
+        )
+
+
+class BroadcastService:
+    """
+    Sends a message to every reachable user.
+
+    Users are streamed from ``UserRepository`` in keyset batches ordered by
+    telegram id, and the checkpoint (last processed id and counters) is saved
+    after every batch, so a restarted bot resumes where it stopped. A user may
+    receive the message twice only if the process dies in the middle of a batch.
+
+    ``cancel_broadcast`` marks a running broadcast CANCELLED; the job sees it
+    at its next checkpoint and stops after the batch it was sending.
+    """
+
+    def __init__(
+        self,
+        db_manager: DatabaseManager,
+        formatter: BroadcastDisplayFormatter,
+        *,
+        batch_size: int = 100,
+        report_interval: float = 5.0,
+        user_cache: Optional[UserCache] = None,
+    ):
+        self._db_manager = db_manager
+        self._formatter = formatter
+        self.batch_size = batch_size
+        self.report_interval = report_interval
+        self._user_cache = user_cache
+
+    @property
+    def db_manager(self) -> DatabaseManager:
+        return self._db_manager
+
+    @property
+    def formatter(self) -> BroadcastDisplayFormatter:
+        return self._formatter
+
+    @staticmethod
+    def job_name(broadcast_id: int) -> str:
+        return f"broadcast_{broadcast_id}"
+
+    @asynccontextmanager
+    async def _get_session(self) -> AsyncIterator[AsyncSession]:
+        async with self.db_manager.get_db_session() as session:
+            try:
+                yield session
+            except SQLAlchemyError as e:
+                logger.error(f"Database operation failed: {str(e)}")
+                raise
+
+    async def create_broadcast(self, admin_id: int, text: str) -> Optional[Broadcast]:
+        """Create a broadcast for every reachable user, None if there is nobody to send to."""
+        async with self._get_session() as session:
+            user_repo = self.db_manager.get_repo(UserRepository, session)
+            total = await user_repo.count_reachable_after(0)
+            if not total:
+                return None
+
+            broadcast_repo = self.db_manager.get_repo(BroadcastRepository, session)
+            broadcast = await broadcast_repo.create(
+                BroadcastCreate(admin_id=admin_id, text=text, total=total)
+            )
+            logger.info(f"Created broadcast ID: {broadcast.id} for {total} users")
+            return broadcast
+
+    async def get_broadcast(self, broadcast_id: int) -> Optional[Broadcast]:
+        async with self._get_session() as session:
+            repo = self.db_manager.get_repo(BroadcastRepository, session)
+            return await repo.get(broadcast_id)
+
+    async def cancel_broadcast(self, broadcast_id: int) -> bool:
+        """Stop a running broadcast, False if it is not running."""
+        async with self._get_session() as session:
+            repo = self.db_manager.get_repo(BroadcastRepository, session)
+            cancelled = await repo.set_status(
+                broadcast_id,
+                BroadcastStatus.CANCELLED,
+                expected=BroadcastStatus.RUNNING,
+            )
+        if cancelled:
+            logger.info(f"Broadcast ID: {broadcast_id} cancelled")
+        return cancelled
+
+    async def get_running_broadcasts(self) -> List[Broadcast]:
+        async with self._get_session() as session:
+            repo = self.db_manager.get_repo(BroadcastRepository, session)
+            return await repo.get_running()
+
+    def start(self, bot: Bot, broadcast_id: int, job_runner: JobRunner) -> bool:
+        task = job_runner.spawn(self.job_name(broadcast_id), self.run(bot, broadcast_id))
+        return task is not None
+
+    async def resume_running(self, bot: Bot, job_runner: JobRunner) -> None:
+        """Restart broadcasts that were interrupted by a shutdown."""
+        for broadcast in await self.get_running_broadcasts():
+            logger.info(
+                f"Resuming broadcast ID: {broadcast.id} after user {broadcast.last_user_id}"
+            )
+            self.start(bot, broadcast.id, job_runner)
+
+    async def _fetch_batch(self, last_user_id: int) -> List[int]:
+        async with self._get_session() as session:
+            repo = self.db_manager.get_repo(UserRepository, session)
+            return await repo.get_reachable_ids_after(last_user_id, self.batch_size)
+
+    async def _checkpoint(
+        self,
+        broadcast_id: int,
+        last_user_id: int,
+        sent: int,
+        failed: int,
+        blocked: List[int],
+    ) -> Broadcast:
+        async with self._get_session() as session:
+            user_repo = self.db_manager.get_repo(UserRepository, session)
+            broadcast_repo = self.db_manager.get_repo(BroadcastRepository, session)
+
+            await user_repo.mark_blocked(blocked)
+            await broadcast_repo.save_progress(
+                broadcast_id,
+                last_user_id=last_user_id,
+                sent=sent,
+                failed=failed,
+                blocked=len(blocked),
+            )
+            broadcast = await broadcast_repo.get(broadcast_id)
+
+        if self._user_cache is not None:
+            self._user_cache.forget(blocked)
+        return broadcast
+
+    async def _finish(self, broadcast_id: int) -> Broadcast:
+        async with self._get_session() as session:
+            repo = self.db_manager.get_repo(BroadcastRepository, session)
+            # A cancelled broadcast stays cancelled
+            await repo.set_status(
+                broadcast_id,
+                BroadcastStatus.FINISHED,
+                expected=BroadcastStatus.RUNNING,
+            )
+            return await repo.get(broadcast_id)
+
+    @staticmethod
+    async def _send_one(bot: Bot, user_id: int, text: str) -> Tuple[int, str]:
+        try:
+            await bot.send_message(chat_id=user_id, text=text)
+            return user_id, "sent"
+        except TelegramForbiddenError:
+            return user_id, "blocked"
+        except TelegramAPIError as e:
+            logger.warning(f"Broadcast message to {user_id} failed: {e}")
+            return user_id, "failed"
+
+    async def _report(
+        self,
+        bot: Bot,
+        broadcast: Broadcast,
+        message_id: Optional[int],
+        processed: int,
+        started_at: float,
+    ) -> None:
+        elapsed = monotonic() - started_at
+        throughput = processed / elapsed if elapsed > 0 else 0.0
+        remaining = max(broadcast.total - broadcast.processed_count, 0)
+        eta = remaining / throughput if throughput > 0 else None
+        text = await self.formatter.get_progress_text(broadcast, throughput, eta)
+
+        try:
+            if message_id is None:
+                await bot.send_message(chat_id=broadcast.admin_id, text=text)
+            else:
+                await bot.edit_message_text(
+                    chat_id=broadcast.admin_id, message_id=message_id, text=text
+                )
+        except TelegramAPIError as e:
+            logger.warning(f"Broadcast progress report failed: {e}")
+
+    async def run(self, bot: Bot, broadcast_id: int) -> None:
+        broadcast = await self.get_broadcast(broadcast_id)
+        if not broadcast or broadcast.status != BroadcastStatus.RUNNING:
+            return
+
+        progress = await bot.send_message(
+            chat_id=broadcast.admin_id,
+            text=await self.formatter.get_started_text(broadcast),
+        )
+        started_at = last_report = monotonic()
+        processed = 0
+        cursor = broadcast.last_user_id
+
+        with send_priority(SendPriority.BROADCAST):
+            while user_ids := await self._fetch_batch(cursor):
+                results = await asyncio.gather(
+                    *(self._send_one(bot, user_id, broadcast.text) for user_id in user_ids)
+                )
+                blocked = [user_id for user_id, status in results if status == "blocked"]
+                sent = sum(1 for _, status in results if status == "sent")
+                failed = len(results) - sent - len(blocked)
+
+                cursor = user_ids[-1]
+                broadcast = await self._checkpoint(
+                    broadcast_id, cursor, sent, failed, blocked
+                )
+                processed += len(user_ids)
+                if broadcast.status != BroadcastStatus.RUNNING:
+                    break
+
+                if monotonic() - last_report >= self.report_interval:
+                    last_report = monotonic()
+                    await self._report(
+                        bot, broadcast, progress.message_id, processed, started_at
+                    )
+
+        broadcast = await self._finish(broadcast_id)
+        await self._report(bot, broadcast, progress.message_id, processed, started_at)
+        logger.info(
+            f"Broadcast ID: {broadcast_id} {broadcast.status.name.lower()}: "
+            f"sent {broadcast.sent_count}, "
+            f"blocked {broadcast.blocked_count}, failed {broadcast.failed_count}"
+        )
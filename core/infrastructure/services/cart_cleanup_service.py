@@ -0,0 +1,65 @@
+from datetime import datetime, timedelta, timezone
+from typing import ClassVar, Optional, Tuple
+
+from config import CartCleanupConfig
+from core.infrastructure.cache import CartCache
+from core.infrastructure.database import DatabaseManager
+from core.infrastructure.jobs import PeriodicJob
+from core.infrastructure.repositories import ShopCardRepository
+from logger import LoggerBuilder
+
+logger = LoggerBuilder("CartCleanup - Service").add_stream_handler().build()
+
+
+class CartCleanupService(PeriodicJob):
+    """
+    Deletes carts nobody has changed for ``ttl_days``, with their lines.
+
+    Every user has at most one cart and gets a new one on the next add, so an
+    abandoned cart is only dead weight. Carts are deleted ``batch_size`` at a
+    time, each batch in its own short transaction; carts being written by a
+    concurrent transaction are skipped until the next run.
+    """
+
+    job_name: ClassVar[str] = "cart_cleanup"
+
+    def __init__(
+        self,
+        db_manager: DatabaseManager,
+        cart_cache: Optional[CartCache] = None,
+        config: Optional[CartCleanupConfig] = None,
+    ):
+        self.config = config or CartCleanupConfig()
+        super().__init__(db_manager, self.config.interval)
+        self._cart_cache = cart_cache
+
+    async def run_batch(self) -> bool:
+        await self.cleanup()
+        return False
+
+    async def cleanup(self) -> Tuple[int, int]:
+        """Delete every idle cart. Returns the number of carts and lines deleted."""
+        cutoff = datetime.now(timezone.utc).replace(tzinfo=None) - timedelta(
+            days=self.config.ttl_days
+        )
+        carts = lines = 0
+        while True:
+            batch_carts, batch_lines = await self._delete_batch(cutoff)
+            carts += batch_carts
+            lines += batch_lines
+            if batch_carts < self.config.batch_size:
+                break
+
+        logger.info(f"Cart cleanup reclaimed {carts} carts and {lines} cart lines")
+        return carts, lines
+
+    async def _delete_batch(self, cutoff: datetime) -> Tuple[int, int]:
+        async with self._get_session() as session:
+            repo = self.db_manager.get_repo(ShopCardRepository, session)
+            idle = await repo.get_idle(cutoff, self.config.batch_size)
+            lines = await repo.delete_many([card.id for card in idle])
+
+        if self._cart_cache is not None:
+            for card in idle:
+                self._cart_cache.invalidate(card.user_id)
+        return len(idle), lines
@@ -1,14 +1,29 @@
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
-from typing import Dict, List
+from typing import ClassVar, Dict, List, Optional, Union
 
 from aiogram import html
-from aiogram.types import BufferedInputFile
-
+from aiogram.types import (
+    BufferedInputFile,
+    InlineKeyboardMarkup,
+    InlineQueryResultArticle,
+    InputTextMessageContent,
+    Message,
+)
+
+from core.infrastructure.cache import CatalogCache
 from core.infrastructure.database.models import Product
-from core.internal.enums import CaptionStrategyType
+from core.infrastructure.i18n import DisplayFormatter
+from core.infrastructure.repositories import ProductRepository
+from core.internal.enums import CaptionStrategyType, InlineQueryText
 from core.internal.models import ProductUpdate
-from core.internal.types import DeleteCaptionArgs, ErrorCaptionArg, ProductCaptionArgs
+from core.internal.types import (
+    DeleteCaptionArgs,
+    ErrorCaptionArg,
+    InlineSearchPage,
+    ProductCaptionArgs,
+)
+from keyboards import get_catalog_keyboard
 from logger import LoggerBuilder
 from utils import ImageSelector
 
@@ -18,26 +33,36 @@ logger = LoggerBuilder("Catalog - Service").add_stream_handler().build()
 
 
 @dataclass(frozen=True)
-class ProductDisplayFormatter:
+class ProductDisplayFormatter(DisplayFormatter):
     """Configuration for product display formatting"""
 
-    name_format: str = "Название: {name}\n\n"
-    description_format: str = "Описание: {description}\n\n"
-    price_format: str = "Стоимость: {price}$"
-    no_description_text: str = "Нет описания"
-    no_products_text: str = "Нет предметов для продажи"
-    error_text: str = "Ошибка в обработке предмета: {error}"
-    delete_confirm: str = "Вы уверены, что хотите удалить: {name}?"
-    delete_success: str = "Предмет был удален из каталога"
-    delete_cancel: str = "Удаление отменено!"
-
-    edit_name_prompt: str = "Пожалуйста, введите новое название предмета (или 'skip' для сохранения текущего)."
-    edit_description_prompt: str = "Пожалуйста, введите новое описание предмета (или 'skip' для сохранения текущего)."
-    edit_price_prompt: str = "Пожалуйста, введите новую стоимость предмета (например, 19.99, или 'skip' для сохранения текущей)."
-    edit_image_prompt: str = "Пожалуйста, отправьте новое изображение предмета (или 'skip' для сохранения текущего)."
-    edit_success: str = "Предмет '{name}' успешно обновлён (ID: {id}, Price: {price}$)"
-    edit_cansel: str = ""
-    edit_invalid_price: str = "Введите корректную цену (например, 19.99)."
+    prefix: ClassVar[str] = "product"
+
+    no_description_text: str
+    no_products_text: str
+    delete_success: str
+    delete_cancel: str
+
+    edit_name_prompt: str
+    edit_description_prompt: str
+    edit_price_prompt: str
+    edit_image_prompt: str
+    edit_stock_prompt: str
+    edit_cansel: str
+    edit_invalid_price: str
+    edit_invalid_stock: str
+
+    def get_caption_text(self, name: str, description: str, price: float) -> str:
+        return self.text("caption", name=name, description=description, price=price)
+
+    def get_error_text(self, error: str) -> str:
+        return self.text("error_text", error=error)
+
+    def get_delete_confirm_text(self, name: str) -> str:
+        return self.text("delete_confirm", name=name)
+
+    def get_edit_success_text(self, name: str, id: str, price: str) -> str:
+        return self.text("edit_success", name=name, id=id, price=price)
 
 
 class CaptionStrategy(ABC):
@@ -63,14 +88,12 @@ class ProductCaptionStrategy(CaptionStrategy):
         product = args.get("product")
         if not product:
             raise ValueError("Product is required for product caption")
-        return (
-            self.config.name_format.format(name=html.bold(product.name))
-            + self.config.description_format.format(
-                description=html.italic(
-                    product.description or self.config.no_description_text
-                )
-            )
-            + self.config.price_format.format(price=product.price)
+        return self.config.get_caption_text(
+            name=html.bold(product.name),
+            description=html.italic(
+                product.description or self.config.no_description_text
+            ),
+            price=product.price,
         )
 
     def build_error(self, args):
@@ -84,7 +107,7 @@ class DeleteCaptionStrategy(CaptionStrategy):
         product_name = args.get("product_name")
         if not product_name:
             raise ValueError("Product name is required for delete caption")
-        return self.config.delete_confirm.format(name=html.bold(product_name))
+        return self.config.get_delete_confirm_text(name=html.bold(product_name))
 
     def build_error(self, args):
         return super().build_error(args)
@@ -99,7 +122,7 @@ class EditCaptionStrategy(CaptionStrategy):
         if not product:
             raise ValueError("Product is required for product caption")
 
-        return self.config.edit_success.format(
+        return self.config.get_edit_success_text(
             name=html.bold(product.name),
             id=html.bold(product.id),
             price=html.bold(product.price),
@@ -107,15 +130,23 @@ class EditCaptionStrategy(CaptionStrategy):
 
     def build_error(self, args: ErrorCaptionArg) -> str:
         error = args.get("error")
-        return self.config.error_text.format(error=html.bold(str(error)))
+        return self.config.get_error_text(error=html.bold(str(error)))
 
 
 class CatalogService:
     """Service layer for catalog operations"""
 
-    def __init__(self, shop_service: ShopService):
+    inline_page_size: int = 50
+
+    def __init__(
+        self,
+        shop_service: ShopService,
+        formatter: ProductDisplayFormatter,
+        catalog_cache: Optional[CatalogCache] = None,
+    ):
         self.shop_service = shop_service
-        self.config = ProductDisplayFormatter()
+        self.catalog_cache = catalog_cache or CatalogCache()
+        self.config = formatter
         self.caption_strategies: Dict[CaptionStrategyType, CaptionStrategy] = {
             CaptionStrategyType.PRODUCT: ProductCaptionStrategy(self.config),
             CaptionStrategyType.DELETE: DeleteCaptionStrategy(self.config),
@@ -156,15 +187,92 @@ class CatalogService:
         )
         return updated_product
 
+    async def search_inline(self, query: str, offset: int = 0) -> InlineSearchPage:
+        """
+        Get one page of inline query results.
+
+        Pages are cached per normalized query and offset until the catalog
+        changes. The bare ``catalog`` query lists every product.
+
+        Args:
+            query: Raw inline query text
+            offset: Number of results already shown to the user
+
+        Returns:
+            InlineSearchPage: Results and the offset of the next page
+        """
+        terms = ProductRepository.search_terms(query)
+        if terms == [InlineQueryText.CATALOG.value]:
+            terms = []
+
+        key = self.catalog_cache.search_page_key(
+            self.config.locale, " ".join(terms), offset
+        )
+        if (page := self.catalog_cache.search_pages.get(key)) is not None:
+            return page
+
+        rows = await self.shop_service.search_products(
+            terms, offset=offset, limit=self.inline_page_size + 1
+        )
+        has_more = len(rows) > self.inline_page_size
+        rows = rows[: self.inline_page_size]
+
+        results = []
+        for row in rows:
+            caption = self.build_caption(
+                strategy_type=CaptionStrategyType.PRODUCT,
+                args=ProductCaptionArgs(product=row),
+            )
+            results.append(
+                InlineQueryResultArticle(
+                    id=str(row.id),
+                    title=row.name,
+                    description=row.description,
+                    thumb_width=48,
+                    thumb_height=48,
+                    input_message_content=InputTextMessageContent(
+                        message_text=f"🔍 {caption}"
+                    ),
+                )
+            )
+
+        page = InlineSearchPage(
+            results=results,
+            next_offset=str(offset + len(rows)) if has_more else "",
+        )
+        self.catalog_cache.search_pages.set(key, page)
+        return page
+
     async def get_product_image(
         self, product_id: int, product: Product
-    ) -> BufferedInputFile:
-        """Get product image file"""
-        if not product.image:
+    ) -> Optional[Union[str, BufferedInputFile]]:
+        """
+        Get product photo to send.
+
+        Returns the Telegram file id when the photo was already uploaded, so
+        Telegram reuses it instead of receiving the bytes again. Otherwise the
+        bytes are read from the database (products are loaded without them).
+        """
+        if product.image_file_id:
+            return product.image_file_id
+
+        image = await self.shop_service.get_product_image(product_id)
+        if not image:
             return None
 
-        return await ImageSelector.get_image_file(
-            product.image, f"product_{product_id}.jpg"
+        return await ImageSelector.get_image_file(image, f"product_{product_id}.jpg")
+
+    async def remember_image_file_id(
+        self, product: Product, message: Union[Message, bool, None]
+    ) -> None:
+        """Store the file id of a freshly uploaded product photo."""
+        if product.image_file_id or not isinstance(message, Message):
+            return
+        if not message.photo:
+            return
+
+        await self.update_product(
+            product.id, ProductUpdate(image_file_id=message.photo[-1].file_id)
         )
 
     def build_caption(self, strategy_type: CaptionStrategyType, args) -> str:
@@ -172,8 +280,27 @@ class CatalogService:
         strategy = self.caption_strategies.get(strategy_type)
         if not strategy:
             raise ValueError(f"Unknown caption strategy: {strategy_type}")
+
+        if strategy_type == CaptionStrategyType.PRODUCT and args.get("product"):
+            return self.catalog_cache.render(
+                args["product"],
+                (strategy_type, self.config.locale),
+                lambda: strategy.build(args),
+            )
         return strategy.build(args)
 
+    def get_catalog_keyboard(
+        self, product: Product, current_index: int, total_products: int, is_admin: bool
+    ) -> InlineKeyboardMarkup:
+        """Catalog keyboard for a product, rendered once per position and role"""
+        return self.catalog_cache.render(
+            product,
+            ("catalog_keyboard", current_index, total_products, is_admin),
+            lambda: get_catalog_keyboard(
+                current_index, product.id, total_products, is_admin
+            ),
+        )
+
     def build_caption_error(self, strategy_type: CaptionStrategyType, args) -> str:
         """Build caption using the specified strategy and typed args"""
         strategy = self.caption_strategies.get(strategy_type)
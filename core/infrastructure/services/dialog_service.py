@@ -1,68 +1,87 @@
 from contextlib import asynccontextmanager
 from dataclasses import dataclass
-from typing import AsyncIterator, List, Optional
+from typing import AsyncIterator, ClassVar, List, Optional
 
 from sqlalchemy.exc import IntegrityError, SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from config import AdminConfig
 from core.infrastructure.database import DatabaseManager
-from core.infrastructure.database.models import Dialog, Message
-from core.infrastructure.repositories import DialogRepository, MessageRepository
+from core.infrastructure.database.models import Dialog
+from core.infrastructure.i18n import DisplayFormatter
+from core.infrastructure.repositories import (
+    DialogRepository,
+    MessageArchiveRepository,
+    MessageRepository,
+)
 from core.internal.models import DialogCreate, DialogUpdate, MessageCreate
+from core.internal.types import HistoryMessage, unpack_history
 from logger import LoggerBuilder
 
 logger = LoggerBuilder("Dialog - Service").add_stream_handler().build()
 
+# Archive blocks fetched per query when history reaches archived messages
+ARCHIVE_BLOCKS_PER_READ = 4
+
 
 @dataclass(frozen=True)
-class DialogDisplayFormatter:
-    start_message: str = "💬 Вы начали диалог с поддержкой. Напишите ваше сообщение:"
-    end_dialog: str = "✅ Диалог завершен. Спасибо за обращение!"
+class DialogDisplayFormatter(DisplayFormatter):
+    prefix: ClassVar[str] = "dialog"
+
+    start_message: str
+    end_dialog: str
+
+    send_message: str
+    is_send: str
 
-    send_message: str = (
-        "✅ Сообщение отправлено! Ожидайте ответа.\n"
-        + "Если есть, что дополнить ✍️ введите текст сообщения:",
-    )
-    is_send: str = "✅ Ответ отправлен!"
+    hast_messages: str
+    hast_dialog: str
 
-    hast_messages: str = "📭 В диалоге пока нет сообщений"
-    hast_dialog: str = "❌ Диалог не найден"
+    start_dialog_error: str
+    history_error: str
+    message_send_error: str
+    apeals_error: str
+    answer_error: str
 
-    start_dialog_error: str = "❌ Не удалось создать диалог. Попробуйте позже."
-    history_error: str = "❌ Не удалось загрузить историю сообщений"
-    message_send_error: str = "❌ Не удалось отправить сообщение. Попробуйте еще раз."
-    apeals_error: str = "❌ Не удалось загрузить обращения."
-    answer_error: str = "❌ Не удалось отправить ответ."
+    apeals: str
+    hast_apeals: str
 
-    apeals: str = "Все поступившие обращения"
-    hast_apeals: str = "Новых обращений не поступило!"
+    sender_user: str
+    sender_support: str
 
-    async def get_dialogs_text(self, user_id: int, messages: List[Message]) -> str:
+    async def get_dialogs_text(
+        self, user_id: int, messages: List[HistoryMessage]
+    ) -> str:
         history = "\n\n".join(
-            f"{'Вы' if msg.sender_id == user_id else 'Поддержка'}: {msg.content}"
+            f"{self.sender_user if msg.sender_id == user_id else self.sender_support}: "
+            f"{msg.content}"
             for msg in messages
         )
 
         return history
 
-    async def get_message_text(self, username: str, messages: List[Message]) -> str:
+    async def get_message_text(
+        self, username: str, messages: List[HistoryMessage]
+    ) -> str:
         res = f"{username}: {'\n'.join(map(lambda x: x.content, messages))}"
         return res
 
     async def get_answer_text(self, answer: str) -> str:
-        res = (
-            "Вы получили ответ на ваше обращение. Для деталей /startdialog '📋 Показать историю'\n"
-            + f"{answer if len(answer) < 20 else f'{answer[:20]}...'}"
+        return self.text(
+            "answer", answer=answer if len(answer) < 20 else f"{answer[:20]}..."
         )
-        return res
 
 
 class DialogService:
-    def __init__(self, db_manager: DatabaseManager, admin_config: AdminConfig):
+    def __init__(
+        self,
+        db_manager: DatabaseManager,
+        admin_config: AdminConfig,
+        formatter: DialogDisplayFormatter,
+    ):
         self._db_manager = db_manager
         self._admin_config = admin_config
-        self._formatter = DialogDisplayFormatter()
+        self._formatter = formatter
 
     @property
     def db_manager(self) -> DatabaseManager:
@@ -141,61 +160,72 @@ class DialogService:
                 raise
 
     async def create_message(
-        self, message_id: int, dialog_id: int, sender_id: int, content: str
-    ) -> Message:
+        self,
+        chat_id: int,
+        telegram_message_id: int,
+        dialog_id: int,
+        sender_id: int,
+        content: str,
+        *,
+        mark_unread: bool = True,
+    ) -> Optional[int]:
         """
         Create a new message in a dialog.
 
         Args:
+            chat_id: Chat the Telegram message was sent in
+            telegram_message_id: Telegram message id, unique within the chat
             dialog_id: ID of the dialog
             sender_id: Telegram ID of the message sender
             content: Message text content
+            mark_unread: Flag the dialog as unread for the admin
 
         Returns:
-            Message: Created message
+            Optional[int]: ID of the created message, None if the Telegram
+            message was already stored
 
         Raises:
-            ValueError: If message creation fails or dialog not found
+            ValueError: If the dialog is not found
         """
         async with self._get_session() as session:
-            # First check if dialog exists
+            message_repo = self.db_manager.get_repo(MessageRepository, session)
             dialog_repo = self.db_manager.get_repo(DialogRepository, session)
-            dialog = await dialog_repo.get(dialog_id)
-            if not dialog:
-                raise ValueError(f"Dialog with ID {dialog_id} not found")
 
-            try:
-                message_repo = self.db_manager.get_repo(MessageRepository, session)
-                message = await message_repo.create(
-                    MessageCreate(
-                        id=message_id,
-                        dialog_id=dialog_id,
-                        sender_id=sender_id,
-                        content=content,
-                    )
+            message_id = await message_repo.add(
+                MessageCreate(
+                    chat_id=chat_id,
+                    telegram_message_id=telegram_message_id,
+                    dialog_id=dialog_id,
+                    sender_id=sender_id,
+                    content=content,
                 )
-                await dialog_repo.update(dialog_id, DialogUpdate(is_read=False))
-                logger.info(f"Created message ID: {message.id} in dialog {dialog_id}")
-                return message
-            except IntegrityError as e:
-                await session.rollback()
-                logger.error(f"Message creation failed: {str(e)}")
-                raise ValueError("Failed to create message") from e
+            )
+            if message_id is None:
+                if not await dialog_repo.exists(dialog_id):
+                    raise ValueError(f"Dialog with ID {dialog_id} not found")
+                logger.info(
+                    f"Message {chat_id}:{telegram_message_id} is already stored"
+                )
+                return None
+
+            if mark_unread:
+                await dialog_repo.mark_unread(dialog_id)
+            logger.info(f"Created message ID: {message_id} in dialog {dialog_id}")
+            return message_id
 
     async def get_messages_for_user_in_dialog(
-        self, dialog_id: int, user_id: int, *, skip: int = 0, limit: int = 100
-    ) -> List[Message]:
+        self, dialog_id: int, user_id: int, *, limit: int = 100
+    ) -> List[HistoryMessage]:
         """
-        Get all messages in a dialog for a specific user.
+        Get the latest messages of a dialog for a specific user.
 
         Args:
             dialog_id: ID of the dialog
             user_id: Telegram ID of the user
-            skip: Number of messages to skip (for pagination)
             limit: Maximum number of messages to return
 
         Returns:
-            List[Message]: List of messages in the dialog
+            List[HistoryMessage]: Up to ``limit`` latest messages, oldest first
 
         Raises:
             ValueError: If dialog not found
@@ -211,19 +241,43 @@ class DialogService:
             if user_id not in (dialog.user1_id, dialog.user2_id):
                 raise ValueError(f"User {user_id} is not part of dialog {dialog_id}")
 
-            message_repo = self.db_manager.get_repo(MessageRepository, session)
-
-            # Get all messages in dialog
-            messages = await message_repo.get_multi(
-                skip=skip,
-                limit=limit,
-                filters={"dialog_id": dialog_id},
-                order_by="created_at ASC",  # Oldest first
-            )
-
+            messages = await self._read_history(session, dialog_id, limit)
             logger.info(f"Retrieved {len(messages)} messages from dialog {dialog_id}")
             return messages
 
+    async def get_history(
+        self, dialog_id: int, *, limit: int = 100
+    ) -> List[HistoryMessage]:
+        """Up to ``limit`` latest messages of a dialog, oldest first."""
+        async with self._get_session() as session:
+            return await self._read_history(session, dialog_id, limit)
+
+    async def _read_history(
+        self, session: AsyncSession, dialog_id: int, limit: int
+    ) -> List[HistoryMessage]:
+        # Live messages first; archive blocks are only unpacked for older ones
+        message_repo = self.db_manager.get_repo(MessageRepository, session)
+        history = [
+            HistoryMessage(*row)
+            for row in await message_repo.get_recent(dialog_id, limit)
+        ]
+
+        archive_repo = self.db_manager.get_repo(MessageArchiveRepository, session)
+        before = None
+        while len(history) < limit:
+            blocks = await archive_repo.get_recent(
+                dialog_id, ARCHIVE_BLOCKS_PER_READ, before=before
+            )
+            for block in blocks:
+                history.extend(reversed(unpack_history(block.payload)))
+            if len(blocks) < ARCHIVE_BLOCKS_PER_READ:
+                break
+            before = (blocks[-1].last_created_at, blocks[-1].id)
+
+        del history[limit:]
+        history.reverse()
+        return history
+
     async def get_user_dialogs(self, user_id: int) -> List[Dialog]:
         """
         Get all dialogs for a specific user.
@@ -239,7 +293,7 @@ class DialogService:
 
             dialogs = await dialog_repo.get_multi(
                 filters={"or": [{"user1_id": user_id}, {"user2_id": user_id}]},
-                order_by="updated_at DESC",  # Most recently updated first
+                order_by="updated_at DESC, id DESC",  # Most recently updated first
             )
 
             logger.info(f"Retrieved {len(dialogs)} dialogs for user {user_id}")
@@ -276,11 +330,15 @@ class DialogService:
             dialog_repo = self.db_manager.get_repo(DialogRepository, session)
             return await dialog_repo.get(dialog_id)
 
-    async def get_dialogs_text(self, user_id: int, messages: List[Message]) -> str:
+    async def get_dialogs_text(
+        self, user_id: int, messages: List[HistoryMessage]
+    ) -> str:
         history = await self._formatter.get_dialogs_text(user_id, messages)
         return f"📜 История сообщений:\n\n{history}"
 
-    async def get_message_text(self, username: str, messages: List[Message]) -> str:
+    async def get_message_text(
+        self, username: str, messages: List[HistoryMessage]
+    ) -> str:
         return await self._formatter.get_message_text(username, messages)
 
     async def get_answer_text(self, answer: str) -> str:
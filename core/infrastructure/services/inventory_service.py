@@ -0,0 +1,48 @@
+from typing import ClassVar, Optional
+
+from config import InventoryConfig
+from core.infrastructure.database import DatabaseManager
+from core.infrastructure.jobs import PeriodicJob
+from core.infrastructure.repositories import OrderRepository, ProductRepository
+from logger import LoggerBuilder
+
+logger = LoggerBuilder("Inventory - Service").add_stream_handler().build()
+
+
+class InventoryService(PeriodicJob):
+    """
+    Returns stock reserved by cancelled orders.
+
+    Checkout takes stock for every tracked line and marks the order
+    ``stock_reserved``. ``run`` periodically clears that flag on cancelled
+    orders and adds their quantities back in the same transaction, so stock
+    is returned exactly once however often an order is cancelled.
+    """
+
+    job_name: ClassVar[str] = "stock_release"
+
+    def __init__(
+        self,
+        db_manager: DatabaseManager,
+        config: Optional[InventoryConfig] = None,
+    ):
+        self.config = config or InventoryConfig()
+        super().__init__(db_manager, self.config.poll_interval)
+
+    async def run_batch(self) -> bool:
+        return await self.release_cancelled() >= self.config.batch_size
+
+    async def release_cancelled(self) -> int:
+        """Return the stock of one batch of cancelled orders, returns their count."""
+        async with self._get_session() as session:
+            order_repo = self.db_manager.get_repo(OrderRepository, session)
+            product_repo = self.db_manager.get_repo(ProductRepository, session)
+
+            order_ids = await order_repo.take_cancelled_reservations(
+                self.config.batch_size
+            )
+            await product_repo.release_stock(order_ids)
+
+        if order_ids:
+            logger.info(f"Released stock of cancelled orders: {order_ids}")
+        return len(order_ids)
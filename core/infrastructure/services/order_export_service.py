@@ -0,0 +1,160 @@
+import asyncio
+import csv
+import gzip
+import os
+import tempfile
+from contextlib import asynccontextmanager
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any, AsyncIterator, List, Optional, Sequence, Tuple
+
+from sqlalchemy import Row
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from core.infrastructure.database import DatabaseManager
+from core.infrastructure.repositories import OrderRepository
+from core.internal.types import OrderExport
+from logger import LoggerBuilder
+
+from .analytics_service import StatsDisplayFormatter
+
+logger = LoggerBuilder("OrderExport - Service").add_stream_handler().build()
+
+EXPORT_COLUMNS = (
+    "order_id",
+    "created_at",
+    "status",
+    "user_id",
+    "order_total",
+    "order_items",
+    "delivery_address",
+    "product_id",
+    "product_name",
+    "unit_price",
+    "quantity",
+    "line_total",
+)
+
+
+class OrderExportService:
+    """
+    Exports the order history, one CSV row per order line, gzip-compressed.
+
+    Rows are streamed from ``OrderRepository.stream_lines`` in chunks; every
+    chunk is transposed to columns, converted column by column and written
+    before the next one is read, so memory stays flat however long the
+    history is. Unit prices are the current product prices.
+    """
+
+    def __init__(
+        self,
+        db_manager: DatabaseManager,
+        formatter: StatsDisplayFormatter,
+        *,
+        chunk_size: int = 1000,
+    ):
+        self._db_manager = db_manager
+        self._formatter = formatter
+        self.chunk_size = chunk_size
+
+    @property
+    def db_manager(self) -> DatabaseManager:
+        return self._db_manager
+
+    @property
+    def formatter(self) -> StatsDisplayFormatter:
+        return self._formatter
+
+    @asynccontextmanager
+    async def _get_session(self) -> AsyncIterator[AsyncSession]:
+        async with self.db_manager.get_db_session() as session:
+            try:
+                yield session
+            except SQLAlchemyError as e:
+                logger.error(f"Database operation failed: {str(e)}")
+                raise
+
+    @asynccontextmanager
+    async def export_orders(
+        self, days: Optional[int] = None
+    ) -> AsyncIterator[OrderExport]:
+        """Temporary export of the last ``days`` days (all orders if None)."""
+        now = datetime.now(timezone.utc).replace(tzinfo=None)
+        since = now - timedelta(days=days) if days is not None else None
+
+        fd, name = tempfile.mkstemp(prefix="orders_", suffix=".csv.gz")
+        os.close(fd)
+        path = Path(name)
+        try:
+            orders, rows = await self._write_csv(path, since)
+            logger.info(f"Exported {orders} orders ({rows} rows) to {path}")
+            yield OrderExport(
+                path=path,
+                filename=f"orders_{now:%Y%m%d_%H%M}.csv.gz",
+                since=since,
+                orders=orders,
+                rows=rows,
+            )
+        finally:
+            path.unlink(missing_ok=True)
+
+    async def _write_csv(
+        self, path: Path, since: Optional[datetime]
+    ) -> Tuple[int, int]:
+        orders = rows = 0
+        last_order_id = None
+
+        async with self._get_session() as session:
+            repo = self.db_manager.get_repo(OrderRepository, session)
+            with gzip.open(path, "wt", encoding="utf-8", newline="") as fp:
+                writer = csv.writer(fp)
+                writer.writerow(EXPORT_COLUMNS)
+                async for chunk in repo.stream_lines(
+                    since=since, chunk_size=self.chunk_size
+                ):
+                    columns = self._to_columns(chunk)
+                    order_ids = columns[0]
+                    # Lines of one order are adjacent, but may span two chunks
+                    orders += len(set(order_ids)) - (order_ids[0] == last_order_id)
+                    last_order_id = order_ids[-1]
+                    rows += len(chunk)
+                    # Compression is CPU work: keep it off the event loop
+                    await asyncio.to_thread(writer.writerows, zip(*columns))
+        return orders, rows
+
+    @staticmethod
+    def _to_columns(chunk: Sequence[Row]) -> List[Sequence[Any]]:
+        (
+            order_ids,
+            created_at,
+            statuses,
+            user_ids,
+            order_totals,
+            order_items,
+            addresses,
+            product_ids,
+            product_names,
+            prices,
+            quantities,
+        ) = zip(*chunk)
+        return [
+            order_ids,
+            [
+                moment.isoformat(sep=" ", timespec="seconds") if moment else None
+                for moment in created_at
+            ],
+            [status.name for status in statuses],
+            user_ids,
+            order_totals,
+            order_items,
+            addresses,
+            product_ids,
+            product_names,
+            prices,
+            quantities,
+            [
+                price * quantity if price is not None and quantity is not None else None
+                for price, quantity in zip(prices, quantities)
+            ],
+        ]
@@ -1,61 +1,119 @@
 from contextlib import asynccontextmanager
 from dataclasses import dataclass
-from typing import Any, AsyncIterator, Dict, List, Optional
+from typing import Any, AsyncIterator, ClassVar, Dict, List, Optional, Tuple
 
-from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.exc import IntegrityError, SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from core.infrastructure.cache import CartCache
 from core.infrastructure.database import DatabaseManager
-from core.infrastructure.database.models import Order
-from core.infrastructure.repositories import OrderRepository, ProductRepository
+from core.infrastructure.database.models import Order, ProductOrder
+from core.infrastructure.i18n import DisplayFormatter
+from core.infrastructure.repositories import (
+    OrderRepository,
+    OrderStatusEventRepository,
+    OutboxRepository,
+    ProductRepository,
+    ShopCardItemRepository,
+    ShopCardRepository,
+)
 from core.internal.enums import OrderStatus
-from core.internal.models import OrderCreate, OrderUpdate
-from core.internal.types import ShopCardContent
+from core.internal.models import (
+    OrderCreate,
+    OrderStatusEventCreate,
+    OrderUpdate,
+    OutboxMessageCreate,
+)
+from core.internal.types import CartLine, OrderCursor, OrderQueuePage
 from logger import LoggerBuilder
 from utils import StringBuilder
 
 logger = LoggerBuilder("OrderService - Service").add_stream_handler().build()
 
 
+class OutOfStockError(ValueError):
+    """Checkout asked for more units than are in stock."""
+
+    def __init__(self, products: List[str]):
+        super().__init__(f"Not enough stock: {', '.join(products)}")
+        self.products = products
+
+
+class OrderStatusError(ValueError):
+    """The order is cancelled; its stock was returned and it cannot move on."""
+
+    def __init__(self, order_id: int):
+        super().__init__(f"Order {order_id} is cancelled")
+        self.order_id = order_id
+
+
 @dataclass(frozen=True)
-class OrderDisplayFormatter:
-    no_exist: str = "📦 У вас пока нет заказов"
+class OrderDisplayFormatter(DisplayFormatter):
+    prefix: ClassVar[str] = "order"
+
+    no_exist: str
 
-    error: str = "❌ Ошибка при оформлении заказа"
-    error_address: str = "❌ Ошибка при обработке адреса"
-    error_note: str = "❌ Ошибка при обработке комментария"
+    error: str
+    error_address: str
+    error_note: str
 
-    input_address: str = (
-        "🏠 Теперь введите адрес доставки:\n(Укажите город, улицу, дом и квартиру)"
-    )
+    input_address: str
 
-    order_received = "Поступившие заказы на обработку:"
-    order_status_change = "Статус заказа изменён"
+    order_received: str
+    order_delivered: str
+    order_status_change: str
+    status_final: str
+
+    async def get_queue_title(
+        self, status: OrderStatus, counts: Dict[OrderStatus, int]
+    ) -> str:
+        titles = {
+            OrderStatus.PENDING: self.order_received,
+            OrderStatus.DELIVERED: self.order_delivered,
+        }
+        title = titles.get(status) or self.text("queue_title", status=status.value)
+        summary = " · ".join(
+            f"{order_status.value}: {counts[order_status]}"
+            for order_status in OrderStatus
+            if counts.get(order_status)
+        )
+        return f"{title}\n📊 {summary}" if summary else title
+
+    async def get_status_changed_text(self, order: Order) -> str:
+        return self.text("status_changed", id=order.id, status=order.status.value)
+
+    async def get_out_of_stock_text(self, products: List[str]) -> str:
+        return self.text("out_of_stock", products=", ".join(products) or "—")
 
     async def get_text_confirm_order(self, order: Order) -> str:
-        return (
-            f"✅ Заказ #{order.id} успешно оформлен!\n\n"
-            f"Статус: {order.status.value}\n"
-            f"Сумма: {order.total_price} $\n"
-            f"Адрес: {order.delivery_address or 'не указан'}\n\n"
-            f"Мы свяжемся с вами для уточнения деталей."
+        return self.text(
+            "confirmed",
+            id=order.id,
+            status=order.status.value,
+            price=order.total_price,
+            address=order.delivery_address or self.text("no_address"),
         )
 
     async def get_text_orders(self, orders: List[Order]) -> str:
-        response = StringBuilder("📦 Ваши заказы:")
+        response = StringBuilder(self.text("list_title"))
         for order in orders:
             response.append("\n\n")
             response.append(
-                f"🆔 #{order.id} - {order.status.value}\n"
-                f"💳 {order.total_price} $ - {order.created_at.strftime('%d.%m.%Y')}\n"
-                f"🏠 {order.delivery_address or 'Адрес не указан'}\n"
-                f"📊 - {order.status.value}"
+                self.text(
+                    "list_item",
+                    id=order.id,
+                    status=order.status.value,
+                    price=order.total_price,
+                    date=order.created_at.strftime("%d.%m.%Y"),
+                    address=order.delivery_address or self.text("list_no_address"),
+                )
             )
         return response.to_string()
 
-    async def get_items_text(self, items: List[ShopCardContent]) -> str:
+    async def get_items_text(self, items: List[CartLine]) -> str:
         items_text = "\n".join(
-            f"{item.name} - {item.quantity} × {item.price} $" for item in items
+            self.text("item", name=item.name, quantity=item.quantity, price=item.price)
+            for item in items
         )
         return items_text
 
@@ -64,47 +122,56 @@ class OrderDisplayFormatter:
         items_text: str,
         total_price: float,
         address: str,
-        order_note: Optional[str] = "Не указан",
+        order_note: Optional[str] = None,
     ) -> str:
-        return (
-            f"📦 Подтвердите заказ:\n\n"
-            f"🛒 Состав заказа:\n{items_text}\n\n"
-            f"💳 Итого: {total_price} $\n\n"
-            f"🏠 Адрес доставки: {address}\n"
-            f"📝 Комментарий: {order_note}"
+        return self.text(
+            "confirm_prompt",
+            items=items_text,
+            price=total_price,
+            address=address,
+            note=order_note or self.text("no_note"),
         )
 
     async def get_text_order_price(self, price: float) -> str:
-        return (
-            f"💳 Оформление заказа на сумму: {price} $\n\n"
-            "📝 Введите комментарий к заказу (например, пожелания по доставке):\n"
-            "Или нажмите /skip чтобы пропустить"
-        )
+        return self.text("note_prompt", price=price)
 
     async def get_text_order(self, order: Order) -> str:
         product_text = StringBuilder()
         for product_order, product in zip(order.order_products, order.products):
             product_text.append("\n")
             product_text.append(
-                f"{product.name} - {product.price} × {product_order.product_quantity} = {product.price * product_order.product_quantity}$"
+                self.text(
+                    "product_line",
+                    name=product.name,
+                    price=product.price,
+                    quantity=product_order.product_quantity,
+                    total=product.price * product_order.product_quantity,
+                )
             )
 
-        return (
-            f"✅ Заказ #{order.id} !\n\n"
-            f"Пользователь @{order.user.username}\n"
-            f"📦 Статус: {order.status.value}\n"
-            f"💳 Сумма: {order.total_price} $\n"
-            f"🏠 Адрес: {order.delivery_address or 'не указан'}\n"
-            f"📝 Комментарий: {order.order_note if order.order_note else 'не оставлен'}\n\n"
-            f"🛒 Предметы: \n{product_text}\n"
-            f"Общее кол-во: {order.total_count}"
+        return self.text(
+            "details",
+            id=order.id,
+            username=order.user.username,
+            status=order.status.value,
+            price=order.total_price,
+            address=order.delivery_address or self.text("no_address"),
+            note=order.order_note if order.order_note else self.text("no_comment"),
+            products=product_text.to_string(),
+            count=order.total_count,
         )
 
 
 class OrderService:
-    def __init__(self, db_manager: DatabaseManager):
+    def __init__(
+        self,
+        db_manager: DatabaseManager,
+        formatter: OrderDisplayFormatter,
+        cart_cache: Optional[CartCache] = None,
+    ):
         self._db_manager = db_manager
-        self._display_formatter = OrderDisplayFormatter()
+        self._display_formatter = formatter
+        self._cart_cache = cart_cache
 
     @property
     def db_manager(self) -> DatabaseManager:
@@ -126,8 +193,6 @@ class OrderService:
 
     async def create_order(self, order_data: OrderCreate) -> Order:
         async with self._get_session() as session:
-            product_repo = self.db_manager.get_repo(ProductRepository, session)
-            products = [await product_repo.get(p[0].id) for p in order_data.products]
             order = Order(
                 user_id=order_data.user_id,
                 total_price=order_data.total_price,
@@ -135,20 +200,97 @@ class OrderService:
                 delivery_address=order_data.delivery_address,
                 order_note=order_data.order_note,
                 status=order_data.status,
-                products=products,
             )
-
             session.add(order)
-
-            for order_product in order.order_products:
-                for product, quantity in order_data.products:
-                    if product.id == order_product.product_id:
-                        order_product.product_quantity = quantity
-                        break
+            await session.flush()
+
+            # Lines are written by id: products (and their images) are not loaded
+            session.add_all(
+                ProductOrder(
+                    order_id=order.id,
+                    product_id=product_id,
+                    product_quantity=quantity,
+                )
+                for product_id, quantity in order_data.products or ()
+            )
 
             await session.commit()
             return order
 
+    async def checkout(
+        self,
+        user_id: int,
+        checkout_key: str,
+        *,
+        delivery_address: Optional[str] = None,
+        order_note: Optional[str] = None,
+    ) -> Tuple[Optional[Order], bool]:
+        """
+        Turn the user's cart into an order in one transaction.
+
+        The order, its lines (copied from the cart items) and the emptied cart
+        are committed together. ``checkout_key`` identifies the confirmation:
+        a retry with the same key returns the order it created without
+        writing anything.
+
+        The cart row stays locked until the transaction ends, so concurrent
+        confirmations of one cart run one after the other. Stock of tracked
+        products is reserved in the same transaction; if a product is short
+        it is rolled back and ``OutOfStockError`` is raised.
+        Lines of products deleted since they were added are dropped first.
+
+        Returns the order and whether this call created it; ``(None, False)``
+        when the cart is empty.
+        """
+        order: Optional[Order] = None
+        shortages: List[str] = []
+        try:
+            async with self._get_session() as session:
+                order_repo = self.db_manager.get_repo(OrderRepository, session)
+                card_repo = self.db_manager.get_repo(ShopCardRepository, session)
+                item_repo = self.db_manager.get_repo(ShopCardItemRepository, session)
+                card = await card_repo.get_active_card(user_id, for_update=True)
+                # Looked up under the cart lock: a concurrent confirmation with
+                # the same key has committed (or rolled back) by now
+                if order := await order_repo.get_by_checkout_key(checkout_key):
+                    return order, False
+                if card:
+                    await card_repo.drop_inactive_lines(card.id)
+                    await session.refresh(card)
+                if not card or not card.items_count:
+                    return None, False
+
+                product_repo = self.db_manager.get_repo(ProductRepository, session)
+                reserved = await product_repo.reserve_stock(card.id)
+                if reserved is None:
+                    shortages = await product_repo.get_shortages(card.id)
+                    await session.rollback()
+                else:
+                    order = await order_repo.create_from_card(
+                        card,
+                        checkout_key=checkout_key,
+                        delivery_address=delivery_address,
+                        order_note=order_note,
+                        stock_reserved=reserved > 0,
+                    )
+                    await item_repo.delete_by_card(card.id)
+                    await card_repo.reset_totals(card.id)
+        except IntegrityError:
+            # A concurrent retry with the same key committed first
+            async with self._get_session() as session:
+                order_repo = self.db_manager.get_repo(OrderRepository, session)
+                order = await order_repo.get_by_checkout_key(checkout_key)
+            if order is None:
+                raise
+            return order, False
+
+        if order is None:
+            raise OutOfStockError(shortages)
+        if self._cart_cache is not None:
+            self._cart_cache.invalidate(user_id)
+        logger.info(f"Created order ID: {order.id} from the cart of user {user_id}")
+        return order, True
+
     async def get_order(self, order_id: int) -> Optional[Order]:
         async with self._get_session() as session:
             repo = self.db_manager.get_repo(OrderRepository, session)
@@ -172,6 +314,47 @@ class OrderService:
                 skip=skip, limit=limit, filters=filters, order_by=order_by
             )
 
+    async def get_order_queue(
+        self,
+        status: OrderStatus,
+        *,
+        page: int = 0,
+        after: Optional[OrderCursor] = None,
+        before: Optional[OrderCursor] = None,
+        page_size: int = 3,
+    ) -> OrderQueuePage:
+        """
+        Page of the admin order queue for ``status`` with per-status counts.
+
+        One extra row is read to know whether the queue continues in the
+        direction being paged.
+        """
+        async with self._get_session() as session:
+            repo = self.db_manager.get_repo(OrderRepository, session)
+            rows = await repo.get_queue(
+                status, after=after, before=before, limit=page_size + 1
+            )
+            counts = await repo.count_by_status()
+
+        has_more = len(rows) > page_size
+        if before is not None:
+            return OrderQueuePage(
+                status=status,
+                items=rows[-page_size:],
+                page=page if has_more else 0,
+                has_prev=has_more,
+                has_next=True,
+                counts=counts,
+            )
+        return OrderQueuePage(
+            status=status,
+            items=rows[:page_size],
+            page=page,
+            has_prev=after is not None,
+            has_next=has_more,
+            counts=counts,
+        )
+
     async def cancel_order(self, order_id: int) -> bool:
         await self.update_order(order_id, OrderUpdate(status=OrderStatus.PENDING))
 
@@ -182,10 +365,51 @@ class OrderService:
             repo = self.db_manager.get_repo(OrderRepository, session)
             return await repo.update(order_id, update_data)
 
-    async def update_order_status(self, order_id: int, status: OrderStatus):
+    async def update_order_status(
+        self, order_id: int, status: OrderStatus, changed_by: Optional[int] = None
+    ) -> Optional[Order]:
+        """
+        Change the order status.
+
+        The status, its history event and the customer notification (outbox)
+        are written in one transaction. The order row is locked while the old
+        status is read, so concurrent changes are recorded one after the other
+        with the right ``old_status``. Setting the current status again is a
+        no-op; returns None if the order does not exist or did not change.
+
+        A cancelled order is final: its reserved stock is returned by
+        ``InventoryService``, so moving it on would sell stock it no longer
+        holds. ``OrderStatusError`` is raised instead.
+        """
         async with self._get_session() as session:
             repo = self.db_manager.get_repo(OrderRepository, session)
-            return await repo.update_status(order_id, status)
+            old_status = await repo.get_status(order_id, for_update=True)
+            if old_status is None or old_status == status:
+                return None
+            if old_status == OrderStatus.CANCELLED:
+                raise OrderStatusError(order_id)
+
+            order = await repo.update_status(order_id, status)
+            event_repo = self.db_manager.get_repo(OrderStatusEventRepository, session)
+            await event_repo.create(
+                OrderStatusEventCreate(
+                    order_id=order_id,
+                    old_status=old_status,
+                    new_status=status,
+                    changed_by=changed_by,
+                )
+            )
+            outbox_repo = self.db_manager.get_repo(OutboxRepository, session)
+            await outbox_repo.create(
+                OutboxMessageCreate(
+                    chat_id=order.user_id,
+                    text=await self.formatter.get_status_changed_text(order),
+                )
+            )
+            logger.info(
+                f"Order ID: {order_id} status {old_status.name} -> {status.name}"
+            )
+            return order
 
     async def get_text_orders(self, orders: List[Order]) -> str:
         return await self._display_formatter.get_text_orders(orders)
@@ -195,10 +419,10 @@ class OrderService:
 
     async def get_text_for_confirm(
         self,
-        items: List[ShopCardContent],
+        items: List[CartLine],
         total_price: float,
         address: str,
-        order_note: Optional[str] = "Не указан",
+        order_note: Optional[str] = None,
     ) -> str:
         items_text = await self._display_formatter.get_items_text(items)
 
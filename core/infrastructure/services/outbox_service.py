@@ -0,0 +1,122 @@
+import asyncio
+from datetime import datetime, timedelta, timezone
+from typing import ClassVar, List, Optional, Tuple
+
+from aiogram import Bot
+from aiogram.exceptions import (
+    TelegramAPIError,
+    TelegramBadRequest,
+    TelegramForbiddenError,
+)
+
+from config import OutboxConfig
+from core.infrastructure.cache import UserCache
+from core.infrastructure.database import DatabaseManager
+from core.infrastructure.database.models import OutboxMessage
+from core.infrastructure.jobs import PeriodicJob
+from core.infrastructure.repositories import OutboxRepository, UserRepository
+from core.internal.enums import SendPriority
+from logger import LoggerBuilder
+from utils import send_priority
+
+logger = LoggerBuilder("Outbox - Service").add_stream_handler().build()
+
+SendResult = Tuple[OutboxMessage, Optional[TelegramAPIError]]
+
+
+def _utcnow() -> datetime:
+    # Matches func.now() of the server defaults: naive UTC
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
+class OutboxService(PeriodicJob):
+    """
+    Delivers outbox messages in the background.
+
+    Other services write ``OutboxMessage`` rows in the same transaction as the
+    change they announce, so a notification exists exactly when the change was
+    committed, and a Telegram outage only delays it. ``run`` drains due
+    messages in batches: a failed send is retried with exponential backoff up
+    to ``max_attempts``; users who blocked the bot are not retried. Delivery is
+    at-least-once, a crash between sending and saving the batch resends it.
+    """
+
+    job_name: ClassVar[str] = "outbox"
+
+    def __init__(
+        self,
+        db_manager: DatabaseManager,
+        config: Optional[OutboxConfig] = None,
+        user_cache: Optional[UserCache] = None,
+    ):
+        self.config = config or OutboxConfig()
+        super().__init__(db_manager, self.config.poll_interval)
+        self._user_cache = user_cache
+
+    async def run_batch(self, bot: Bot) -> bool:
+        return await self.drain(bot) >= self.config.batch_size
+
+    async def drain(self, bot: Bot) -> int:
+        """Send one batch of due messages. Returns the number of messages tried."""
+        async with self._get_session() as session:
+            repo = self.db_manager.get_repo(OutboxRepository, session)
+            messages = await repo.get_due(_utcnow(), self.config.batch_size)
+        if not messages:
+            return 0
+
+        with send_priority(SendPriority.NOTIFICATION):
+            results = await asyncio.gather(
+                *(self._send_one(bot, message) for message in messages)
+            )
+        await self._save_results(results)
+        return len(messages)
+
+    @staticmethod
+    async def _send_one(bot: Bot, message: OutboxMessage) -> SendResult:
+        try:
+            await bot.send_message(chat_id=message.chat_id, text=message.text)
+            return message, None
+        except TelegramAPIError as e:
+            return message, e
+
+    def _retry_delay(self, attempts: int) -> timedelta:
+        delay = self.config.retry_delay * 2**attempts
+        return timedelta(seconds=min(delay, self.config.max_retry_delay))
+
+    async def _save_results(self, results: List[SendResult]) -> None:
+        now = _utcnow()
+        sent = [message.id for message, error in results if error is None]
+        blocked = [
+            message.chat_id
+            for message, error in results
+            if isinstance(error, TelegramForbiddenError)
+        ]
+
+        async with self._get_session() as session:
+            outbox_repo = self.db_manager.get_repo(OutboxRepository, session)
+            user_repo = self.db_manager.get_repo(UserRepository, session)
+
+            await outbox_repo.mark_sent(sent, now)
+            for message, error in results:
+                if error is None:
+                    continue
+                # Blocked bot or a chat that does not exist: retrying cannot help
+                give_up = (
+                    isinstance(error, (TelegramForbiddenError, TelegramBadRequest))
+                    or message.attempts + 1 >= self.config.max_attempts
+                )
+                logger.warning(
+                    f"Outbox message ID: {message.id} to {message.chat_id} failed "
+                    f"(attempt {message.attempts + 1}"
+                    f"{', giving up' if give_up else ''}): {error}"
+                )
+                await outbox_repo.mark_attempt_failed(
+                    message.id,
+                    str(error),
+                    next_attempt_at=now + self._retry_delay(message.attempts),
+                    give_up=give_up,
+                )
+            await user_repo.mark_blocked(blocked)
+
+        if self._user_cache is not None:
+            self._user_cache.forget(blocked)
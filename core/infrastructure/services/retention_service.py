@@ -0,0 +1,87 @@
+from collections import defaultdict
+from datetime import datetime, timedelta, timezone
+from typing import ClassVar, Dict, List, Optional
+
+from config import RetentionConfig
+from core.infrastructure.database import DatabaseManager
+from core.infrastructure.jobs import PeriodicJob
+from core.infrastructure.repositories import (
+    MessageArchiveRepository,
+    MessageRepository,
+)
+from core.internal.models import MessageArchiveCreate
+from core.internal.types import HistoryMessage, pack_history
+from logger import LoggerBuilder
+
+logger = LoggerBuilder("Retention - Service").add_stream_handler().build()
+
+
+class RetentionService(PeriodicJob):
+    """
+    Moves old dialog messages out of the hot ``messages`` table.
+
+    ``run`` takes messages past ``archive_after_days`` in batches, walking
+    dialogs in id order and each dialog oldest first; every batch is written
+    as one compressed ``message_archives`` block per dialog and deleted from
+    ``messages`` in the same transaction, so a message is always in exactly
+    one of the two tables. History views read ``messages`` first and only
+    unpack archive blocks for older pages.
+    """
+
+    job_name: ClassVar[str] = "message_archive"
+
+    def __init__(
+        self,
+        db_manager: DatabaseManager,
+        config: Optional[RetentionConfig] = None,
+    ):
+        self.config = config or RetentionConfig()
+        super().__init__(db_manager, self.config.poll_interval)
+        # Dialog the current pass has reached
+        self._dialog_cursor = 0
+
+    async def run_batch(self) -> bool:
+        return await self.archive_batch() >= self.config.batch_size
+
+    async def archive_batch(self) -> int:
+        """Archive one batch of old messages, returns how many were moved."""
+        cutoff = datetime.now(timezone.utc).replace(tzinfo=None) - timedelta(
+            days=self.config.archive_after_days
+        )
+
+        async with self._get_session() as session:
+            message_repo = self.db_manager.get_repo(MessageRepository, session)
+            archive_repo = self.db_manager.get_repo(MessageArchiveRepository, session)
+
+            rows = await message_repo.get_archivable(
+                cutoff, self.config.batch_size, from_dialog_id=self._dialog_cursor
+            )
+            by_dialog: Dict[int, List[HistoryMessage]] = defaultdict(list)
+            for id, dialog_id, sender_id, content, created_at in rows:
+                by_dialog[dialog_id].append(
+                    HistoryMessage(id, sender_id, content, created_at)
+                )
+
+            await archive_repo.add_many(
+                [
+                    MessageArchiveCreate(
+                        dialog_id=dialog_id,
+                        messages_count=len(messages),
+                        first_created_at=messages[0].created_at,
+                        last_created_at=messages[-1].created_at,
+                        payload=pack_history(messages),
+                    )
+                    for dialog_id, messages in by_dialog.items()
+                ]
+            )
+            await message_repo.delete_many([row.id for row in rows])
+
+        # A short batch means every dialog was visited: start the next pass over
+        self._dialog_cursor = (
+            rows[-1].dialog_id if len(rows) == self.config.batch_size else 0
+        )
+        if rows:
+            logger.info(
+                f"Archived {len(rows)} messages of {len(by_dialog)} dialogs"
+            )
+        return len(rows)
@@ -1,28 +1,30 @@
 from contextlib import asynccontextmanager
-from functools import reduce
 from typing import AsyncIterator, List, Optional
 
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from core.infrastructure.cache import CartCache
 from core.infrastructure.database import DatabaseManager
 from core.infrastructure.database.models import ShopCard, ShopCardItem
-from core.infrastructure.repositories import ShopCardItemRepository, ShopCardRepository
-from core.internal.models import (
-    ProductItem,
-    ShopCardCreate,
-    ShopCardItemCreate,
-    ShopCardItemUpdate,
+from core.infrastructure.repositories import (
+    ProductRepository,
+    ShopCardItemRepository,
+    ShopCardRepository,
 )
-from core.internal.types import ShopCardContent, ShopCardTotal
+from core.internal.models import ShopCardItemCreate, ShopCardItemUpdate
+from core.internal.types import CartLine, ShopCardTotal
 from logger import LoggerBuilder
 
 logger = LoggerBuilder("ShopCard - Service").add_stream_handler().build()
 
 
 class ShopCardService:
-    def __init__(self, db_manager: DatabaseManager):
+    def __init__(
+        self, db_manager: DatabaseManager, cart_cache: Optional[CartCache] = None
+    ):
         self._db_manager = db_manager
+        self._cart_cache = cart_cache or CartCache()
 
     @property
     def db_manager(self) -> DatabaseManager:
@@ -48,16 +50,7 @@ class ShopCardService:
         """
         async with self._get_session() as session:
             repo = self.db_manager.get_repo(ShopCardRepository, session)
-
-            card = await repo.get_active_card(user_id)
-
-            if not card:
-                card = await repo.create(ShopCardCreate(user_id=user_id))
-                logger.info(f"Created new shop card for user {user_id}")
-            else:
-                logger.debug(f"Found existing shop card for user {user_id}")
-
-            return card
+            return await repo.get_or_create(user_id)
 
     async def add_to_card(
         self, user_id: int, item_data: ShopCardItemCreate
@@ -71,91 +64,157 @@ class ShopCardService:
             ShopCardItem: Созданный или обновленный элемент корзины
         """
         async with self._get_session() as session:
+            card_repo = self.db_manager.get_repo(ShopCardRepository, session)
             item_repo = self.db_manager.get_repo(ShopCardItemRepository, session)
+            product_repo = self.db_manager.get_repo(ProductRepository, session)
 
-            card = await self.get_or_create_card(user_id)
-            
-            existing_item = await item_repo.get_by_product(
-                card.id, item_data.product_id
+            card = await card_repo.get_or_create(user_id, for_update=True)
+            price = await product_repo.get_price(
+                item_data.product_id, active_only=True
             )
+            if price is None:
+                raise ValueError(f"Product {item_data.product_id} not found")
 
-            if existing_item:
-                existing_item.quantity += item_data.quantity
+            item, is_new_line = await item_repo.add_quantity(
+                card.id, item_data.product_id, item_data.quantity
+            )
+            if is_new_line:
                 logger.info(
-                    f"Updated quantity for product {item_data.product_id} in card {card.id}"
+                    f"Added new product {item_data.product_id} to card {card.id}"
                 )
             else:
-                existing_item = await item_repo.create(
-                    ShopCardItemCreate(
-                        shop_card_id=card.id,
-                        product_id=item_data.product_id,
-                        quantity=item_data.quantity,
-                    )
+                logger.info(
+                    f"Updated quantity for product {item_data.product_id} in card {card.id}"
                 )
 
-                logger.info(
-                    f"Added new product {item_data.product_id} to card {card.id}"
+            await card_repo.apply_delta(
+                card.id,
+                items=item_data.quantity,
+                lines=1 if is_new_line else 0,
+                price=price * item_data.quantity,
+            )
+
+        self._cart_cache.invalidate(user_id)
+        return item
+
+    async def get_card_total(self, user_id: int) -> ShopCardTotal:
+        """
+        Получает корзину с итогами и информацией о товарах.
+        Итоги читаются из корзины, результат кэшируется до следующего
+        изменения корзины. Строки удаленных товаров убираются из корзины
+        при чтении, итоги пересчитываются
+        Args:
+            user_id: ID пользователя
+        Returns:
+            ShopCardTotal: Итоги и список товаров в корзине
+        """
+        if (cart := self._cart_cache.get(user_id)) is not None:
+            return cart
+
+        async with self._get_session() as session:
+            repo = self.db_manager.get_repo(ShopCardRepository, session)
+            card = await repo.get_active_card(user_id)
+
+            if not card:
+                cart = ShopCardTotal(items_count=0, total_price=0.0)
+            else:
+                lines = await repo.get_lines(card.id)
+                if len(lines) != card.lines_count:
+                    # Some products were deleted since the cart was written
+                    dropped = await repo.drop_inactive_lines(card.id)
+                    await session.refresh(card)
+                    logger.info(
+                        f"Dropped {dropped} lines of deleted products from card {card.id}"
+                    )
+                cart = ShopCardTotal(
+                    items_count=card.items_count,
+                    lines_count=card.lines_count,
+                    total_price=card.total_price,
+                    items=[CartLine(*line) for line in lines],
                 )
 
-            return existing_item
+        self._cart_cache.set(user_id, cart)
+        return cart
 
-    async def get_card_contents(self, user_id: int) -> List[ShopCardContent]:
+    async def get_card_contents(self, user_id: int) -> List[CartLine]:
         """
         Получает содержимое корзины с информацией о товарах
         Args:
             user_id: ID пользователя
         Returns:
-            List[Dict]: Список товаров в корзине с деталями
+            List[CartLine]: Список товаров в корзине с деталями
+        """
+        cart = await self.get_card_total(user_id)
+        return cart.items
+
+    async def get_card_summary(self, user_id: int) -> ShopCardTotal:
+        """
+        Получает только итоги корзины, без загрузки товаров
+        Args:
+            user_id: ID пользователя
+        Returns:
+            ShopCardTotal: Итоги корзины (items может быть пустым)
         """
+        if (cart := self._cart_cache.get(user_id)) is not None:
+            return cart
+
         async with self._get_session() as session:
             repo = self.db_manager.get_repo(ShopCardRepository, session)
-            card = await repo.get_active_card_with_items(user_id)
+            card = await repo.get_active_card(user_id)
 
             if not card:
-                return []
-
-            return [
-                ShopCardContent(
-                    id=item.id,
-                    product_id=item.product_id,
-                    name=item.product.name,
-                    price=item.product.price,
-                    quantity=item.quantity,
-                    total=item.product.price * item.quantity,
-                    product=ProductItem.model_validate(item.product)
-                )
-                for item in card.items
-            ]
+                return ShopCardTotal(items_count=0, total_price=0.0)
+
+            return ShopCardTotal(
+                items_count=card.items_count,
+                lines_count=card.lines_count,
+                total_price=card.total_price,
+            )
 
     async def update_card_item(
-        self, item_id: int, update_data: ShopCardItemUpdate
+        self, user_id: int, item_id: int, update_data: ShopCardItemUpdate
     ) -> Optional[ShopCardItem]:
         """
         Обновляет элемент корзины
         Args:
+            user_id: ID пользователя, владельца корзины
             item_id: ID элемента корзины
             update_data: Данные для обновления
         Returns:
             Optional[ShopCardItem]: Обновленный элемент или None если не найден
         """
         async with self._get_session() as session:
+            card_repo = self.db_manager.get_repo(ShopCardRepository, session)
             repo = self.db_manager.get_repo(ShopCardItemRepository, session)
+            product_repo = self.db_manager.get_repo(ProductRepository, session)
+            card = await card_repo.get_active_card(user_id, for_update=True)
             item = await repo.get(item_id)
 
-            if not item:
+            if not card or not item or item.shop_card_id != card.id:
                 return None
 
-            shop_cart_item_update_data = ShopCardItemUpdate()
-
-            if update_data.quantity is not None:
-                shop_cart_item_update_data.quantity = update_data.quantity
-
+            old_price = await product_repo.get_price(item.product_id) or 0.0
+            new_quantity = (
+                update_data.quantity
+                if update_data.quantity is not None
+                else item.quantity
+            )
+            new_price = old_price
             if update_data.product_id is not None:
-                shop_cart_item_update_data.product_id = update_data.product_id
+                new_price = await product_repo.get_price(update_data.product_id) or 0.0
+            await card_repo.apply_delta(
+                item.shop_card_id,
+                items=new_quantity - item.quantity,
+                price=new_price * new_quantity - old_price * item.quantity,
+            )
 
-            item = await repo.update(item_id, shop_cart_item_update_data)
+            # Written with the transaction: repo.update would commit midway
+            item.quantity = new_quantity
+            if update_data.product_id is not None:
+                item.product_id = update_data.product_id
 
-            return item
+        self._cart_cache.invalidate(user_id)
+        return item
 
     async def remove_from_card(self, user_id: int, product_id: int) -> bool:
         """
@@ -170,17 +229,22 @@ class ShopCardService:
             card_repo = self.db_manager.get_repo(ShopCardRepository, session)
             item_repo = self.db_manager.get_repo(ShopCardItemRepository, session)
 
-            card = await card_repo.get_active_card(user_id)
+            card = await card_repo.get_active_card(user_id, for_update=True)
             if not card:
                 return False
 
-            item = await item_repo.get_by_product(card.id, product_id)
-            if not item:
+            quantity = await item_repo.remove_product(card.id, product_id)
+            if quantity is None:
                 return False
 
-            await item_repo.delete(item.id)
+            product_repo = self.db_manager.get_repo(ProductRepository, session)
+            price = await product_repo.get_price(product_id) or 0.0
+            await card_repo.apply_delta(
+                card.id, items=-quantity, lines=-1, price=-price * quantity
+            )
 
-            return True
+        self._cart_cache.invalidate(user_id)
+        return True
 
     async def clear_card(self, user_id: int) -> bool:
         """
@@ -192,44 +256,28 @@ class ShopCardService:
         """
         async with self._get_session() as session:
             repo = self.db_manager.get_repo(ShopCardRepository, session)
-            card = await repo.get_active_card_with_items(user_id)
+            item_repo = self.db_manager.get_repo(ShopCardItemRepository, session)
+            card = await repo.get_active_card(user_id)
 
             if not card:
                 return False
 
-            for item in card.items:
-                await session.delete(item)
-
+            await item_repo.delete_by_card(card.id)
+            await repo.reset_totals(card.id)
             await session.commit()
             logger.info(f"Cleared shop card for user {user_id}")
-            return True
-
-    async def get_card_total(self, user_id: int) -> ShopCardTotal:
-        """
-        Рассчитывает итоговую сумму корзины
-        Args:
-            user_id: ID пользователя
-        Returns:
-            Dict: Итоговая информация о корзине
-        """
-        contents = await self.get_card_contents(user_id)
-        total = sum(item.total for item in contents)
 
-        return ShopCardTotal(
-            items_count=reduce(lambda x, y: x.quantity + y.quantity, contents), 
-            total_price=total, 
-            items=contents
-        )
+        self._cart_cache.invalidate(user_id)
+        return True
 
-    async def get_total_caption(self, cart_contents: List[ShopCardContent]) -> str:
-        total = sum(item.total for item in cart_contents)
+    async def get_total_caption(self, cart: ShopCardTotal) -> str:
         response = ["🛒 Ваша корзина:"]
 
-        for item in cart_contents:
+        for item in cart.items:
             response.append(
                 f"{item.name} - {item.quantity} × {item.price} $ = {item.total} $"
             )
 
-        response.append(f"\n💳 Итого: {total} $")
+        response.append(f"\n💳 Итого: {cart.total_price} $")
         total_text_res = "\n".join(response)
-        return total_text_res
\ No newline at end of file
+        return total_text_res
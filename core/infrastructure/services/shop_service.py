@@ -1,26 +1,64 @@
 from contextlib import asynccontextmanager
-from typing import AsyncIterator, List, Optional
+from typing import AsyncIterator, List, Optional, Sequence
 
+from sqlalchemy import Row
 from sqlalchemy.exc import IntegrityError, SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from core.infrastructure.cache import CartCache, CatalogCache
 from core.infrastructure.database import DatabaseManager
-from core.infrastructure.database.models import Product, User
-from core.infrastructure.repositories import ProductRepository, UserRepository
+from core.infrastructure.database.models import Product
+from core.infrastructure.repositories import (
+    ProductRepository,
+    ShopCardRepository,
+    UserRepository,
+)
 from core.internal.models import ProductCreate, ProductUpdate, UserCreate
 from logger import LoggerBuilder
 
 logger = LoggerBuilder("Shop - Service").add_stream_handler().build()
 
+# Product fields shown by cached search pages and cart views
+_SEARCH_FIELDS = frozenset({"name", "description", "price"})
+_CART_FIELDS = frozenset({"name", "price"})
+
 
 class ShopService:
-    def __init__(self, db_manager: DatabaseManager):
+    def __init__(
+        self,
+        db_manager: DatabaseManager,
+        catalog_cache: Optional[CatalogCache] = None,
+        cart_cache: Optional[CartCache] = None,
+    ):
         self._db_manager = db_manager
+        self._catalog_cache = catalog_cache
+        self._cart_cache = cart_cache
 
     @property
     def db_manager(self) -> DatabaseManager:
         return self._db_manager
 
+    def _invalidate_catalog(
+        self,
+        product_id: Optional[int] = None,
+        cart_user_ids: Optional[Sequence[int]] = None,
+        *,
+        search: bool = True,
+    ) -> None:
+        """
+        Retire cached catalog data after a product write.
+
+        Cart views of ``cart_user_ids`` are dropped, every view when None;
+        ``search`` is passed to ``CatalogCache.invalidate``.
+        """
+        if self._catalog_cache is not None:
+            self._catalog_cache.invalidate(product_id, search=search)
+        if self._cart_cache is not None:
+            if cart_user_ids is None:
+                self._cart_cache.clear()
+            else:
+                self._cart_cache.invalidate_many(cart_user_ids)
+
     @asynccontextmanager
     async def _get_session(self) -> AsyncIterator[AsyncSession]:
         """Context manager for database sessions with error handling."""
@@ -35,41 +73,16 @@ class ShopService:
                 raise
 
     # USER OPERATIONS
-    async def create_user(self, user_data: UserCreate) -> User:
+    async def register_user(self, user_data: UserCreate) -> None:
         """
-        Create a new user or return existing user if telegram_id exists.
+        Create the user or refresh its profile, in a single upsert.
 
         Args:
-            user_data: User creation data
-
-        Returns:
-            User: Created or existing user
-
-        Raises:
-            ValueError: If user creation fails
+            user_data: Telegram id and current profile of the user
         """
         async with self._get_session() as session:
             user_repo = self.db_manager.get_repo(UserRepository, session)
-
-            # Check for existing user first
-            existing_user = await user_repo.get(user_data.telegram_id)
-            if existing_user:
-                logger.info(f"User already exists: {existing_user}")
-                return existing_user
-
-            try:
-                user = await user_repo.create(user_data)
-                logger.info(f"Created new user: {user}")
-                return user
-            except IntegrityError as e:
-                await session.rollback()
-                # Handle race condition
-                existing_user = await user_repo.get(user_data.telegram_id)
-                if existing_user:
-                    logger.warning("Race condition handled for user creation")
-                    return existing_user
-                logger.error(f"User creation failed: {str(e)}")
-                raise ValueError("Failed to create user") from e
+            await user_repo.upsert(user_data)
 
     # PRODUCT OPERATIONS
     async def add_product(self, product_data: ProductCreate) -> Product:
@@ -91,6 +104,7 @@ class ShopService:
             try:
                 product = await product_repo.create(product_data)
                 logger.info(f"Created product ID: {product.id}")
+                self._invalidate_catalog(product.id, cart_user_ids=())
                 return product
             except IntegrityError as e:
                 await session.rollback()
@@ -99,21 +113,28 @@ class ShopService:
 
     async def delete_product(self, product_id: int) -> bool:
         """
-        Delete product by ID.
+        Take a product off sale (soft delete).
+
+        The row stays for the carts and orders that reference it; carts drop
+        its lines the next time they are read.
 
         Args:
             product_id: ID of product to delete
 
         Returns:
-            bool: True if deleted, False if not found
+            bool: True if deleted, False if not found or already deleted
         """
         async with self._get_session() as session:
             product_repo = self.db_manager.get_repo(ProductRepository, session)
+            card_repo = self.db_manager.get_repo(ShopCardRepository, session)
 
             try:
-                success = await product_repo.delete(product_id)
+                success = await product_repo.soft_delete(product_id)
                 if success:
+                    holders = await card_repo.get_holders(product_id)
+                    await session.commit()
                     logger.info(f"Deleted product ID: {product_id}")
+                    self._invalidate_catalog(product_id, cart_user_ids=holders)
                 else:
                     logger.warning(f"Product not found for deletion: {product_id}")
                 return success
@@ -128,6 +149,11 @@ class ShopService:
         """
         Update product details.
 
+        Only what shows the written fields is retired: search pages when the
+        name, description or price changed, and the cart views of the users
+        holding the product when its name or price changed. Stock and image
+        edits leave both alone.
+
         Args:
             product_id: ID of product to update
             product_data: New product data
@@ -139,9 +165,25 @@ class ShopService:
             product_repo = self.db_manager.get_repo(ProductRepository, session)
 
             try:
-                product = await product_repo.update(product_id, product_data)
+                product = await product_repo.update_fields(product_id, product_data)
                 if product:
+                    changed = product_data.model_fields_set
+                    holders: Sequence[int] = ()
+                    if changed & _CART_FIELDS:
+                        card_repo = self.db_manager.get_repo(
+                            ShopCardRepository, session
+                        )
+                        if product_data.price is not None:
+                            await card_repo.refresh_totals(product_id)
+                        holders = await card_repo.get_holders(product_id)
+                    # The product and the cart totals commit together
+                    await session.commit()
                     logger.info(f"Updated product ID: {product.id}")
+                    self._invalidate_catalog(
+                        product_id,
+                        cart_user_ids=holders,
+                        search=bool(changed & _SEARCH_FIELDS),
+                    )
                 else:
                     logger.warning(f"Product not found for update: {product_id}")
                 return product
@@ -156,6 +198,8 @@ class ShopService:
         """
         Get paginated list of products with optional filtering.
 
+        Only products on sale are listed, in id order.
+
         Args:
             skip: Number of items to skip
             limit: Maximum number of items to return
@@ -167,7 +211,7 @@ class ShopService:
         async with self._get_session() as session:
             product_repo = self.db_manager.get_repo(ProductRepository, session)
 
-            products = await product_repo.get_multi(
+            products = await product_repo.get_active_multi(
                 skip=skip, limit=limit, filters=filters
             )
 
@@ -182,14 +226,49 @@ class ShopService:
             product_id: ID of product to retrieve
 
         Returns:
-            Optional[Product]: Product if found, None otherwise
+            Optional[Product]: Product if found and not deleted, None otherwise
         """
+        if self._catalog_cache is not None:
+            if (product := self._catalog_cache.products.get(product_id)) is not None:
+                return product
+
         async with self._get_session() as session:
             product_repo = self.db_manager.get_repo(ProductRepository, session)
 
-            product = await product_repo.get(product_id)
+            product = await product_repo.get_active(product_id)
             if product:
                 logger.debug(f"Retrieved product ID: {product_id}")
+                if self._catalog_cache is not None:
+                    self._catalog_cache.products.set(product_id, product)
             else:
                 logger.debug(f"Product not found: {product_id}")
             return product
+
+    async def get_product_image(self, product_id: int) -> Optional[bytes]:
+        """
+        Photo bytes of a product.
+
+        Products returned by ``get_product`` and ``get_all_products`` do not
+        carry them, so cached products stay small.
+        """
+        async with self._get_session() as session:
+            product_repo = self.db_manager.get_repo(ProductRepository, session)
+            return await product_repo.get_image(product_id)
+
+    async def search_products(
+        self, terms: Sequence[str], *, offset: int = 0, limit: int = 50
+    ) -> List[Row]:
+        """
+        Full-text search over product name and description.
+
+        Args:
+            terms: Normalized query words, each matched as a word prefix
+            offset: Number of results to skip
+            limit: Maximum number of results to return
+
+        Returns:
+            List[Row]: id, name, description and price of matching products
+        """
+        async with self._get_session() as session:
+            product_repo = self.db_manager.get_repo(ProductRepository, session)
+            return await product_repo.search(terms, offset=offset, limit=limit)
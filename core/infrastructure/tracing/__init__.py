@@ -0,0 +1,4 @@
+from .tracing_formatter import TracingDisplayFormatter
+from .update_tracer import UpdateTracer
+
+__all__ = ["TracingDisplayFormatter", "UpdateTracer"]
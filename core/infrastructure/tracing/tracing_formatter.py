@@ -0,0 +1,42 @@
+import html
+from dataclasses import dataclass
+from typing import ClassVar, List
+
+from core.infrastructure.i18n import DisplayFormatter
+from core.internal.types.update_trace import UpdateTrace
+
+
+@dataclass(frozen=True)
+class TracingDisplayFormatter(DisplayFormatter):
+    prefix: ClassVar[str] = "tracing"
+
+    no_data: str
+
+    async def get_slow_updates_text(
+        self, traces: List[UpdateTrace], threshold: float
+    ) -> str:
+        if not traces:
+            return self.text("slow_updates_empty", threshold=threshold)
+
+        lines = "\n\n".join(
+            self.text(
+                "slow_update_line",
+                time=trace.started_at.strftime("%d.%m %H:%M:%S"),
+                latency=f"{trace.latency:.2f}",
+                handler=html.escape(
+                    f"{trace.handler or self.no_data}"
+                    + (f" ({trace.error})" if trace.error else "")
+                ),
+                event=trace.event_type,
+                user=trace.user_id or self.no_data,
+                sql_count=trace.sql_count,
+                sql_time=f"{trace.sql_time:.3f}",
+                api_count=trace.api_count,
+                api_time=f"{trace.api_time:.3f}",
+                upload=f"{trace.upload_bytes / 1024:.1f}",
+            )
+            for trace in traces
+        )
+        return self.text(
+            "slow_updates", threshold=threshold, count=len(traces), lines=lines
+        )
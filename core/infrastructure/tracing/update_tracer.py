@@ -0,0 +1,112 @@
+from collections import deque
+from contextlib import contextmanager
+from contextvars import ContextVar
+from time import perf_counter
+from typing import Any, Deque, Iterator, List, Optional
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from config import TracingConfig
+from core.internal.types.update_trace import UpdateTrace
+from logger import LoggerBuilder
+
+logger = LoggerBuilder("UpdateTracer").add_stream_handler().build()
+
+_current_trace: ContextVar[Optional[UpdateTrace]] = ContextVar(
+    "update_trace", default=None
+)
+
+
+class UpdateTracer:
+    """
+    Accounts the cost of every update: latency, SQL statements, Bot API calls.
+
+    The trace of the running update lives in a context variable, so SQL
+    events, request middlewares and handlers reach it without passing it
+    around; outside an update (background jobs) nothing is recorded. Updates
+    slower than ``slow_threshold`` are logged and kept in a ring buffer of
+    ``buffer_size`` entries for ``/slowupdates``.
+
+    Recording is a context variable lookup and a few additions per event, so
+    it stays on in production.
+    """
+
+    def __init__(self, config: Optional[TracingConfig] = None):
+        self.config = config or TracingConfig()
+        self._slow: Deque[UpdateTrace] = deque(maxlen=self.config.buffer_size)
+
+    @staticmethod
+    def current() -> Optional[UpdateTrace]:
+        """Trace of the update being handled, None outside one."""
+        trace = _current_trace.get()
+        # Tasks spawned by a handler inherit its context; once the update is
+        # finished (latency set) they must not keep adding to its trace
+        if trace is None or trace.latency:
+            return None
+        return trace
+
+    def instrument(self, engine: AsyncEngine) -> None:
+        """Count the statements executed on ``engine`` (idempotent)."""
+        sync_engine = engine.sync_engine
+        if not event.contains(sync_engine, "before_cursor_execute", self._before):
+            event.listen(sync_engine, "before_cursor_execute", self._before)
+            event.listen(sync_engine, "after_cursor_execute", self._after)
+
+    def _before(
+        self,
+        conn: Any,
+        cursor: Any,
+        statement: str,
+        parameters: Any,
+        context: Any,
+        executemany: bool,
+    ) -> None:
+        if self.current() is not None:
+            context._trace_started = perf_counter()
+
+    def _after(
+        self,
+        conn: Any,
+        cursor: Any,
+        statement: str,
+        parameters: Any,
+        context: Any,
+        executemany: bool,
+    ) -> None:
+        trace = self.current()
+        started = getattr(context, "_trace_started", None)
+        if trace is not None and started is not None:
+            trace.sql_count += 1
+            trace.sql_time += perf_counter() - started
+
+    @contextmanager
+    def trace(self, trace: UpdateTrace) -> Iterator[UpdateTrace]:
+        """Make ``trace`` current for the block and time it."""
+        token = _current_trace.set(trace)
+        started = perf_counter()
+        try:
+            yield trace
+        except Exception as e:
+            trace.error = type(e).__name__
+            raise
+        finally:
+            trace.latency = perf_counter() - started
+            _current_trace.reset(token)
+            if trace.latency >= self.config.slow_threshold:
+                self._remember_slow(trace)
+
+    def _remember_slow(self, trace: UpdateTrace) -> None:
+        self._slow.append(trace)
+        logger.warning(
+            f"Slow update {trace.update_id} ({trace.event_type}, "
+            f"{trace.handler or 'unhandled'}): {trace.latency:.3f}s, "
+            f"{trace.sql_count} SQL in {trace.sql_time:.3f}s, "
+            f"{trace.api_count} API calls in {trace.api_time:.3f}s, "
+            f"{trace.upload_bytes} bytes uploaded"
+        )
+
+    def slow_updates(self, limit: Optional[int] = None) -> List[UpdateTrace]:
+        """Kept slow updates, newest first."""
+        traces = list(reversed(self._slow))
+        return traces[:limit] if limit is not None else traces
@@ -1,6 +1,9 @@
+from .broadcast_status import BroadcastStatus
 from .caption import CallbackAction, CaptionStrategyType
-from .handler import ButtonText, CallbackPrefixes, CallbackqueryText, InlineQueryText
+from .handler import ButtonText, CallbackPrefixes, InlineQueryText
 from .order_status import OrderStatus
+from .outbox_status import OutboxStatus
+from .send_priority import SendPriority
 
 __all__ = [
     "CaptionStrategyType",
@@ -8,6 +11,8 @@ __all__ = [
     "OrderStatus",
     "ButtonText",
     "CallbackPrefixes",
-    "CallbackqueryText",
     "InlineQueryText",
+    "SendPriority",
+    "BroadcastStatus",
+    "OutboxStatus",
 ]
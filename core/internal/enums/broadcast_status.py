@@ -0,0 +1,7 @@
+from enum import Enum
+
+
+class BroadcastStatus(str, Enum):
+    RUNNING = "В процессе"
+    FINISHED = "Завершена"
+    CANCELLED = "Отменена"
@@ -9,18 +9,21 @@ class InlineQueryText(str, Enum):
     CATALOG = "catalog"
 
 
-class CallbackqueryText(str, Enum):
-    ORDER_CONFIRM = "order_confirm"
-    ORDER_FINAL_CONFIRM = "final_confirm"
-    ORDER_CANSEL = "order_cancel"
-    ORDER_RECEIVED = "received_orders"
+class CallbackPrefixes(str, Enum):
+    """
+    Callback actions.
 
+    Packed callback data stores a member by its position, so new members go
+    to the end; reordering or removing one requires a new CALLBACK_VERSION.
+    """
 
-class CallbackPrefixes(str, Enum):
     DIALOG_APPEALS = "dialog_apeals_"
     ANSWER_APPEALS = "answer_apeals_"
 
-    CATALOG_INIT = "catalog_"
+    CATALOG_PREV = "catalog_prev_"
+    CATALOG_NEXT = "catalog_next_"
+    CATALOG_DELETE = "catalog_delete_"
+    CATALOG_EDIT = "catalog_edit_"
 
     PRODUCT_DELETE = "confirm_delete_"
     PRODUCT_CANSEL_DELETE = "cancel_delete_"
@@ -42,23 +45,8 @@ class CallbackPrefixes(str, Enum):
     ORDER_STATUS_CONFIRM = "received_order_confirm_"
     ORDER_STATUS_CANSEL = "received_order_cansel_"
 
-    @classmethod
-    def has_any_prefix(cls, callback_data: str) -> bool:
-        return any(callback_data.startswith(item.value) for item in cls)
-
-    @classmethod
-    def has_prefix(cls, callback_data: str, prefix: str) -> bool:
-        return callback_data.startswith(prefix)
-
-    @staticmethod
-    def extract_numbers_after_prefix(callback_data: str, prefix: str) -> list[int]:
-        if not callback_data.startswith(prefix):
-            return []
-
-        parts = callback_data[len(prefix) :].split("_")
-        return [int(p) for p in parts if p.isdigit()]
+    ORDER_CONFIRM = "order_confirm_"
+    ORDER_FINAL_CONFIRM = "final_confirm_"
+    ORDER_CANSEL = "order_cancel_"
 
-    @staticmethod
-    def last_index_after_prefix(callback_data: str, prefix: str) -> int:
-        data = CallbackPrefixes.extract_numbers_after_prefix(callback_data, prefix)
-        return data[-1]
+    PRODUCT_EDIT_STOCK = "edit_stock_"
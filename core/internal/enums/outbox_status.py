@@ -0,0 +1,7 @@
+from enum import Enum
+
+
+class OutboxStatus(str, Enum):
+    PENDING = "Ожидает отправки"
+    SENT = "Отправлено"
+    FAILED = "Не доставлено"
@@ -0,0 +1,9 @@
+from enum import IntEnum
+
+
+class SendPriority(IntEnum):
+    """Outbound Bot API lanes, lower value is sent first"""
+
+    REPLY = 0
+    NOTIFICATION = 1
+    BROADCAST = 2
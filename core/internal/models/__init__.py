@@ -1,10 +1,17 @@
 from .models import (
+    BroadcastCreate,
+    BroadcastUpdate,
+    DailySalesCreate,
     DialogCreate,
     DialogUpdate,
+    MessageArchiveCreate,
     MessageCreate,
     MessageUpdate,
     OrderCreate,
+    OrderStatusEventCreate,
     OrderUpdate,
+    OutboxMessageCreate,
+    OutboxMessageUpdate,
     ProductCreate,
     ProductOrderCreate,
     ProductUpdate,
@@ -14,7 +21,6 @@ from .models import (
     ShopCardItemCreate,
     ShopCardItemUpdate,
     ShopCardUpdate,
-    ProductItem
 )
 
 __all__ = [
@@ -29,9 +35,15 @@ __all__ = [
     "DialogUpdate",
     "MessageCreate",
     "MessageUpdate",
+    "MessageArchiveCreate",
     "ShopCardCreate",
     "ShopCardItemCreate",
     "ShopCardItemUpdate",
     "ShopCardUpdate",
-    "ProductItem"
+    "BroadcastCreate",
+    "BroadcastUpdate",
+    "OrderStatusEventCreate",
+    "OutboxMessageCreate",
+    "OutboxMessageUpdate",
+    "DailySalesCreate",
 ]
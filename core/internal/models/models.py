@@ -1,8 +1,9 @@
+from datetime import date, datetime
 from typing import List, Optional, Tuple
 
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import BaseModel, Field
 
-from core.internal.enums import OrderStatus
+from core.internal.enums import BroadcastStatus, OrderStatus, OutboxStatus
 
 
 class ProductCreate(BaseModel):
@@ -11,6 +12,8 @@ class ProductCreate(BaseModel):
     price: float
     image: Optional[bytes] = None
     image_file_id: Optional[str] = None
+    # None: stock is not tracked
+    stock: Optional[int] = Field(None, ge=0)
 
 
 class ProductUpdate(BaseModel):
@@ -18,16 +21,9 @@ class ProductUpdate(BaseModel):
     description: Optional[str] = None
     price: Optional[float] = None
     image: Optional[bytes] = None
-
-
-class ProductItem(BaseModel):
-    model_config = ConfigDict(from_attributes=True)
-
-    id: int
-    name: str
-    description: Optional[str] = None
-    price: float
-    image: Optional[bytes] = None
+    image_file_id: Optional[str] = None
+    # None: stock is not tracked
+    stock: Optional[int] = Field(None, ge=0)
 
 
 class OrderCreate(BaseModel):
@@ -36,7 +32,8 @@ class OrderCreate(BaseModel):
     total_count: int
     order_note: Optional[str] = None
     delivery_address: Optional[str] = None
-    products: Optional[List[Tuple[ProductItem, int]]] = None
+    # (product_id, quantity) per order line
+    products: Optional[List[Tuple[int, int]]] = None
     status: Optional[OrderStatus] = None
 
 
@@ -78,7 +75,8 @@ class DialogUpdate(BaseModel):
 
 
 class MessageCreate(BaseModel):
-    id: int
+    chat_id: int
+    telegram_message_id: int
     dialog_id: int
     sender_id: int
     content: str
@@ -88,6 +86,14 @@ class MessageUpdate(BaseModel):
     content: str
 
 
+class MessageArchiveCreate(BaseModel):
+    dialog_id: int
+    messages_count: int
+    first_created_at: datetime
+    last_created_at: datetime
+    payload: bytes
+
+
 class ShopCardItemCreate(BaseModel):
     shop_card_id: Optional[int] = None
     product_id: int = Field(..., gt=0)
@@ -107,3 +113,36 @@ class ShopCardItemUpdate(BaseModel):
 
 class ShopCardUpdate(BaseModel):
     items: List[ShopCardItemUpdate] = Field(..., min_length=1)
+
+
+class BroadcastCreate(BaseModel):
+    admin_id: int
+    text: str = Field(..., min_length=1)
+    total: int = 0
+
+
+class BroadcastUpdate(BaseModel):
+    status: Optional[BroadcastStatus] = None
+
+
+class OrderStatusEventCreate(BaseModel):
+    order_id: int = Field(..., gt=0)
+    old_status: Optional[OrderStatus] = None
+    new_status: OrderStatus
+    changed_by: Optional[int] = None
+
+
+class OutboxMessageCreate(BaseModel):
+    chat_id: int
+    text: str = Field(..., min_length=1)
+
+
+class OutboxMessageUpdate(BaseModel):
+    status: Optional[OutboxStatus] = None
+
+
+class DailySalesCreate(BaseModel):
+    day: date
+    orders_count: int = 0
+    units: int = 0
+    revenue: float = 0
@@ -1,13 +1,32 @@
+from .callback import CallbackArgs, pack_callback
 from .caption import DeleteCaptionArgs, ErrorCaptionArg, ProductCaptionArgs
+from .dialog_history import HistoryMessage, pack_history, unpack_history
+from .inline_search import InlineSearchPage
+from .order_export import OrderExport
+from .order_queue import ORDER_STATUSES, OrderCursor, OrderQueuePage
 from .pagination import PaginationData
-from .shop_card import CartCallbackData, ShopCardContent, ShopCardTotal
+from .sales_report import ProductSales, SalesReport
+from .shop_card import CartLine, ShopCardTotal
+from .update_trace import UpdateTrace
 
 __all__ = [
-    "ShopCardContent",
+    "CartLine",
     "ShopCardTotal",
     "ErrorCaptionArg",
     "ProductCaptionArgs",
     "DeleteCaptionArgs",
-    "CartCallbackData",
     "PaginationData",
+    "InlineSearchPage",
+    "CallbackArgs",
+    "pack_callback",
+    "ORDER_STATUSES",
+    "OrderCursor",
+    "OrderQueuePage",
+    "OrderExport",
+    "ProductSales",
+    "SalesReport",
+    "HistoryMessage",
+    "pack_history",
+    "unpack_history",
+    "UpdateTrace",
 ]
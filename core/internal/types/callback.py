@@ -0,0 +1,45 @@
+from dataclasses import dataclass
+from typing import Optional, Tuple
+
+from core.internal.enums import CallbackPrefixes
+from utils.callback_codec import CallbackCodec
+
+# Bump when CallbackPrefixes members are reordered or removed: buttons sent
+# with another version stop matching instead of triggering the wrong action.
+CALLBACK_VERSION = 1
+
+_callback_codec: CallbackCodec[CallbackPrefixes] = CallbackCodec(
+    tuple(CallbackPrefixes), version=CALLBACK_VERSION
+)
+
+
+@dataclass(frozen=True, slots=True)
+class CallbackArgs:
+    """Callback data resolved to its prefix and numeric arguments."""
+
+    prefix: CallbackPrefixes
+    args: Tuple[int, ...]
+
+    @property
+    def last(self) -> int:
+        return self.args[-1]
+
+    def pack(self) -> str:
+        return _callback_codec.encode(self.prefix, *self.args)
+
+    @classmethod
+    def is_packed(cls, data: str) -> bool:
+        return _callback_codec.is_packed(data)
+
+    @classmethod
+    def unpack(cls, data: str) -> Optional["CallbackArgs"]:
+        decoded = _callback_codec.decode(data)
+        if decoded is None:
+            return None
+        prefix, args = decoded
+        return cls(prefix=prefix, args=args)
+
+
+def pack_callback(prefix: CallbackPrefixes, *args: int) -> str:
+    """Build packed callback data for a keyboard button."""
+    return CallbackArgs(prefix=prefix, args=args).pack()
@@ -0,0 +1,31 @@
+import json
+import zlib
+from dataclasses import dataclass
+from datetime import datetime
+from typing import List, Sequence
+
+
+@dataclass(frozen=True, slots=True)
+class HistoryMessage:
+    """A dialog message as shown in history, live or restored from the archive."""
+
+    id: int
+    sender_id: int
+    content: str
+    created_at: datetime
+
+
+def pack_history(messages: Sequence[HistoryMessage]) -> bytes:
+    """Compress messages into a ``message_archives.payload``."""
+    rows = [
+        [message.id, message.sender_id, message.content, message.created_at.isoformat()]
+        for message in messages
+    ]
+    return zlib.compress(json.dumps(rows, ensure_ascii=False).encode(), level=6)
+
+
+def unpack_history(payload: bytes) -> List[HistoryMessage]:
+    return [
+        HistoryMessage(id, sender_id, content, datetime.fromisoformat(created_at))
+        for id, sender_id, content, created_at in json.loads(zlib.decompress(payload))
+    ]
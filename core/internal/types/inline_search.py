@@ -0,0 +1,12 @@
+from dataclasses import dataclass
+from typing import List
+
+from aiogram.types import InlineQueryResultArticle
+
+
+@dataclass(frozen=True)
+class InlineSearchPage:
+    """Rendered page of inline catalog results"""
+
+    results: List[InlineQueryResultArticle]
+    next_offset: str
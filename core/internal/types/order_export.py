@@ -0,0 +1,15 @@
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Optional
+
+
+@dataclass(frozen=True)
+class OrderExport:
+    """Written order history file, ``since`` is None for the whole history."""
+
+    path: Path
+    filename: str
+    since: Optional[datetime]
+    orders: int
+    rows: int
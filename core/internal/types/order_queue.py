@@ -0,0 +1,62 @@
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, List, Optional, Tuple
+
+from core.internal.enums import OrderStatus
+
+_EPOCH = datetime(1970, 1, 1)
+
+# Callback data stores a status by its position
+ORDER_STATUSES: Tuple[OrderStatus, ...] = tuple(OrderStatus)
+
+
+@dataclass(frozen=True, slots=True)
+class OrderCursor:
+    """Keyset position in the order queue, ordered by ``(created_at, id)``."""
+
+    created_at: datetime
+    id: int
+
+    def to_args(self) -> Tuple[int, int]:
+        """Callback arguments: naive UTC ``created_at`` in microseconds and the id."""
+        created_at = self.created_at
+        if created_at.tzinfo is not None:
+            created_at = created_at.astimezone(timezone.utc).replace(tzinfo=None)
+        return (created_at - _EPOCH) // timedelta(microseconds=1), self.id
+
+    @classmethod
+    def from_args(cls, created_at_us: int, order_id: int) -> "OrderCursor":
+        return cls(_EPOCH + timedelta(microseconds=created_at_us), order_id)
+
+
+@dataclass(frozen=True)
+class OrderQueuePage:
+    """
+    One page of the admin order queue.
+
+    ``items`` are rows with the columns the list shows (``id``, ``created_at``);
+    the full order is loaded when it is opened.
+    """
+
+    status: OrderStatus
+    items: List[Any]
+    page: int
+    has_prev: bool
+    has_next: bool
+    counts: Dict[OrderStatus, int] = field(default_factory=dict)
+
+    @property
+    def total(self) -> int:
+        return self.counts.get(self.status, 0)
+
+    @property
+    def first(self) -> Optional[OrderCursor]:
+        if not self.items:
+            return None
+        return OrderCursor(self.items[0].created_at, self.items[0].id)
+
+    @property
+    def last(self) -> Optional[OrderCursor]:
+        if not self.items:
+            return None
+        return OrderCursor(self.items[-1].created_at, self.items[-1].id)
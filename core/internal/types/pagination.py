@@ -2,10 +2,18 @@ from typing import List, Optional, Any
 
 from pydantic import BaseModel
 
+from core.internal.enums import CallbackPrefixes
+
 
 class PaginationData(BaseModel):
     text: str
-    callback_name: str
+    item_callback: CallbackPrefixes
+    prev_callback: CallbackPrefixes
+    next_callback: CallbackPrefixes
     items: Optional[List[Any]] = None
     page: Optional[int] = 0
     page_size: Optional[int] = 10
+    total: int = 0
+    # Callback arguments of the navigation buttons, no button when None
+    prev_args: Optional[List[int]] = None
+    next_args: Optional[List[int]] = None
@@ -0,0 +1,37 @@
+from dataclasses import dataclass, field
+from datetime import date
+from typing import Dict, List, Optional
+
+from core.internal.enums import OrderStatus
+
+
+@dataclass(frozen=True, slots=True)
+class ProductSales:
+    product_id: int
+    name: Optional[str]  # None once the product is deleted
+    units: int
+    revenue: float
+
+
+@dataclass(frozen=True)
+class SalesReport:
+    """Sales over ``start``..``end`` (inclusive), read from the daily rollups."""
+
+    start: date
+    end: date
+    orders_count: int = 0
+    units: int = 0
+    revenue: float = 0.0
+    best_day: Optional[date] = None
+    best_day_revenue: float = 0.0
+    top_products: List[ProductSales] = field(default_factory=list)
+    # Orders that entered each status within the period
+    status_counts: Dict[OrderStatus, int] = field(default_factory=dict)
+
+    @property
+    def days(self) -> int:
+        return (self.end - self.start).days + 1
+
+    @property
+    def average_check(self) -> float:
+        return self.revenue / self.orders_count if self.orders_count else 0.0
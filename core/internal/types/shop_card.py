@@ -1,39 +1,30 @@
-from typing import List, Optional
+from dataclasses import dataclass, field
+from typing import List
 
-from pydantic import BaseModel
-from core.internal.models import ProductItem
 
-from dataclasses import dataclass
+@dataclass(frozen=True, slots=True)
+class CartLine:
+    """
+    One cart line as shown and ordered: plain values, no product object.
 
+    The product image is never copied here, it is looked up by ``product_id``
+    when a card is rendered.
+    """
 
-class ShopCardContent(BaseModel):
     id: int
     product_id: int
     name: str
     price: float
     quantity: int
-    total: float
-    product: Optional[ProductItem] = None
 
+    @property
+    def total(self) -> float:
+        return self.price * self.quantity
 
-class ShopCardTotal(BaseModel):
+
+@dataclass(frozen=True, slots=True)
+class ShopCardTotal:
     items_count: int
     total_price: float
-    items: List[ShopCardContent]
-
-
-@dataclass
-class CartCallbackData:
-    action: str
-    current_index: int
-    product_id: int
-
-    @classmethod
-    def parse(cls, data: str) -> Optional["CartCallbackData"]:
-        try:
-            parts = data.split("_")
-            return cls(
-                action=parts[1], current_index=int(parts[3]), product_id=int(parts[4])
-            )
-        except (IndexError, ValueError):
-            return None
+    lines_count: int = 0
+    items: List[CartLine] = field(default_factory=list)
@@ -0,0 +1,25 @@
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Optional
+
+
+@dataclass(slots=True)
+class UpdateTrace:
+    """
+    Cost of handling one update, filled in while the update runs.
+
+    Times are in seconds; ``handler`` is None when no handler matched.
+    """
+
+    update_id: int
+    event_type: str
+    user_id: Optional[int]
+    started_at: datetime
+    handler: Optional[str] = None
+    latency: float = 0.0
+    sql_count: int = 0
+    sql_time: float = 0.0
+    api_count: int = 0
+    api_time: float = 0.0
+    upload_bytes: int = 0
+    error: Optional[str] = None
@@ -1,32 +1,101 @@
-from typing import Any, Dict
+from aiogram import Bot, Dispatcher
 
-from aiogram import Dispatcher
-
-from core.infrastructure import admin_config, db_manager
-from handlers import __routers__
-from middleware import AdminMiddleware, ServiceMiddleware
+from config import ThrottlingConfig
+from core.infrastructure import (
+    admin_config,
+    cart_cache,
+    catalog_cache,
+    db_manager,
+    job_runner,
+    text_catalog,
+    update_tracer,
+    user_cache,
+)
+from core.infrastructure.services import (
+    AnalyticsService,
+    BroadcastDisplayFormatter,
+    BroadcastService,
+    CartCleanupService,
+    InventoryService,
+    OutboxService,
+    RetentionService,
+    StatsDisplayFormatter,
+)
+from handlers import (
+    __routers__,
+    catalog_router,
+    message_router,
+    order_router,
+    shop_card_router,
+)
+from middleware import (
+    AdminMiddleware,
+    CallbackArgsMiddleware,
+    ServiceMiddleware,
+    ThrottlingMiddleware,
+    TracingMiddleware,
+    UserRegistrationMiddleware,
+)
 from aiogram_i18n import I18nMiddleware
-from aiogram_i18n.cores.fluent_runtime_core import FluentRuntimeCore
 
+# Per-router flood control: (rate in tokens/sec, burst)
+THROTTLING = {
+    catalog_router: ThrottlingConfig(rate=2.0, burst=6),
+    shop_card_router: ThrottlingConfig(rate=2.0, burst=6),
+    order_router: ThrottlingConfig(rate=1.0, burst=4),
+    message_router: ThrottlingConfig(rate=1.0, burst=5),
+}
 
 
 def create_dispatcher() -> Dispatcher:
     dispatcher = Dispatcher()
+    dispatcher["job_runner"] = job_runner
+    dispatcher["outbox_service"] = OutboxService(db_manager, user_cache=user_cache)
+    dispatcher["inventory_service"] = InventoryService(db_manager)
+    dispatcher["update_tracer"] = update_tracer
     i18n_middleware = I18nMiddleware(
-        core=FluentRuntimeCore(
-            path="locales/{locale}/LC_MESSAGES",
-        )
+        core=text_catalog, default_locale=text_catalog.default_locale
     )
 
-    dispatcher.update.middleware(ServiceMiddleware(db_manager, admin_config))
+    update_tracer.instrument(db_manager.engine)
+    TracingMiddleware(update_tracer).setup(dispatcher)
+    dispatcher.update.middleware(
+        ServiceMiddleware(
+            db_manager,
+            text_catalog,
+            admin_config,
+            catalog_cache,
+            cart_cache,
+            user_cache,
+        )
+    )
+    dispatcher.update.middleware(UserRegistrationMiddleware(db_manager, user_cache))
     dispatcher.update.middleware(AdminMiddleware(admin_config))
+    dispatcher.callback_query.outer_middleware(CallbackArgsMiddleware())
     i18n_middleware.setup(dispatcher)
 
-    dispatcher["is_admin"] = get_is_admin
+    for router, throttling_config in THROTTLING.items():
+        throttling_middleware = ThrottlingMiddleware(throttling_config)
+        router.message.middleware(throttling_middleware)
+        router.callback_query.middleware(throttling_middleware)
+
+    dispatcher.startup.register(on_startup)
+    dispatcher.shutdown.register(job_runner.stop)
 
     __routers__.register_routes(dispatcher)
     return dispatcher
 
 
-def get_is_admin(data: Dict[str, Any]) -> bool:
-    return data.get("is_admin", False)
+async def on_startup(
+    bot: Bot, outbox_service: OutboxService, inventory_service: InventoryService
+) -> None:
+    outbox_service.start(job_runner, bot)
+    inventory_service.start(job_runner)
+    formatter = text_catalog.formatter(BroadcastDisplayFormatter)
+    await BroadcastService(db_manager, formatter, user_cache=user_cache).resume_running(
+        bot, job_runner
+    )
+    formatter = text_catalog.formatter(StatsDisplayFormatter)
+    AnalyticsService(db_manager, formatter).start(job_runner)
+    RetentionService(db_manager).start(job_runner)
+    CartCleanupService(db_manager, cart_cache).start(job_runner)
@@ -1,4 +1,5 @@
 from .admin_filter import IsAdmin
+from .callback_prefix import CallbackPrefixFilter, resolve_callback
 from .text import TextFilter
 
-__all__ = ["IsAdmin", "TextFilter"]
+__all__ = ["IsAdmin", "TextFilter", "CallbackPrefixFilter", "resolve_callback"]
@@ -0,0 +1,53 @@
+from typing import FrozenSet, Optional
+
+from aiogram.filters import BaseFilter
+from aiogram.types import CallbackQuery
+
+from core.internal.enums import CallbackPrefixes
+from core.internal.types import CallbackArgs
+from utils import CallbackTrie
+
+_CALLBACK_TRIE: CallbackTrie[CallbackPrefixes] = CallbackTrie(
+    (prefix.value, prefix) for prefix in CallbackPrefixes
+)
+
+
+def resolve_callback(callback_data: Optional[str]) -> Optional[CallbackArgs]:
+    """
+    Resolve callback data to a ``CallbackPrefixes`` member and its arguments.
+
+    Packed data is decoded by ``CallbackArgs.unpack``. Plain string data from
+    buttons sent before packing is matched by its longest prefix, and
+    everything after the prefix must be ``_``-separated integers.
+    """
+    if not callback_data:
+        return None
+
+    if CallbackArgs.is_packed(callback_data):
+        return CallbackArgs.unpack(callback_data)
+
+    match = _CALLBACK_TRIE.longest_prefix(callback_data)
+    if match is None:
+        return None
+
+    prefix, parts = match
+    if not all(part.isdigit() for part in parts):
+        return None
+
+    return CallbackArgs(prefix=prefix, args=tuple(int(part) for part in parts))
+
+
+class CallbackPrefixFilter(BaseFilter):
+    """
+    Match callbacks resolved by ``CallbackArgsMiddleware`` to one of ``prefixes``.
+
+    The handler receives the parsed arguments as ``callback_args``.
+    """
+
+    def __init__(self, *prefixes: CallbackPrefixes):
+        self.prefixes: FrozenSet[CallbackPrefixes] = frozenset(prefixes)
+
+    async def __call__(
+        self, callback: CallbackQuery, callback_args: Optional[CallbackArgs] = None
+    ) -> bool:
+        return callback_args is not None and callback_args.prefix in self.prefixes
@@ -1,3 +1,4 @@
+from .broadcast import broadcast_router
 from .catalog import catalog_router
 from .handle_router import HandleRouters
 from .initial import initial_router
@@ -6,6 +7,7 @@ from .product_add import product_add_router
 from .product_delete import product_delete_router
 from .product_edit import product_edit_router
 from .shop_card import shop_card_router
+from .stats import stats_router
 from .order import order_router
 
 catalog_router.include_routers(
@@ -19,5 +21,7 @@ __routers__ = HandleRouters(
         message_router,
         shop_card_router,
         order_router,
+        broadcast_router,
+        stats_router,
     )
 )
@@ -0,0 +1,102 @@
+from aiogram import Bot, Router
+from aiogram.filters import Command, CommandObject
+from aiogram.fsm.context import FSMContext
+from aiogram.types import Message
+
+from core.infrastructure.jobs import JobRunner
+from core.infrastructure.services import BroadcastService
+from filters import IsAdmin
+from logger import LoggerBuilder
+from states import BroadcastStates
+
+logger = LoggerBuilder("BroadcastRouter").add_stream_handler().build()
+
+broadcast_router = Router()
+
+
+async def _answer_if_running(
+    message: Message, broadcast_service: BroadcastService
+) -> bool:
+    """Tell the admin about a running broadcast; one runs at a time."""
+    running = await broadcast_service.get_running_broadcasts()
+    if not running:
+        return False
+    await message.answer(
+        await broadcast_service.formatter.get_already_running_text(running[0].id)
+    )
+    return True
+
+
+@broadcast_router.message(Command("broadcast"), IsAdmin())
+async def command_broadcast(
+    message: Message, state: FSMContext, broadcast_service: BroadcastService
+) -> None:
+    if await _answer_if_running(message, broadcast_service):
+        return
+    await message.answer(broadcast_service.formatter.input_text)
+    await state.set_state(BroadcastStates.waiting_for_text)
+
+
+@broadcast_router.message(BroadcastStates.waiting_for_text)
+async def process_broadcast_text(
+    message: Message,
+    state: FSMContext,
+    bot: Bot,
+    broadcast_service: BroadcastService,
+    job_runner: JobRunner,
+) -> None:
+    if not message.text:
+        # Broadcasts are sent as text: media would go out empty
+        await message.answer(broadcast_service.formatter.text_only)
+        return
+
+    await state.clear()
+
+    if message.text.strip().lower() == "skip":
+        await message.answer(broadcast_service.formatter.cancelled)
+        return
+
+    try:
+        # Another admin may have started one while this text was typed
+        if await _answer_if_running(message, broadcast_service):
+            return
+
+        broadcast = await broadcast_service.create_broadcast(
+            admin_id=message.from_user.id, text=message.html_text
+        )
+
+        if not broadcast:
+            await message.answer(broadcast_service.formatter.no_users)
+            return
+
+        broadcast_service.start(bot, broadcast.id, job_runner)
+
+    except Exception as e:
+        logger.error(f"Broadcast start failed: {e}")
+        await message.answer(broadcast_service.formatter.error)
+
+
+@broadcast_router.message(Command("cancelbroadcast"), IsAdmin())
+async def command_cancel_broadcast(
+    message: Message, command: CommandObject, broadcast_service: BroadcastService
+) -> None:
+    formatter = broadcast_service.formatter
+    if command.args:
+        if not command.args.strip().isdigit():
+            await message.answer(formatter.cancel_usage)
+            return
+        broadcast_ids = [int(command.args)]
+    else:
+        running = await broadcast_service.get_running_broadcasts()
+        broadcast_ids = [broadcast.id for broadcast in running]
+
+    stopping = [
+        broadcast_id
+        for broadcast_id in broadcast_ids
+        if await broadcast_service.cancel_broadcast(broadcast_id)
+    ]
+    if not stopping:
+        await message.answer(formatter.not_running)
+        return
+    for broadcast_id in stopping:
+        await message.answer(await formatter.get_stopping_text(broadcast_id))
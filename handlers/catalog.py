@@ -1,11 +1,9 @@
-from aiogram import Bot, F, Router, html
+from aiogram import Bot, Router, html
 from aiogram.filters import Command
 from aiogram.types import (
     CallbackQuery,
     InlineQuery,
-    InlineQueryResultArticle,
     InputMediaPhoto,
-    InputTextMessageContent,
     Message,
 )
 
@@ -15,9 +13,10 @@ from core.infrastructure.services import (
     DeleteCaptionArgs,
     ProductCaptionArgs,
 )
-from core.internal.enums import CallbackAction, CallbackPrefixes, InlineQueryText
+from core.internal.enums import CallbackAction, CallbackPrefixes
+from core.internal.types import CallbackArgs
+from filters import CallbackPrefixFilter
 from keyboards import (
-    get_catalog_keyboard,
     get_confirm_delete_keyboard,
     get_edit_keyboard,
 )
@@ -43,49 +42,58 @@ async def command_catalog(
         )
 
         if image_file := await catalog_service.get_product_image(product.id, product):
-            await message.answer_photo(
+            sent = await message.answer_photo(
                 photo=image_file,
                 caption=caption,
-                reply_markup=get_catalog_keyboard(
-                    0, product.id, len(products), is_admin
+                reply_markup=catalog_service.get_catalog_keyboard(
+                    product, 0, len(products), is_admin
                 ),
             )
+            await catalog_service.remember_image_file_id(product, sent)
         else:
             await message.answer(
                 text=caption,
-                reply_markup=get_catalog_keyboard(
-                    0, product.id, len(products), is_admin
+                reply_markup=catalog_service.get_catalog_keyboard(
+                    product, 0, len(products), is_admin
                 ),
             )
 
     except Exception as e:
-        await message.answer(catalog_service.config.error_text.format(error=str(e)))
+        await message.answer(catalog_service.config.get_error_text(str(e)))
 
 
 @catalog_router.callback_query(
-    lambda c: CallbackPrefixes.has_prefix(c.data, CallbackPrefixes.CATALOG_INIT)
+    CallbackPrefixFilter(
+        CallbackPrefixes.CATALOG_PREV,
+        CallbackPrefixes.CATALOG_NEXT,
+        CallbackPrefixes.CATALOG_DELETE,
+        CallbackPrefixes.CATALOG_EDIT,
+    )
 )
 async def process_catalog_navigation(
-    callback: CallbackQuery, bot: Bot, catalog_service: CatalogService, is_admin: bool
+    callback: CallbackQuery,
+    callback_args: CallbackArgs,
+    bot: Bot,
+    catalog_service: CatalogService,
+    is_admin: bool,
 ) -> None:
-    parts = callback.data.split("_")
-
-    if len(parts) != 3:
+    if len(callback_args.args) != 1:
         raise ValueError("Invalid callback data format")
 
-    try:
-        action = CallbackAction[parts[1].upper()]
-        current_index = int(parts[2])
-    except KeyError:
-        raise ValueError(f"Unknown callback action: {parts[1]}")
+    current_index = callback_args.last
+    prefix = callback_args.prefix
 
-    if action == CallbackAction.PREV or action == CallbackAction.NEXT:
+    if prefix == CallbackPrefixes.CATALOG_PREV:
+        await handle_navigation(
+            callback, bot, CallbackAction.PREV, current_index, catalog_service, is_admin
+        )
+    elif prefix == CallbackPrefixes.CATALOG_NEXT:
         await handle_navigation(
-            callback, bot, action, current_index, catalog_service, is_admin
+            callback, bot, CallbackAction.NEXT, current_index, catalog_service, is_admin
         )
-    elif action == CallbackAction.DELETE:
+    elif prefix == CallbackPrefixes.CATALOG_DELETE:
         await handle_delete(callback, current_index, catalog_service)
-    elif action == CallbackAction.EDIT:
+    elif prefix == CallbackPrefixes.CATALOG_EDIT:
         await handle_edit(callback, current_index, catalog_service)
 
 
@@ -127,15 +135,18 @@ async def handle_navigation(
             args=ProductCaptionArgs(product=product),
         )
 
-        keyboard = get_catalog_keyboard(new_index, product.id, len(products), is_admin)
+        keyboard = catalog_service.get_catalog_keyboard(
+            product, new_index, len(products), is_admin
+        )
 
         if image_file := await catalog_service.get_product_image(product.id, product):
-            await bot.edit_message_media(
+            edited = await bot.edit_message_media(
                 media=InputMediaPhoto(media=image_file, caption=caption),
                 chat_id=callback.message.chat.id,
                 message_id=callback.message.message_id,
                 reply_markup=keyboard,
             )
+            await catalog_service.remember_image_file_id(product, edited)
         else:
             await bot.edit_message_caption(
                 chat_id=callback.message.chat.id,
@@ -148,7 +159,7 @@ async def handle_navigation(
 
     except Exception as e:
         await callback.message.edit_text(
-            catalog_service.config.error_text.format(error=str(e))
+            catalog_service.config.get_error_text(str(e))
         )
         await callback.answer()
 
@@ -178,7 +189,7 @@ async def handle_delete(
 
     except Exception as e:
         await callback.message.edit_text(
-            catalog_service.config.error_text.format(error=str(e))
+            catalog_service.config.get_error_text(str(e))
         )
         await callback.answer()
 
@@ -205,34 +216,21 @@ async def handle_edit(
 
     except Exception as e:
         await callback.message.edit_text(
-            catalog_service.config.error_text.format(error=str(e))
+            catalog_service.config.get_error_text(str(e))
         )
         await callback.answer()
 
 
-@catalog_router.inline_query(F.query == InlineQueryText.CATALOG.value)
+@catalog_router.inline_query()
 async def catalog_inline_query_handler(
     inline_query: InlineQuery, catalog_service: CatalogService
 ) -> None:
-    products = await catalog_service.get_products()
-
-    results = []
-    
-    for product in products:
-        caption = catalog_service.build_caption(
-            strategy_type=CaptionStrategyType.PRODUCT,
-            args=ProductCaptionArgs(product=product),
-        )
-        result_article = InlineQueryResultArticle(
-            id=str(product.id),
-            title=product.name,
-            description=product.description,
-            thumb_width=48,
-            thumb_height=48,
-            input_message_content=InputTextMessageContent(
-                message_text=f"🔍 {caption}"
-            ),
-        )
-        results.append(result_article)
-
-    await inline_query.answer(results)
+    offset = int(inline_query.offset) if inline_query.offset.isdigit() else 0
+    page = await catalog_service.search_inline(inline_query.query, offset)
+
+    await inline_query.answer(
+        page.results,
+        cache_time=300,
+        is_personal=False,
+        next_offset=page.next_offset,
+    )
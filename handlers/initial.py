@@ -3,25 +3,15 @@ from aiogram.filters import Command, CommandStart
 from aiogram.types import Message, ReplyKeyboardRemove
 from aiogram_i18n import I18nContext
 
-from core.infrastructure.services import ShopService
-from core.internal.models import UserCreate
 from data import CommandList
 
 initial_router = Router()
 
 
 @initial_router.message(CommandStart())
-async def command_start(
-    message: Message, shop_service: ShopService, i18n: I18nContext
-) -> None:
+async def command_start(message: Message, i18n: I18nContext) -> None:
+    # The sender is registered by UserRegistrationMiddleware
     try:
-        await shop_service.create_user(
-            UserCreate(
-                telegram_id=message.from_user.id,
-                username=message.from_user.username,
-                full_name=message.from_user.full_name,
-            )
-        )
         await message.answer(
             text=i18n.get(
                 "greeting",
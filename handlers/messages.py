@@ -5,11 +5,13 @@ from aiogram.types import CallbackQuery, Message, ReplyKeyboardRemove
 
 from core.infrastructure.services import DialogService
 from core.internal.models import DialogUpdate
-from core.internal.enums import ButtonText, CallbackPrefixes
-from filters import IsAdmin
+from core.internal.enums import ButtonText, CallbackPrefixes, SendPriority
+from core.internal.types import CallbackArgs
+from filters import CallbackPrefixFilter, IsAdmin
 from keyboards import get_apeals_keyboard, get_dialog_keyboard, get_message_keyboard
 from logger import LoggerBuilder
 from states import DialogStates
+from utils import send_priority
 
 logger = LoggerBuilder("MessageRouter").add_stream_handler().build()
 message_router = Router()
@@ -104,7 +106,8 @@ async def process_user_message(
 
     try:
         await dialog_service.create_message(
-            message_id=message.message_id,
+            chat_id=message.chat.id,
+            telegram_message_id=message.message_id,
             dialog_id=dialog_id,
             sender_id=message.from_user.id,
             content=message.text,
@@ -135,14 +138,17 @@ async def show_appeals(message: Message, dialog_service: DialogService):
         await message.answer(dialog_service.formatter.apeals_error)
 
 
-@message_router.callback_query(lambda c: CallbackPrefixes.has_prefix(c.data, CallbackPrefixes.DIALOG_APPEALS))
-async def show_select_apeals(callback: CallbackQuery, dialog_service: DialogService):
+@message_router.callback_query(CallbackPrefixFilter(CallbackPrefixes.DIALOG_APPEALS))
+async def show_select_apeals(
+    callback: CallbackQuery, callback_args: CallbackArgs, dialog_service: DialogService
+):
     try:
-        dialog_id = CallbackPrefixes.last_index_after_prefix(callback.data, CallbackPrefixes.DIALOG_APPEALS)
+        dialog_id = callback_args.last
         dialog = await dialog_service.get_dialog(dialog_id)
+        messages = await dialog_service.get_history(dialog_id)
         keyboard = get_message_keyboard(dialog)
         text_messages = await dialog_service.get_message_text(
-            dialog.user1.username, dialog.messages
+            dialog.user1.username, messages
         )
         await callback.message.answer(text_messages, reply_markup=keyboard)
         await callback.answer()
@@ -151,9 +157,11 @@ async def show_select_apeals(callback: CallbackQuery, dialog_service: DialogServ
         await callback.message.answer(dialog_service.formatter.apeals_error)
 
 
-@message_router.callback_query(lambda c: CallbackPrefixes.has_prefix(c.data, CallbackPrefixes.ANSWER_APPEALS))
-async def answer_apeals_tag(callback: CallbackQuery, state: FSMContext):
-    dialog_id = CallbackPrefixes.last_index_after_prefix(callback.data, CallbackPrefixes.ANSWER_APPEALS)
+@message_router.callback_query(CallbackPrefixFilter(CallbackPrefixes.ANSWER_APPEALS))
+async def answer_apeals_tag(
+    callback: CallbackQuery, callback_args: CallbackArgs, state: FSMContext
+):
+    dialog_id = callback_args.last
     await callback.message.answer("Ожидается ответ пользователю")
     await state.update_data(dialog_id=dialog_id)
     await state.set_state(DialogStates.waiting_for_answer_apeals)
@@ -170,10 +178,12 @@ async def answer_apeals(
         answer = message.text.strip()
 
         await dialog_service.create_message(
-            message_id=message.message_id,
+            chat_id=message.chat.id,
+            telegram_message_id=message.message_id,
             dialog_id=dialog_id,
             sender_id=message.from_user.id,
             content=answer,
+            mark_unread=False,
         )
 
         await dialog_service.update_dialog(dialog_id, DialogUpdate(is_read=True))
@@ -182,10 +192,11 @@ async def answer_apeals(
 
         text = await dialog_service.get_answer_text(answer)
 
-        await bot.send_message(
-            chat_id=dialog_id,
-            text=text,
-        )
+        with send_priority(SendPriority.NOTIFICATION):
+            await bot.send_message(
+                chat_id=dialog_id,
+                text=text,
+            )
 
     except Exception:
         await message.answer(dialog_service.formatter.answer_error)
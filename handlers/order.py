@@ -1,4 +1,4 @@
-from aiogram import F, Router
+from aiogram import Router
 from aiogram.filters import Command
 from aiogram.fsm.context import FSMContext
 from aiogram.types import (
@@ -7,11 +7,23 @@ from aiogram.types import (
     ReplyKeyboardRemove,
 )
 
-from core.infrastructure.services import OrderService, ShopCardService
-from core.internal.enums import CallbackPrefixes, CallbackqueryText, OrderStatus
-from core.internal.models import OrderCreate
-from core.internal.types import PaginationData
-from filters import IsAdmin, TextFilter
+from core.infrastructure.services import (
+    InventoryService,
+    OrderService,
+    OrderStatusError,
+    OutboxService,
+    OutOfStockError,
+    ShopCardService,
+)
+from core.internal.enums import CallbackPrefixes, OrderStatus
+from core.internal.types import (
+    ORDER_STATUSES,
+    CallbackArgs,
+    OrderCursor,
+    OrderQueuePage,
+    PaginationData,
+)
+from filters import CallbackPrefixFilter, IsAdmin, TextFilter
 from keyboards import get_order_confirm_keyboard, get_status_order_keyboard
 from logger import LoggerBuilder
 from states import OrderConfirm
@@ -22,8 +34,10 @@ logger = LoggerBuilder("OrderRouter").add_stream_handler().build()
 
 order_router = Router()
 
+ORDER_QUEUE_PAGE_SIZE = 3
+
 
-@order_router.callback_query(F.data == CallbackqueryText.ORDER_CONFIRM.value)
+@order_router.callback_query(CallbackPrefixFilter(CallbackPrefixes.ORDER_CONFIRM))
 async def start_order_process(
     callback: CallbackQuery,
     state: FSMContext,
@@ -31,15 +45,13 @@ async def start_order_process(
     order_service: OrderService,
 ):
     try:
-        cart_data = await shop_card_service.get_card_total(callback.from_user.id)
+        cart_data = await shop_card_service.get_card_summary(callback.from_user.id)
 
         if not cart_data.items_count:
             await callback.answer("🛒 Ваша корзина пуста", show_alert=True)
             return
 
-        await state.update_data(
-            cart_contents=cart_data.items, total_price=cart_data.total_price
-        )
+        await state.update_data(total_price=cart_data.total_price)
 
         await state.set_state(OrderConfirm.waiting_for_order_note)
         text = await order_service.get_text_order_price(cart_data.total_price)
@@ -90,19 +102,21 @@ async def process_delivery_address(
     message: Message,
     state: FSMContext,
     order_service: OrderService,
+    shop_card_service: ShopCardService,
 ):
     try:
         state_data = await state.get_data()
         address = message.text.strip()
+        cart_data = await shop_card_service.get_card_total(message.from_user.id)
 
         await state.update_data(delivery_address=address)
 
         keyboard = get_order_confirm_keyboard()
         text_for_confirm = await order_service.get_text_for_confirm(
-            items=state_data["cart_contents"],
-            total_price=state_data["total_price"],
+            items=cart_data.items,
+            total_price=cart_data.total_price,
             address=address,
-            order_note=state_data.get("order_note", "не указан"),
+            order_note=state_data.get("order_note"),
         )
         await message.answer(
             text_for_confirm,
@@ -114,47 +128,45 @@ async def process_delivery_address(
         await state.clear()
 
 
-@order_router.callback_query(F.data == CallbackqueryText.ORDER_FINAL_CONFIRM.value)
+@order_router.callback_query(CallbackPrefixFilter(CallbackPrefixes.ORDER_FINAL_CONFIRM))
 async def final_order_confirmation(
     callback: CallbackQuery,
     state: FSMContext,
     order_service: OrderService,
-    shop_card_service: ShopCardService,
 ):
     try:
         state_data = await state.get_data()
-        card_contents_total = await shop_card_service.get_card_total(
-            callback.from_user.id
-        )
-        order = await order_service.create_order(
-            OrderCreate(
-                user_id=callback.from_user.id,
-                total_count=card_contents_total.items_count,
-                total_price=card_contents_total.total_price,
-                status=OrderStatus.PENDING.value,
-                products=[
-                    (card_item.product, card_item.quantity)
-                    for card_item in card_contents_total.items
-                ],
-                delivery_address=state_data.get("delivery_address"),
-                order_note=state_data.get("order_note"),
-            )
+        # Every tap on this confirmation message maps to the same order
+        order, created = await order_service.checkout(
+            callback.from_user.id,
+            f"{callback.message.chat.id}:{callback.message.message_id}",
+            delivery_address=state_data.get("delivery_address"),
+            order_note=state_data.get("order_note"),
         )
+        await state.clear()
 
-        if order:
-            await shop_card_service.clear_card(callback.from_user.id)
+        if order is None:
+            await callback.answer("🛒 Ваша корзина пуста", show_alert=True)
+            return
+        if not created:
+            await callback.answer()
+            return
 
         text = await order_service.get_text_confirm_order(order)
         await callback.message.edit_text(text)
 
-        await state.clear()
+    except OutOfStockError as e:
+        await callback.answer(
+            await order_service.formatter.get_out_of_stock_text(e.products),
+            show_alert=True,
+        )
 
     except Exception:
         await callback.message.answer(order_service.formatter.error)
         await state.clear()
 
 
-@order_router.callback_query(F.data == CallbackqueryText.ORDER_CANSEL.value)
+@order_router.callback_query(CallbackPrefixFilter(CallbackPrefixes.ORDER_CANSEL))
 async def cancel_order_process(callback: CallbackQuery, state: FSMContext):
     await state.clear()
     await callback.message.edit_text(
@@ -174,85 +186,78 @@ async def show_user_orders(message: Message, order_service: OrderService):
     await message.answer(text_orders)
 
 
+async def _show_order_queue(
+    target: Message | CallbackQuery,
+    order_service: OrderService,
+    queue: OrderQueuePage,
+) -> None:
+    status_index = ORDER_STATUSES.index(queue.status)
+    pagination_data = PaginationData(
+        text=await order_service.formatter.get_queue_title(queue.status, queue.counts),
+        item_callback=CallbackPrefixes.ORDER_RECEIVED,
+        prev_callback=CallbackPrefixes.ORDER_RECEIVED_PREV,
+        next_callback=CallbackPrefixes.ORDER_RECEIVED_NEXT,
+        page=queue.page,
+        page_size=ORDER_QUEUE_PAGE_SIZE,
+        items=queue.items,
+        total=queue.total,
+        prev_args=[status_index, queue.page - 1, *queue.first.to_args()]
+        if queue.has_prev
+        else None,
+        next_args=[status_index, queue.page + 1, *queue.last.to_args()]
+        if queue.has_next
+        else None,
+    )
+    await create_pagination(target, pagination_data)
+
+
 @order_router.message(Command("receivedorders"), IsAdmin())
 async def get_received_orders(message: Message, order_service: OrderService):
-    orders = await order_service.get_orders(filters={"status" : f"{OrderStatus.PENDING.value}"})
-
-    pagination_data = PaginationData(
-        text="Поступившие заказы на обработку:",
-        callback_name=CallbackqueryText.ORDER_RECEIVED.value,
-        page=0,
-        page_size=3,
-        items=orders,
+    queue = await order_service.get_order_queue(
+        OrderStatus.PENDING, page_size=ORDER_QUEUE_PAGE_SIZE
     )
-    await create_pagination(message, pagination_data)
+    await _show_order_queue(message, order_service, queue)
 
 
-@order_router.callback_query(
-    lambda c: CallbackPrefixes.has_prefix(c.data, CallbackPrefixes.ORDER_RECEIVED_NEXT)
-)
+@order_router.callback_query(CallbackPrefixFilter(CallbackPrefixes.ORDER_RECEIVED_NEXT))
 async def get_next_received_orders(
     callback: CallbackQuery,
+    callback_args: CallbackArgs,
     order_service: OrderService,
 ):
-    page_size, current_page = CallbackPrefixes.extract_numbers_after_prefix(
-        callback.data, CallbackPrefixes.ORDER_RECEIVED_NEXT
+    status_index, page, *cursor = callback_args.args
+    queue = await order_service.get_order_queue(
+        ORDER_STATUSES[status_index],
+        page=page,
+        after=OrderCursor.from_args(*cursor),
+        page_size=ORDER_QUEUE_PAGE_SIZE,
     )
+    await _show_order_queue(callback, order_service, queue)
 
-    orders = await order_service.get_orders(
-        skip=(current_page + page_size)
-        if page_size % 2 == 0
-        else (current_page + page_size) - 1,
-        limit=page_size,
-    )
 
-    pagination_data = PaginationData(
-        text=order_service.formatter.order_received,
-        callback_name=CallbackqueryText.ORDER_RECEIVED.value,
-        page=current_page,
-        page_size=page_size,
-        items=orders,
-    )
-
-    await create_pagination(callback, pagination_data)
-
-
-@order_router.callback_query(
-    lambda c: CallbackPrefixes.has_prefix(c.data, CallbackPrefixes.ORDER_RECEIVED_PREV)
-)
+@order_router.callback_query(CallbackPrefixFilter(CallbackPrefixes.ORDER_RECEIVED_PREV))
 async def get_prev_received_orders(
     callback: CallbackQuery,
+    callback_args: CallbackArgs,
     order_service: OrderService,
 ):
-    page_size, current_page = CallbackPrefixes.extract_numbers_after_prefix(
-        callback.data, CallbackPrefixes.ORDER_RECEIVED_PREV
-    )
-
-    orders = await order_service.get_orders(
-        skip=(current_page - 1) * page_size, limit=page_size
-    )
-
-    pagination_data = PaginationData(
-        text=order_service.formatter.order_received,
-        callback_name=CallbackqueryText.ORDER_RECEIVED.value,
-        page=current_page,
-        page_size=page_size,
-        items=orders,
+    status_index, page, *cursor = callback_args.args
+    queue = await order_service.get_order_queue(
+        ORDER_STATUSES[status_index],
+        page=page,
+        before=OrderCursor.from_args(*cursor),
+        page_size=ORDER_QUEUE_PAGE_SIZE,
     )
-
-    await create_pagination(callback, pagination_data)
+    await _show_order_queue(callback, order_service, queue)
 
 
-@order_router.callback_query(
-    lambda c: CallbackPrefixes.has_prefix(c.data, CallbackPrefixes.ORDER_RECEIVED)
-)
+@order_router.callback_query(CallbackPrefixFilter(CallbackPrefixes.ORDER_RECEIVED))
 async def show_order_text(
     callback: CallbackQuery,
+    callback_args: CallbackArgs,
     order_service: OrderService,
 ):
-    order_id = CallbackPrefixes.last_index_after_prefix(
-        callback.data, CallbackPrefixes.ORDER_RECEIVED
-    )
+    order_id = callback_args.last
     order = await order_service.get_order(order_id)
     text = await order_service.get_text_order(order)
     keyboard = get_status_order_keyboard(order.id)
@@ -260,39 +265,51 @@ async def show_order_text(
     await callback.answer()
 
 
-@order_router.callback_query(lambda c: CallbackPrefixes.has_prefix(c.data, CallbackPrefixes.ORDER_STATUS_CONFIRM))
+@order_router.callback_query(CallbackPrefixFilter(CallbackPrefixes.ORDER_STATUS_CONFIRM))
 async def order_status_confirm(
     callback: CallbackQuery,
+    callback_args: CallbackArgs,
     order_service: OrderService,
+    outbox_service: OutboxService,
 ) -> None:
-    order_id = CallbackPrefixes.last_index_after_prefix(
-        callback.data, CallbackPrefixes.ORDER_STATUS_CONFIRM
-    )
-    await order_service.update_order_status(order_id, OrderStatus.DELIVERED)
+    order_id = callback_args.last
+    try:
+        order = await order_service.update_order_status(
+            order_id, OrderStatus.DELIVERED, changed_by=callback.from_user.id
+        )
+    except OrderStatusError:
+        await callback.answer(order_service.formatter.status_final, show_alert=True)
+        return
+    if order:
+        outbox_service.wake()
     await callback.answer(order_service.formatter.order_status_change, show_alert=True)
 
 
-@order_router.callback_query(lambda c: CallbackPrefixes.has_prefix(c.data, CallbackPrefixes.ORDER_STATUS_CANSEL))
+@order_router.callback_query(CallbackPrefixFilter(CallbackPrefixes.ORDER_STATUS_CANSEL))
 async def order_status_cansel(
     callback: CallbackQuery,
+    callback_args: CallbackArgs,
     order_service: OrderService,
+    outbox_service: OutboxService,
+    inventory_service: InventoryService,
 ) -> None:
-    order_id = CallbackPrefixes.last_index_after_prefix(
-        callback.data, CallbackPrefixes.ORDER_STATUS_CANSEL
-    )
-    await order_service.update_order_status(order_id, OrderStatus.CANCELLED)
+    order_id = callback_args.last
+    try:
+        order = await order_service.update_order_status(
+            order_id, OrderStatus.CANCELLED, changed_by=callback.from_user.id
+        )
+    except OrderStatusError:
+        await callback.answer(order_service.formatter.status_final, show_alert=True)
+        return
+    if order:
+        outbox_service.wake()
+        inventory_service.wake()
     await callback.answer(order_service.formatter.order_status_change, show_alert=True)
 
 
 @order_router.message(Command("delivereddorders"), IsAdmin())
 async def get_confirm_orders(message: Message, order_service: OrderService):
-    orders = await order_service.get_orders(filters={"status" : f"{OrderStatus.DELIVERED.value}"})
-
-    pagination_data = PaginationData(
-        text="Доставленные заказы:",
-        callback_name=CallbackqueryText.ORDER_RECEIVED.value,
-        page=0,
-        page_size=3,
-        items=orders,
+    queue = await order_service.get_order_queue(
+        OrderStatus.DELIVERED, page_size=ORDER_QUEUE_PAGE_SIZE
     )
-    await create_pagination(message, pagination_data)
\ No newline at end of file
+    await _show_order_queue(message, order_service, queue)
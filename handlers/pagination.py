@@ -5,7 +5,8 @@ from aiogram.types import (
     Message,
 )
 
-from core.internal.types import PaginationData
+from core.internal.enums import CallbackPrefixes
+from core.internal.types import PaginationData, pack_callback
 from utils import StringBuilder
 
 
@@ -14,19 +15,17 @@ async def create_pagination(
 ) -> None:
     
     if not len(pagination_data.items):
-        await message.answer("Заказов больше нет!", show_alert=True)
+        if isinstance(message, CallbackQuery):
+            await message.answer("Заказов больше нет!", show_alert=True)
+        else:
+            await message.answer("Заказов больше нет!")
         return
     
     text = await _generate_text_pagination(
-        pagination_data.text, pagination_data.items, pagination_data.page
+        pagination_data.text, pagination_data.total, pagination_data.page
     )
   
-    keyboard = await _get_pagination_keyboard(
-        pagination_data.callback_name,
-        pagination_data.items,
-        pagination_data.page,
-        pagination_data.page_size,
-    )
+    keyboard = await _get_pagination_keyboard(pagination_data)
 
     if isinstance(message, CallbackQuery):
         await message.message.edit_text(text=text, reply_markup=keyboard)
@@ -35,38 +34,37 @@ async def create_pagination(
         await message.answer(text, reply_markup=keyboard)
 
 
-async def _generate_text_pagination(answer_text: str, items: list, page: int) -> str:
+async def _generate_text_pagination(answer_text: str, total: int, page: int) -> str:
     text = StringBuilder(answer_text)
     text.append("\n")
-
-    if items:
-        text.append(f"Страница: {page + 1}")
-        text.append("\n")
-
-    text.append(f"Общее кол-во: {len(items)}")
+    text.append(f"Страница: {page + 1}")
+    text.append("\n")
+    text.append(f"Общее кол-во: {total}")
     return text.to_string()
 
 
 async def _get_pagination_keyboard(
-    callback_name: str, items: list, current_page: int, page_size: int
+    pagination_data: PaginationData,
 ) -> InlineKeyboardMarkup:
-    total_items = len(items)
+    items = pagination_data.items
+    page_size = pagination_data.page_size
     keyboard = InlineKeyboardMarkup(inline_keyboard=[])
 
-    await _paginate_items(keyboard, items, callback_name, page_size)
-    await _set_nav_buttons(
-        keyboard, total_items, callback_name, current_page, page_size
-    )
+    await _paginate_items(keyboard, items, pagination_data.item_callback, page_size)
+    await _set_nav_buttons(keyboard, pagination_data)
 
     return keyboard
 
 
 async def _paginate_items(
-    keyboard: InlineKeyboardMarkup, items: list, callback_name: str, page_size: int
+    keyboard: InlineKeyboardMarkup,
+    items: list,
+    item_callback: CallbackPrefixes,
+    page_size: int,
 ) -> None:
     buttons = [
         InlineKeyboardButton(
-            text=f"{item.id}", callback_data=f"{callback_name}_{item.id}"
+            text=f"{item.id}", callback_data=pack_callback(item_callback, item.id)
         )
         for item in items[:page_size]
     ]
@@ -76,30 +74,29 @@ async def _paginate_items(
 
 
 async def _set_nav_buttons(
-    keyboard: InlineKeyboardMarkup,
-    total_items: int,
-    callback_name: str,
-    current_page: int,
-    page_size: int
+    keyboard: InlineKeyboardMarkup, pagination_data: PaginationData
 ) -> None:
-
     nav_buttons = []
 
-    if current_page > 0:
+    if pagination_data.prev_args is not None:
         nav_buttons.append(
             InlineKeyboardButton(
                 text="⬅️ Предыдущая",
-                callback_data=f"{callback_name}_prev_{page_size}_{current_page - 1}",
+                callback_data=pack_callback(
+                    pagination_data.prev_callback, *pagination_data.prev_args
+                ),
             )
         )
 
-    if total_items:
+    if pagination_data.next_args is not None:
         nav_buttons.append(
             InlineKeyboardButton(
                 text="Следующая ➡️",
-                callback_data=f"{callback_name}_next_{page_size}_{current_page + 1}",
+                callback_data=pack_callback(
+                    pagination_data.next_callback, *pagination_data.next_args
+                ),
             )
         )
 
     if nav_buttons:
-        keyboard.inline_keyboard.append(nav_buttons)
\ No newline at end of file
+        keyboard.inline_keyboard.append(nav_buttons)
@@ -1,4 +1,4 @@
-from aiogram import Bot, Router, html
+from aiogram import Bot, Router
 from aiogram.types import CallbackQuery, InputMediaPhoto
 
 from core.infrastructure.services import (
@@ -7,35 +7,37 @@ from core.infrastructure.services import (
     CatalogService,
 )
 from core.internal.enums import CallbackPrefixes
-from filters import IsAdmin
-from keyboards import (
-    get_catalog_keyboard,
-)
+from core.internal.types import CallbackArgs
+from filters import CallbackPrefixFilter
 
 product_delete_router = Router()
 
 
-@product_delete_router.callback_query(lambda c: CallbackPrefixes.has_prefix(c.data, CallbackPrefixes.PRODUCT_DELETE))
-async def confirm_delete(callback: CallbackQuery, catalog_service: CatalogService):
-    product_id = CallbackPrefixes.last_index_after_prefix(callback.data, CallbackPrefixes.PRODUCT_DELETE)
+@product_delete_router.callback_query(CallbackPrefixFilter(CallbackPrefixes.PRODUCT_DELETE))
+async def confirm_delete(
+    callback: CallbackQuery, callback_args: CallbackArgs, catalog_service: CatalogService
+):
+    product_id = callback_args.last
     try:
         is_delete = await catalog_service.delete_product(product_id)
         if is_delete:
-            caption = catalog_service.config.delete_success.format(
-                name=html.bold(product_id)
-            )
+            caption = catalog_service.config.delete_success
             await callback.message.edit_caption(caption=caption)
 
     except Exception as e:
-        await callback.answer(catalog_service.config.error_text.format(error=str(e)))
+        await callback.answer(catalog_service.config.get_error_text(str(e)))
 
 
-@product_delete_router.callback_query(lambda c: CallbackPrefixes.has_prefix(c.data, CallbackPrefixes.PRODUCT_CANSEL_DELETE))
+@product_delete_router.callback_query(CallbackPrefixFilter(CallbackPrefixes.PRODUCT_CANSEL_DELETE))
 async def cancel_delete(
-    callback: CallbackQuery, bot: Bot, catalog_service: CatalogService
+    callback: CallbackQuery,
+    callback_args: CallbackArgs,
+    bot: Bot,
+    catalog_service: CatalogService,
+    is_admin: bool,
 ) -> None:
     try:
-        product_id = CallbackPrefixes.last_index_after_prefix(callback.data, CallbackPrefixes.PRODUCT_CANSEL_DELETE)
+        product_id = callback_args.last
         products = await catalog_service.get_products()
 
         if not products:
@@ -58,8 +60,9 @@ async def cancel_delete(
             args=ProductCaptionArgs(product=product),
         )
 
-        is_admin = await IsAdmin()(callback)
-        keyboard = get_catalog_keyboard(current_index, product.id, len(products), is_admin)
+        keyboard = catalog_service.get_catalog_keyboard(
+            product, current_index, len(products), is_admin
+        )
 
         if image_file := await catalog_service.get_product_image(product.id, product):
             await bot.edit_message_media(
@@ -80,6 +83,6 @@ async def cancel_delete(
 
     except Exception as e:
         await callback.message.edit_text(
-            catalog_service.config.error_text.format(error=str(e))
+            catalog_service.config.get_error_text(str(e))
         )
         await callback.answer()
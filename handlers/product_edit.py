@@ -10,19 +10,22 @@ from core.infrastructure.services import (
 )
 from core.internal.enums import CallbackPrefixes
 from core.internal.models import ProductUpdate
+from core.internal.types import CallbackArgs
+from filters import CallbackPrefixFilter
 from states import EditProduct
 from utils import ImageSelector
 
 product_edit_router = Router()
 
 
-@product_edit_router.callback_query(lambda c: CallbackPrefixes.has_prefix(c.data, CallbackPrefixes.PRODUCT_EDIT_NAME))
+@product_edit_router.callback_query(CallbackPrefixFilter(CallbackPrefixes.PRODUCT_EDIT_NAME))
 async def proccess_edit_name(
-    callback: CallbackQuery, state: FSMContext, catalog_service: CatalogService
+    callback: CallbackQuery,
+    callback_args: CallbackArgs,
+    state: FSMContext,
+    catalog_service: CatalogService,
 ):
-    product_id = CallbackPrefixes.last_index_after_prefix(
-        callback.data, CallbackPrefixes.PRODUCT_EDIT_NAME
-    )
+    product_id = callback_args.last
     await callback.message.answer(catalog_service.config.edit_name_prompt)
     await state.update_data(product_id=product_id)
     await state.set_state(EditProduct.waiting_for_name)
@@ -65,13 +68,14 @@ async def process_edit_name(
     await state.clear()
 
 
-@product_edit_router.callback_query(lambda c: CallbackPrefixes.has_prefix(c.data, CallbackPrefixes.PRODUCT_EDIT_DESCRIPTION))
+@product_edit_router.callback_query(CallbackPrefixFilter(CallbackPrefixes.PRODUCT_EDIT_DESCRIPTION))
 async def proccess_edit_descriprion(
-    callback: CallbackQuery, state: FSMContext, catalog_service: CatalogService
+    callback: CallbackQuery,
+    callback_args: CallbackArgs,
+    state: FSMContext,
+    catalog_service: CatalogService,
 ):
-    product_id = CallbackPrefixes.last_index_after_prefix(
-        callback.data, CallbackPrefixes.PRODUCT_EDIT_DESCRIPTION
-    )
+    product_id = callback_args.last
     await callback.message.answer(catalog_service.config.edit_description_prompt)
     await state.update_data(product_id=product_id)
     await state.set_state(EditProduct.waiting_for_description)
@@ -113,13 +117,14 @@ async def process_edit_description(
     await state.clear()
 
 
-@product_edit_router.callback_query(lambda c: CallbackPrefixes.has_prefix(c.data, CallbackPrefixes.PRODUCT_EDIT_PRICE))
+@product_edit_router.callback_query(CallbackPrefixFilter(CallbackPrefixes.PRODUCT_EDIT_PRICE))
 async def proccess_edit_price(
-    callback: CallbackQuery, state: FSMContext, catalog_service: CatalogService
+    callback: CallbackQuery,
+    callback_args: CallbackArgs,
+    state: FSMContext,
+    catalog_service: CatalogService,
 ):
-    product_id = CallbackPrefixes.last_index_after_prefix(
-        callback.data, CallbackPrefixes.PRODUCT_EDIT_PRICE
-    )
+    product_id = callback_args.last
     await callback.message.answer(catalog_service.config.edit_price_prompt)
     await state.update_data(product_id=product_id)
     await state.set_state(EditProduct.waiting_for_price)
@@ -167,13 +172,14 @@ async def process_edit_price(
     await state.clear()
 
 
-@product_edit_router.callback_query(lambda c: CallbackPrefixes.has_prefix(c.data, CallbackPrefixes.PRODUCT_EDIT_IMAGE))
+@product_edit_router.callback_query(CallbackPrefixFilter(CallbackPrefixes.PRODUCT_EDIT_IMAGE))
 async def proccess_edit_image(
-    callback: CallbackQuery, state: FSMContext, catalog_service: CatalogService
+    callback: CallbackQuery,
+    callback_args: CallbackArgs,
+    state: FSMContext,
+    catalog_service: CatalogService,
 ):
-    product_id = CallbackPrefixes.last_index_after_prefix(
-        callback.data, CallbackPrefixes.PRODUCT_EDIT_IMAGE
-    )
+    product_id = callback_args.last
     await callback.message.answer(catalog_service.config.edit_image_prompt)
     await state.update_data(product_id=product_id)
     await state.set_state(EditProduct.waiting_for_image)
@@ -198,9 +204,13 @@ async def process_edit_image(
 
     try:
         image_bytes = await ImageSelector.get_image_bytes(message, bot)
+        image_file_id = await ImageSelector.get_image_file_id(message)
 
         product = await catalog_service.update_product(
-            product_id=product_id, product_data=ProductUpdate(image=image_bytes.read())
+            product_id=product_id,
+            product_data=ProductUpdate(
+                image=image_bytes.read(), image_file_id=image_file_id
+            ),
         )
 
         caption = catalog_service.build_caption(
@@ -217,3 +227,61 @@ async def process_edit_image(
         await message.answer(caption)
 
     await state.clear()
+
+
+@product_edit_router.callback_query(CallbackPrefixFilter(CallbackPrefixes.PRODUCT_EDIT_STOCK))
+async def proccess_edit_stock(
+    callback: CallbackQuery,
+    callback_args: CallbackArgs,
+    state: FSMContext,
+    catalog_service: CatalogService,
+):
+    product_id = callback_args.last
+    await callback.message.answer(catalog_service.config.edit_stock_prompt)
+    await state.update_data(product_id=product_id)
+    await state.set_state(EditProduct.waiting_for_stock)
+    await callback.answer()
+
+
+@product_edit_router.message(EditProduct.waiting_for_stock)
+async def process_edit_stock(
+    message: Message, state: FSMContext, catalog_service: CatalogService
+):
+    data = await state.get_data()
+    product_id = data.get("product_id")
+    user_message = message.text.strip() if message.text else ""
+
+    if user_message.lower() == "skip":
+        await message.answer("Остаток не изменён")
+        await state.clear()
+        return
+
+    # '-' stops tracking: the product can be ordered without limit
+    if user_message == "-":
+        stock = None
+    elif user_message.isdigit():
+        stock = int(user_message)
+    else:
+        await message.answer(catalog_service.config.edit_invalid_stock)
+        return
+
+    try:
+        product = await catalog_service.update_product(
+            product_id=product_id, product_data=ProductUpdate(stock=stock)
+        )
+
+        caption = catalog_service.build_caption(
+            strategy_type=CaptionStrategyType.EDIT,
+            args=ProductCaptionArgs(product=product),
+        )
+
+        await message.answer(caption)
+
+    except Exception as e:
+        caption = catalog_service.build_caption_error(
+            strategy_type=CaptionStrategyType.EDIT,
+            args=ErrorCaptionArg(error=e),
+        )
+        await message.answer(caption)
+
+    await state.clear()
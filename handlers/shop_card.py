@@ -1,11 +1,14 @@
+from typing import Optional
+
 from aiogram import Bot, Router
 from aiogram.filters import Command
 from aiogram.types import CallbackQuery, InputMediaPhoto, Message
 
 from core.infrastructure.services import CatalogService, ShopCardService
 from core.internal.enums import CallbackPrefixes
-from core.internal.types import CartCallbackData
 from core.internal.models import ShopCardItemCreate, ShopCardItemUpdate
+from core.internal.types import CallbackArgs, ShopCardTotal
+from filters import CallbackPrefixFilter
 from keyboards import get_shop_card_keyboard
 from logger import LoggerBuilder
 from utils import handle_shopcard_errors
@@ -21,22 +24,23 @@ async def command_shopcard(
     shop_card_service: ShopCardService,
     catalog_service: CatalogService,
 ) -> None:
-    cart_contents = await shop_card_service.get_card_contents(message.from_user.id)
+    cart = await shop_card_service.get_card_total(message.from_user.id)
 
-    if not cart_contents:
+    if not cart.items:
         await message.answer("🛒 Ваша корзина пуста")
         return
 
-    product = await catalog_service.get_product(cart_contents[0].product_id)
-    total_text_res = await shop_card_service.get_total_caption(cart_contents)
-    keyboard = get_shop_card_keyboard(0, product.id, len(cart_contents))
+    product = await catalog_service.get_product(cart.items[0].product_id)
+    total_text_res = await shop_card_service.get_total_caption(cart)
+    keyboard = get_shop_card_keyboard(0, product.id, len(cart.items))
 
     if image_file := await catalog_service.get_product_image(product.id, product):
-        await message.answer_photo(
+        sent = await message.answer_photo(
             photo=image_file,
             caption=f"Текущий товар: {product.name}\n\n{total_text_res}",
             reply_markup=keyboard,
         )
+        await catalog_service.remember_image_file_id(product, sent)
     else:
         await message.answer(
             text=f"Текущий товар: {product.name}\n\n{total_text_res}",
@@ -50,14 +54,14 @@ async def clear_cart_handler(message: Message, shop_card_service: ShopCardServic
     await message.answer("🛒 Корзина очищена" if success else "🛒 Корзина уже пуста")
 
 
-@shop_card_router.callback_query(lambda c: CallbackPrefixes.has_prefix(c.data, CallbackPrefixes.SHOPCARD_ADD))
+@shop_card_router.callback_query(CallbackPrefixFilter(CallbackPrefixes.SHOPCARD_ADD))
 @handle_shopcard_errors
 async def handle_add_to_cart(
-    callback: CallbackQuery, shop_card_service: ShopCardService
+    callback: CallbackQuery,
+    callback_args: CallbackArgs,
+    shop_card_service: ShopCardService,
 ):
-    product_id = CallbackPrefixes.last_index_after_prefix(
-        callback.data, CallbackPrefixes.SHOPCARD_ADD
-    )
+    product_id = callback_args.last
     await shop_card_service.add_to_card(
         user_id=callback.from_user.id,
         item_data=ShopCardItemCreate(product_id=product_id, quantity=1),
@@ -65,17 +69,16 @@ async def handle_add_to_cart(
     await callback.answer("✅ Товар добавлен в корзину.", show_alert=True)
 
 
-@shop_card_router.callback_query(lambda c: CallbackPrefixes.has_prefix(c.data, CallbackPrefixes.SHOPCARD_DELETE))
+@shop_card_router.callback_query(CallbackPrefixFilter(CallbackPrefixes.SHOPCARD_DELETE))
 @handle_shopcard_errors
 async def delete_from_shopcard(
     callback: CallbackQuery,
+    callback_args: CallbackArgs,
     bot: Bot,
     shop_card_service: ShopCardService,
     catalog_service: CatalogService,
 ):
-    product_id = CallbackPrefixes.last_index_after_prefix(
-        callback.data, CallbackPrefixes.SHOPCARD_DELETE
-    )
+    product_id = callback_args.last
     success = await shop_card_service.remove_from_card(
         callback.from_user.id, product_id
     )
@@ -84,9 +87,9 @@ async def delete_from_shopcard(
         await callback.answer("❌ Товар не найден в корзине", show_alert=True)
         return
 
-    cart_contents = await shop_card_service.get_card_contents(callback.from_user.id)
+    cart = await shop_card_service.get_card_total(callback.from_user.id)
 
-    if not cart_contents:
+    if not cart.items:
         await callback.answer("✅ Корзина теперь пуста", show_alert=True)
         await bot.delete_message(
             chat_id=callback.message.chat.id, message_id=callback.message.message_id
@@ -96,62 +99,66 @@ async def delete_from_shopcard(
     await update_cart_message(
         bot,
         callback,
-        cart_contents,
+        cart,
         0,
-        cart_contents[0].product_id,
+        cart.items[0].product_id,
         catalog_service,
         shop_card_service,
+        shown_product_id=product_id,
     )
     await callback.answer("✅ Товар удален из корзины.")
 
 
-@shop_card_router.callback_query(lambda c: CallbackPrefixes.has_prefix(c.data, CallbackPrefixes.SHOPCARD_ITEM_INCREMENT))
+@shop_card_router.callback_query(CallbackPrefixFilter(CallbackPrefixes.SHOPCARD_ITEM_INCREMENT))
 @handle_shopcard_errors
 async def shopcard_item_inc(
     callback: CallbackQuery,
+    callback_args: CallbackArgs,
     bot: Bot,
     shop_card_service: ShopCardService,
     catalog_service: CatalogService,
 ):
-    cb_data = CartCallbackData.parse(callback.data)
-    if not cb_data:
+    if len(callback_args.args) != 2:
         await callback.answer("❌ Неверный формат данных", show_alert=True)
         return
+    current_index, product_id = callback_args.args
 
     await shop_card_service.add_to_card(
         user_id=callback.from_user.id,
-        item_data=ShopCardItemCreate(product_id=cb_data.product_id, quantity=1),
+        item_data=ShopCardItemCreate(product_id=product_id, quantity=1),
     )
 
-    cart_contents = await shop_card_service.get_card_contents(callback.from_user.id)
+    cart = await shop_card_service.get_card_total(callback.from_user.id)
     await update_cart_message(
         bot,
         callback,
-        cart_contents,
-        cb_data.current_index,
-        cb_data.product_id,
+        cart,
+        current_index,
+        product_id,
         catalog_service,
         shop_card_service,
+        shown_product_id=product_id,
     )
     await callback.answer("✅ Кол-во увеличено")
 
 
-@shop_card_router.callback_query(lambda c: CallbackPrefixes.has_prefix(c.data, CallbackPrefixes.SHOPCARD_ITEM_DECREMENT))
+@shop_card_router.callback_query(CallbackPrefixFilter(CallbackPrefixes.SHOPCARD_ITEM_DECREMENT))
 @handle_shopcard_errors
 async def shopcard_item_dec(
     callback: CallbackQuery,
+    callback_args: CallbackArgs,
     bot: Bot,
     shop_card_service: ShopCardService,
     catalog_service: CatalogService,
 ):
-    cb_data = CartCallbackData.parse(callback.data)
-    if not cb_data:
+    if len(callback_args.args) != 2:
         await callback.answer("❌ Неверный формат данных", show_alert=True)
         return
+    current_index, product_id = callback_args.args
 
-    cart_contents = await shop_card_service.get_card_contents(callback.from_user.id)
+    cart = await shop_card_service.get_card_total(callback.from_user.id)
     current_item = next(
-        (item for item in cart_contents if item.product_id == cb_data.product_id), None
+        (item for item in cart.items if item.product_id == product_id), None
     )
 
     if not current_item:
@@ -160,11 +167,11 @@ async def shopcard_item_dec(
 
     if current_item.quantity <= 1:
         await shop_card_service.remove_from_card(
-            callback.from_user.id, cb_data.product_id
+            callback.from_user.id, product_id
         )
-        cart_contents = await shop_card_service.get_card_contents(callback.from_user.id)
+        cart = await shop_card_service.get_card_total(callback.from_user.id)
 
-        if not cart_contents:
+        if not cart.items:
             await callback.answer("✅ Корзина теперь пуста", show_alert=True)
             await bot.delete_message(
                 chat_id=callback.message.chat.id, message_id=callback.message.message_id
@@ -174,45 +181,50 @@ async def shopcard_item_dec(
         await update_cart_message(
             bot,
             callback,
-            cart_contents,
+            cart,
             0,
-            cart_contents[0].product_id,
+            cart.items[0].product_id,
             catalog_service,
             shop_card_service,
+            shown_product_id=product_id,
         )
         await callback.answer("✅ Товар удален")
     else:
         await shop_card_service.update_card_item(
+            user_id=callback.from_user.id,
             item_id=current_item.id,
             update_data=ShopCardItemUpdate(quantity=current_item.quantity - 1),
         )
+        cart = await shop_card_service.get_card_total(callback.from_user.id)
         await update_cart_message(
             bot,
             callback,
-            cart_contents,
-            cb_data.current_index,
-            cb_data.product_id,
+            cart,
+            current_index,
+            product_id,
             catalog_service,
             shop_card_service,
+            shown_product_id=product_id,
         )
         await callback.answer("✅ Кол-во уменьшено")
 
 
-@shop_card_router.callback_query(lambda c: CallbackPrefixes.has_prefix(c.data, CallbackPrefixes.SHOPCARD_ITEM_PREV))
+@shop_card_router.callback_query(CallbackPrefixFilter(CallbackPrefixes.SHOPCARD_ITEM_PREV))
 @handle_shopcard_errors
 async def handle_prev_item(
     callback: CallbackQuery,
+    callback_args: CallbackArgs,
     bot: Bot,
     shop_card_service: ShopCardService,
     catalog_service: CatalogService,
 ):
-    cb_data = CartCallbackData.parse(callback.data)
-    if not cb_data:
+    if len(callback_args.args) != 2:
         await callback.answer("❌ Неверный формат данных", show_alert=True)
         return
+    _, product_id = callback_args.args
 
-    cart_contents = await shop_card_service.get_card_contents(callback.from_user.id)
-    if not cart_contents:
+    cart = await shop_card_service.get_card_total(callback.from_user.id)
+    if not cart.items:
         await callback.answer("🛒 Корзина пуста", show_alert=True)
         await bot.delete_message(
             chat_id=callback.message.chat.id, message_id=callback.message.message_id
@@ -222,41 +234,43 @@ async def handle_prev_item(
     current_pos = next(
         (
             i
-            for i, item in enumerate(cart_contents)
-            if item.product_id == cb_data.product_id
+            for i, item in enumerate(cart.items)
+            if item.product_id == product_id
         ),
         0,
     )
-    new_pos = (current_pos - 1) % len(cart_contents)
-    new_product_id = cart_contents[new_pos].product_id
+    new_pos = (current_pos - 1) % len(cart.items)
+    new_product_id = cart.items[new_pos].product_id
 
     await update_cart_message(
         bot,
         callback,
-        cart_contents,
+        cart,
         new_pos,
         new_product_id,
         catalog_service,
         shop_card_service,
+        shown_product_id=product_id,
     )
     await callback.answer()
 
 
-@shop_card_router.callback_query(lambda c: CallbackPrefixes.has_prefix(c.data, CallbackPrefixes.SHOPCARD_ITEM_NEXT))
+@shop_card_router.callback_query(CallbackPrefixFilter(CallbackPrefixes.SHOPCARD_ITEM_NEXT))
 @handle_shopcard_errors
 async def handle_next_item(
     callback: CallbackQuery,
+    callback_args: CallbackArgs,
     bot: Bot,
     shop_card_service: ShopCardService,
     catalog_service: CatalogService,
 ):
-    cb_data = CartCallbackData.parse(callback.data)
-    if not cb_data:
+    if len(callback_args.args) != 2:
         await callback.answer("❌ Неверный формат данных", show_alert=True)
         return
+    _, product_id = callback_args.args
 
-    cart_contents = await shop_card_service.get_card_contents(callback.from_user.id)
-    if not cart_contents:
+    cart = await shop_card_service.get_card_total(callback.from_user.id)
+    if not cart.items:
         await callback.answer("🛒 Корзина пуста", show_alert=True)
         await bot.delete_message(
             chat_id=callback.message.chat.id, message_id=callback.message.message_id
@@ -266,22 +280,23 @@ async def handle_next_item(
     current_pos = next(
         (
             i
-            for i, item in enumerate(cart_contents)
-            if item.product_id == cb_data.product_id
+            for i, item in enumerate(cart.items)
+            if item.product_id == product_id
         ),
         0,
     )
-    new_pos = (current_pos + 1) % len(cart_contents)
-    new_product_id = cart_contents[new_pos].product_id
+    new_pos = (current_pos + 1) % len(cart.items)
+    new_product_id = cart.items[new_pos].product_id
 
     await update_cart_message(
         bot,
         callback,
-        cart_contents,
+        cart,
         new_pos,
         new_product_id,
         catalog_service,
         shop_card_service,
+        shown_product_id=product_id,
     )
     await callback.answer()
 
@@ -289,34 +304,43 @@ async def handle_next_item(
 async def update_cart_message(
     bot: Bot,
     callback: CallbackQuery,
-    cart_contents: list,
+    cart: ShopCardTotal,
     current_index: int,
     product_id: int,
     catalog_service: CatalogService,
     shop_card_service: ShopCardService,
+    shown_product_id: Optional[int] = None,
 ) -> None:
+    """
+    Show ``product_id`` in the cart message.
+
+    The photo is only replaced when the message currently shows another
+    product (``shown_product_id``); otherwise just the caption and keyboard
+    are edited.
+    """
     product = await catalog_service.get_product(product_id)
     if not product:
         await callback.answer("❌ Товар не найден", show_alert=True)
         return
 
-    total_text = await shop_card_service.get_total_caption(cart_contents)
-    keyboard = get_shop_card_keyboard(current_index, product_id, len(cart_contents))
+    total_text = await shop_card_service.get_total_caption(cart)
+    caption = f"Текущий товар: {product.name}\n\n{total_text}"
+    keyboard = get_shop_card_keyboard(current_index, product_id, len(cart.items))
 
-    if image_file := await catalog_service.get_product_image(product_id, product):
-        media = InputMediaPhoto(
-            media=image_file, caption=f"Текущий товар: {product.name}\n\n{total_text}"
-        )
-        await bot.edit_message_media(
-            media=media,
+    if product_id != shown_product_id and (
+        image_file := await catalog_service.get_product_image(product_id, product)
+    ):
+        edited = await bot.edit_message_media(
+            media=InputMediaPhoto(media=image_file, caption=caption),
             chat_id=callback.message.chat.id,
             message_id=callback.message.message_id,
             reply_markup=keyboard,
         )
+        await catalog_service.remember_image_file_id(product, edited)
     else:
         await bot.edit_message_caption(
             chat_id=callback.message.chat.id,
             message_id=callback.message.message_id,
-            caption=f"Текущий товар: {product.name}\n\n{total_text}",
+            caption=caption,
             reply_markup=keyboard,
         )
@@ -0,0 +1,72 @@
+from aiogram import Router
+from aiogram.filters import Command, CommandObject
+from aiogram.types import FSInputFile, Message
+
+from core.infrastructure.services import AnalyticsService, OrderExportService
+from core.infrastructure.tracing import TracingDisplayFormatter, UpdateTracer
+from filters import IsAdmin
+from logger import LoggerBuilder
+
+logger = LoggerBuilder("StatsRouter").add_stream_handler().build()
+
+stats_router = Router()
+
+
+@stats_router.message(Command("stats"), IsAdmin())
+async def command_stats(
+    message: Message, command: CommandObject, analytics_service: AnalyticsService
+) -> None:
+    days = None
+    if command.args:
+        if not command.args.strip().isdigit():
+            await message.answer(analytics_service.formatter.usage)
+            return
+        days = int(command.args)
+
+    try:
+        await message.answer(await analytics_service.get_report_text(days))
+    except Exception as e:
+        logger.error(f"Stats report failed: {e}")
+        await message.answer(analytics_service.formatter.error)
+
+
+@stats_router.message(Command("exportorders"), IsAdmin())
+async def command_export_orders(
+    message: Message,
+    command: CommandObject,
+    order_export_service: OrderExportService,
+) -> None:
+    formatter = order_export_service.formatter
+    days = None
+    if command.args:
+        if not command.args.strip().isdigit() or not int(command.args):
+            await message.answer(formatter.export_usage)
+            return
+        days = int(command.args)
+
+    try:
+        async with order_export_service.export_orders(days) as export:
+            if not export.rows:
+                await message.answer(formatter.export_empty)
+                return
+            await message.answer_document(
+                FSInputFile(export.path, filename=export.filename),
+                caption=await formatter.get_export_caption(export),
+            )
+    except Exception as e:
+        logger.error(f"Order export failed: {e}")
+        await message.answer(formatter.export_error)
+
+
+@stats_router.message(Command("slowupdates"), IsAdmin())
+async def command_slow_updates(
+    message: Message,
+    update_tracer: UpdateTracer,
+    tracing_formatter: TracingDisplayFormatter,
+) -> None:
+    config = update_tracer.config
+    await message.answer(
+        await tracing_formatter.get_slow_updates_text(
+            update_tracer.slow_updates(config.dump_limit), config.slow_threshold
+        )
+    )
@@ -1,6 +1,9 @@
 from aiogram.types import InlineKeyboardMarkup, InlineKeyboardButton
 from aiogram.utils.keyboard import InlineKeyboardBuilder
 
+from core.internal.enums import CallbackPrefixes
+from core.internal.types import pack_callback
+
 def get_catalog_keyboard(
     current_index: int,
     product_id: int, 
@@ -24,7 +27,7 @@ def get_catalog_keyboard(
         navigation_buttons.append(
             InlineKeyboardButton(
                 text="⬅️ Предыдущий", 
-                callback_data=f"catalog_prev_{current_index}"
+                callback_data=pack_callback(CallbackPrefixes.CATALOG_PREV, current_index)
             )
         )
     
@@ -32,7 +35,7 @@ def get_catalog_keyboard(
         navigation_buttons.append(
             InlineKeyboardButton(
                 text="Следующий ➡️", 
-                callback_data=f"catalog_next_{current_index}"
+                callback_data=pack_callback(CallbackPrefixes.CATALOG_NEXT, current_index)
             )
         )
 
@@ -42,17 +45,17 @@ def get_catalog_keyboard(
         admin_buttons.extend([
             InlineKeyboardButton(
                 text="Удалить ❌", 
-                callback_data=f"catalog_delete_{current_index}"
+                callback_data=pack_callback(CallbackPrefixes.CATALOG_DELETE, current_index)
             ),
             InlineKeyboardButton(
                 text="Редактировать ✏️", 
-                callback_data=f"catalog_edit_{current_index}"
+                callback_data=pack_callback(CallbackPrefixes.CATALOG_EDIT, current_index)
             )
         ])
 
     shop_card_button = [InlineKeyboardButton(
         text="Добавить в корзину 🛒",
-        callback_data=f"shopcard_add_{product_id}"
+        callback_data=pack_callback(CallbackPrefixes.SHOPCARD_ADD, product_id)
     )]
 
     # Combine rows (filter empty rows)
@@ -66,17 +69,18 @@ def get_catalog_keyboard(
 
 def get_confirm_delete_keyboard(product_id: int) -> InlineKeyboardMarkup:
     builder = InlineKeyboardBuilder()
-    builder.button(text="✅ Подтвердить", callback_data=f"confirm_delete_{product_id}")
-    builder.button(text="❌ Отменить", callback_data=f"cancel_delete_{product_id}") 
+    builder.button(text="✅ Подтвердить", callback_data=pack_callback(CallbackPrefixes.PRODUCT_DELETE, product_id))
+    builder.button(text="❌ Отменить", callback_data=pack_callback(CallbackPrefixes.PRODUCT_CANSEL_DELETE, product_id)) 
     builder.adjust(2)
     return builder.as_markup()
 
 def get_edit_keyboard(product_id: int, current_index: int) -> InlineKeyboardMarkup:
     builder = InlineKeyboardBuilder()
-    builder.button(text="✏️ Название", callback_data=f"edit_name_{product_id}")
-    builder.button(text="📝 Описание", callback_data=f"edit_desc_{product_id}")
-    builder.button(text="💵 Цена", callback_data=f"edit_price_{product_id}")
-    builder.button(text="🖼️ Изображение", callback_data=f"edit_image_{product_id}")
-    builder.button(text="⬅️ Назад", callback_data=f"catalog_prev_{current_index + 1}")
-    builder.adjust(2, 2, 1)
+    builder.button(text="✏️ Название", callback_data=pack_callback(CallbackPrefixes.PRODUCT_EDIT_NAME, product_id))
+    builder.button(text="📝 Описание", callback_data=pack_callback(CallbackPrefixes.PRODUCT_EDIT_DESCRIPTION, product_id))
+    builder.button(text="💵 Цена", callback_data=pack_callback(CallbackPrefixes.PRODUCT_EDIT_PRICE, product_id))
+    builder.button(text="🖼️ Изображение", callback_data=pack_callback(CallbackPrefixes.PRODUCT_EDIT_IMAGE, product_id))
+    builder.button(text="📦 Остаток", callback_data=pack_callback(CallbackPrefixes.PRODUCT_EDIT_STOCK, product_id))
+    builder.button(text="⬅️ Назад", callback_data=pack_callback(CallbackPrefixes.CATALOG_PREV, current_index + 1))
+    builder.adjust(2, 2, 1, 1)
     return builder.as_markup()
\ No newline at end of file
@@ -8,6 +8,8 @@ from aiogram.types import (
 )
 
 from core.infrastructure.database.models import Dialog
+from core.internal.enums import CallbackPrefixes
+from core.internal.types import pack_callback
 
 
 def get_dialog_keyboard() -> ReplyKeyboardMarkup:
@@ -27,7 +29,8 @@ def get_apeals_keyboard(dialogs: List[Dialog]) -> InlineKeyboardMarkup:
 
     buttons = [
         InlineKeyboardButton(
-            text=f"{dialog.user1_id}", callback_data=f"dialog_apeals_{dialog.id}"
+            text=f"{dialog.user1_id}",
+            callback_data=pack_callback(CallbackPrefixes.DIALOG_APPEALS, dialog.id),
         )
         for dialog in dialogs
     ]
@@ -44,7 +47,9 @@ def get_message_keyboard(dialog: Dialog) -> InlineKeyboardMarkup:
             [
                 InlineKeyboardButton(
                     text="Нажмите, что бы ответить на обращение",
-                    callback_data=f"answer_apeals_{dialog.id}",
+                    callback_data=pack_callback(
+                        CallbackPrefixes.ANSWER_APPEALS, dialog.id
+                    ),
                 )
             ]
         ]
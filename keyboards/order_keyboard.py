@@ -2,6 +2,7 @@ from aiogram.types import KeyboardButton, ReplyKeyboardMarkup
 from aiogram.utils.keyboard import InlineKeyboardBuilder
 
 from core.internal.enums import CallbackPrefixes
+from core.internal.types import pack_callback
 
 
 def get_confirm_keyboard() -> ReplyKeyboardMarkup:
@@ -17,17 +18,22 @@ def get_confirm_keyboard() -> ReplyKeyboardMarkup:
 
 def get_order_confirm_keyboard() -> ReplyKeyboardMarkup:
     builder = InlineKeyboardBuilder()
-    builder.button(text="✅ Подтвердить", callback_data="final_confirm")
-    builder.button(text="❌ Отменить", callback_data="order_cancel")
+    builder.button(
+        text="✅ Подтвердить",
+        callback_data=pack_callback(CallbackPrefixes.ORDER_FINAL_CONFIRM),
+    )
+    builder.button(
+        text="❌ Отменить", callback_data=pack_callback(CallbackPrefixes.ORDER_CANSEL)
+    )
     return builder.as_markup()
 
 
 def get_status_order_keyboard(order_id: int) -> ReplyKeyboardMarkup:
     builder = InlineKeyboardBuilder()
     builder.button(
-        text="✅ Выполнить", callback_data=f"{CallbackPrefixes.ORDER_STATUS_CONFIRM.value}{order_id}"
+        text="✅ Выполнить", callback_data=pack_callback(CallbackPrefixes.ORDER_STATUS_CONFIRM, order_id)
     )
     builder.button(
-        text="❌ Отменить", callback_data=f"{CallbackPrefixes.ORDER_STATUS_CANSEL.value}{order_id}"
+        text="❌ Отменить", callback_data=pack_callback(CallbackPrefixes.ORDER_STATUS_CANSEL, order_id)
     )
     return builder.as_markup()
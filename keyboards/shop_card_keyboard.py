@@ -1,5 +1,8 @@
 from aiogram.types import InlineKeyboardMarkup, InlineKeyboardButton
 
+from core.internal.enums import CallbackPrefixes
+from core.internal.types import pack_callback
+
 
 def get_shop_card_keyboard(
     current_index: int, product_id: int, total_products: int
@@ -8,34 +11,47 @@ def get_shop_card_keyboard(
     if current_index > 0:
         navigation_buttons.append(
             InlineKeyboardButton(
-                text="⬅️ Предыдущий", callback_data=f"shopcard_item_prev_{current_index}_{product_id}"
+                text="⬅️ Предыдущий",
+                callback_data=pack_callback(
+                    CallbackPrefixes.SHOPCARD_ITEM_PREV, current_index, product_id
+                ),
             )
         )
 
     if current_index < total_products - 1:
         navigation_buttons.append(
             InlineKeyboardButton(
-                text="Следующий ➡️", callback_data=f"shopcard_item_next_{current_index}_{product_id}"
+                text="Следующий ➡️",
+                callback_data=pack_callback(
+                    CallbackPrefixes.SHOPCARD_ITEM_NEXT, current_index, product_id
+                ),
             )
         )
 
     count_buttons = [
         InlineKeyboardButton(
             text="⬅️ Уменьшить кол-во",
-            callback_data=f"shopcard_item_dec_{current_index}_{product_id}",
+            callback_data=pack_callback(
+                CallbackPrefixes.SHOPCARD_ITEM_DECREMENT, current_index, product_id
+            ),
         ),
         InlineKeyboardButton(
             text="Увеличить кол-во ➡️",
-            callback_data=f"shopcard_item_inc_{current_index}_{product_id}",
+            callback_data=pack_callback(
+                CallbackPrefixes.SHOPCARD_ITEM_INCREMENT, current_index, product_id
+            ),
         ),
     ]
 
     shop_card_button = [
         InlineKeyboardButton(
             text="Удалить из корзины ❌",
-            callback_data=f"shopcard_delete_item_{product_id}",
+            callback_data=pack_callback(CallbackPrefixes.SHOPCARD_DELETE, product_id),
+        ),
+        InlineKeyboardButton(
+            text="Потвердить заказ ✏️",
+            callback_data=pack_callback(CallbackPrefixes.ORDER_CONFIRM),
         ),
-        InlineKeyboardButton(text="Потвердить заказ ✏️", callback_data="order_confirm"),
     ]
 
     keyboard = [row for row in [navigation_buttons, count_buttons, shop_card_button] if row]
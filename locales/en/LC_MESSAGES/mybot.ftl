@@ -2,4 +2,182 @@ greeting = Hello <b>{ $user_full_name }</b>, this bot was created to sell my ite
     For a list of all commands use /help
 
 initial_router_error = Something went wrong!
-    Error details: <i>{ $error }</i>
\ No newline at end of file
+    Error details: <i>{ $error }</i>
+
+## Catalog
+
+product_caption =
+    Name: { $name }
+
+    Description: { $description }
+
+    Price: { $price }$
+product_no_description_text = No description
+product_no_products_text = No items for sale
+product_error_text = Failed to process the item: { $error }
+product_delete_confirm = Are you sure you want to delete: { $name }?
+product_delete_success = The item was removed from the catalog
+product_delete_cancel = Deletion cancelled!
+product_edit_name_prompt = Please enter the new item name (or 'skip' to keep the current one).
+product_edit_description_prompt = Please enter the new item description (or 'skip' to keep the current one).
+product_edit_price_prompt = Please enter the new item price (for example, 19.99, or 'skip' to keep the current one).
+product_edit_image_prompt = Please send the new item image (or 'skip' to keep the current one).
+product_edit_stock_prompt = Please enter the item stock (a whole number, '-' to stop tracking it, or 'skip' to keep the current one).
+product_edit_invalid_stock = Enter a whole number from 0, or '-'.
+product_edit_success = Item '{ $name }' updated successfully (ID: { $id }, Price: { $price }$)
+product_edit_cansel = { "" }
+product_edit_invalid_price = Enter a valid price (for example, 19.99).
+
+## Orders
+
+order_no_exist = 📦 You have no orders yet
+order_error = ❌ Failed to place the order
+order_error_address = ❌ Failed to process the address
+order_error_note = ❌ Failed to process the comment
+order_input_address =
+    🏠 Now enter the delivery address:
+    (City, street, building and apartment)
+order_order_received = Orders waiting to be processed:
+order_order_delivered = Delivered orders:
+order_queue_title = Orders with status “{ $status }”:
+order_order_status_change = Order status changed
+order_status_changed = 📦 The status of your order #{ $id } has changed: { $status }
+order_status_final = ❌ The order is cancelled, its status can no longer change
+order_out_of_stock = ❌ Not enough stock: { $products }
+order_no_address = not specified
+order_no_note = Not specified
+order_no_comment = none
+order_confirmed =
+    ✅ Order #{ $id } has been placed!
+
+    Status: { $status }
+    Total: { $price } $
+    Address: { $address }
+
+    We will contact you to confirm the details.
+order_list_title = 📦 Your orders:
+order_list_no_address = Address not specified
+order_list_item =
+    🆔 #{ $id } - { $status }
+    💳 { $price } $ - { $date }
+    🏠 { $address }
+    📊 - { $status }
+order_item = { $name } - { $quantity } × { $price } $
+order_confirm_prompt =
+    📦 Confirm your order:
+
+    🛒 Items:
+    { $items }
+
+    💳 Total: { $price } $
+
+    🏠 Delivery address: { $address }
+    📝 Comment: { $note }
+order_note_prompt =
+    💳 Placing an order for: { $price } $
+
+    📝 Enter a comment for the order (for example, delivery wishes):
+    Or press /skip to skip
+order_product_line = { $name } - { $price } × { $quantity } = { $total }$
+order_details =
+    ✅ Order #{ $id } !
+
+    User @{ $username }
+    📦 Status: { $status }
+    💳 Total: { $price } $
+    🏠 Address: { $address }
+    📝 Comment: { $note }
+
+    🛒 Items:
+    { $products }
+    Total quantity: { $count }
+
+## Support dialogs
+
+dialog_start_message = 💬 You started a dialog with support. Write your message:
+dialog_end_dialog = ✅ Dialog closed. Thank you for contacting us!
+dialog_send_message =
+    ✅ Message sent! Please wait for a reply.
+    If you want to add something ✍️ type your message:
+dialog_is_send = ✅ Reply sent!
+dialog_hast_messages = 📭 There are no messages in the dialog yet
+dialog_hast_dialog = ❌ Dialog not found
+dialog_start_dialog_error = ❌ Failed to start a dialog. Please try again later.
+dialog_history_error = ❌ Failed to load the message history
+dialog_message_send_error = ❌ Failed to send the message. Please try again.
+dialog_apeals_error = ❌ Failed to load the requests.
+dialog_answer_error = ❌ Failed to send the reply.
+dialog_apeals = All incoming requests
+dialog_hast_apeals = No new requests!
+dialog_sender_user = You
+dialog_sender_support = Support
+dialog_answer =
+    You have received a reply to your request. For details use /startdialog '📋 Показать историю'
+    { $answer }
+
+## Broadcasts
+
+broadcast_input_text = 📣 Send the broadcast text (or 'skip' to cancel):
+broadcast_cancelled = ❌ Broadcast cancelled
+broadcast_no_users = 📭 No users to send the broadcast to
+broadcast_error = ❌ Failed to start the broadcast
+broadcast_text_only = ⚠️ Only text can be broadcast, send a text message (or 'skip' to cancel)
+broadcast_cancel_usage = Usage: /cancelbroadcast [id], without an id - every running broadcast
+broadcast_not_running = 📭 No running broadcast to cancel
+broadcast_stopping = 🛑 Broadcast #{ $id } stops after the batch being sent
+broadcast_already_running = ⏳ Broadcast #{ $id } is already running
+broadcast_started =
+    📣 Broadcast #{ $id } started: { $total } recipients
+    Stop it: /cancelbroadcast { $id }
+broadcast_eta = { $minutes } min { $seconds } sec
+broadcast_progress =
+    📣 Broadcast #{ $id } - { $status }
+
+    📊 Processed: { $processed } of { $total }
+    ✅ Delivered: { $sent }
+    🚫 Blocked the bot: { $blocked }
+    ❌ Errors: { $failed }
+
+    ⚡ Speed: { $throughput } msg/sec
+    ⏱ Remaining: { $eta }
+
+## Sales statistics
+
+stats_no_data = —
+stats_error = ❌ Failed to build the report
+stats_usage = Usage: /stats [days], for example /stats 7
+stats_empty = 📊 No sales from { $start } to { $end }
+stats_best_day = { $date } ({ $revenue } $)
+stats_product_line = { $position }. { $name } - { $units } pcs, { $revenue } $
+stats_status_line = { $status }: { $count }
+stats_export_usage = Usage: /exportorders [days], without a number - the whole history
+stats_export_empty = 📭 No orders to export
+stats_export_error = ❌ Failed to export orders
+stats_export_caption = 📤 Orders since { $since }: { $orders } ({ $rows } rows)
+stats_export_caption_all = 📤 All orders: { $orders } ({ $rows } rows)
+stats_report =
+    📊 Sales from { $start } to { $end } ({ $days } days)
+
+    🧾 Orders (without cancelled): { $orders }
+    📦 Items: { $units }
+    💳 Revenue: { $revenue } $
+    💵 Average order: { $average } $
+    🏆 Best day: { $best_day }
+
+    🛒 Top products:
+    { $products }
+
+    📋 Status changes:
+    { $statuses }
+
+## Update tracing
+
+tracing_no_data = —
+tracing_slow_updates_empty = ✅ No slow updates (threshold { $threshold } s)
+tracing_slow_update_line =
+    { $time } · { $latency } s · { $handler }
+    { $event }, user { $user } · SQL: { $sql_count } in { $sql_time } s · API: { $api_count } in { $api_time } s · ⬆ { $upload } KB
+tracing_slow_updates =
+    🐢 Slow updates (threshold { $threshold } s), latest { $count }:
+
+    { $lines }
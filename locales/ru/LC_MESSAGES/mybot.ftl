@@ -2,4 +2,182 @@ greeting = Приветствую тебя <b>{ $user_full_name }</b>, этот
     Для списка всех команд используй /help
 
 initial_router_error = Что-то пошло не так!
-    Подробнее об ошибке: <i> { $error } </i>
\ No newline at end of file
+    Подробнее об ошибке: <i> { $error } </i>
+
+## Catalog
+
+product_caption =
+    Название: { $name }
+
+    Описание: { $description }
+
+    Стоимость: { $price }$
+product_no_description_text = Нет описания
+product_no_products_text = Нет предметов для продажи
+product_error_text = Ошибка в обработке предмета: { $error }
+product_delete_confirm = Вы уверены, что хотите удалить: { $name }?
+product_delete_success = Предмет был удален из каталога
+product_delete_cancel = Удаление отменено!
+product_edit_name_prompt = Пожалуйста, введите новое название предмета (или 'skip' для сохранения текущего).
+product_edit_description_prompt = Пожалуйста, введите новое описание предмета (или 'skip' для сохранения текущего).
+product_edit_price_prompt = Пожалуйста, введите новую стоимость предмета (например, 19.99, или 'skip' для сохранения текущей).
+product_edit_image_prompt = Пожалуйста, отправьте новое изображение предмета (или 'skip' для сохранения текущего).
+product_edit_stock_prompt = Пожалуйста, введите остаток предмета на складе (целое число, '-' чтобы не вести учёт, или 'skip' для сохранения текущего).
+product_edit_invalid_stock = Введите целое число от 0 или '-'.
+product_edit_success = Предмет '{ $name }' успешно обновлён (ID: { $id }, Price: { $price }$)
+product_edit_cansel = { "" }
+product_edit_invalid_price = Введите корректную цену (например, 19.99).
+
+## Orders
+
+order_no_exist = 📦 У вас пока нет заказов
+order_error = ❌ Ошибка при оформлении заказа
+order_error_address = ❌ Ошибка при обработке адреса
+order_error_note = ❌ Ошибка при обработке комментария
+order_input_address =
+    🏠 Теперь введите адрес доставки:
+    (Укажите город, улицу, дом и квартиру)
+order_order_received = Поступившие заказы на обработку:
+order_order_delivered = Доставленные заказы:
+order_queue_title = Заказы со статусом «{ $status }»:
+order_order_status_change = Статус заказа изменён
+order_status_changed = 📦 Статус вашего заказа #{ $id } изменён: { $status }
+order_status_final = ❌ Заказ отменён, его статус больше нельзя изменить
+order_out_of_stock = ❌ Недостаточно товара на складе: { $products }
+order_no_address = не указан
+order_no_note = Не указан
+order_no_comment = не оставлен
+order_confirmed =
+    ✅ Заказ #{ $id } успешно оформлен!
+
+    Статус: { $status }
+    Сумма: { $price } $
+    Адрес: { $address }
+
+    Мы свяжемся с вами для уточнения деталей.
+order_list_title = 📦 Ваши заказы:
+order_list_no_address = Адрес не указан
+order_list_item =
+    🆔 #{ $id } - { $status }
+    💳 { $price } $ - { $date }
+    🏠 { $address }
+    📊 - { $status }
+order_item = { $name } - { $quantity } × { $price } $
+order_confirm_prompt =
+    📦 Подтвердите заказ:
+
+    🛒 Состав заказа:
+    { $items }
+
+    💳 Итого: { $price } $
+
+    🏠 Адрес доставки: { $address }
+    📝 Комментарий: { $note }
+order_note_prompt =
+    💳 Оформление заказа на сумму: { $price } $
+
+    📝 Введите комментарий к заказу (например, пожелания по доставке):
+    Или нажмите /skip чтобы пропустить
+order_product_line = { $name } - { $price } × { $quantity } = { $total }$
+order_details =
+    ✅ Заказ #{ $id } !
+
+    Пользователь @{ $username }
+    📦 Статус: { $status }
+    💳 Сумма: { $price } $
+    🏠 Адрес: { $address }
+    📝 Комментарий: { $note }
+
+    🛒 Предметы:
+    { $products }
+    Общее кол-во: { $count }
+
+## Support dialogs
+
+dialog_start_message = 💬 Вы начали диалог с поддержкой. Напишите ваше сообщение:
+dialog_end_dialog = ✅ Диалог завершен. Спасибо за обращение!
+dialog_send_message =
+    ✅ Сообщение отправлено! Ожидайте ответа.
+    Если есть, что дополнить ✍️ введите текст сообщения:
+dialog_is_send = ✅ Ответ отправлен!
+dialog_hast_messages = 📭 В диалоге пока нет сообщений
+dialog_hast_dialog = ❌ Диалог не найден
+dialog_start_dialog_error = ❌ Не удалось создать диалог. Попробуйте позже.
+dialog_history_error = ❌ Не удалось загрузить историю сообщений
+dialog_message_send_error = ❌ Не удалось отправить сообщение. Попробуйте еще раз.
+dialog_apeals_error = ❌ Не удалось загрузить обращения.
+dialog_answer_error = ❌ Не удалось отправить ответ.
+dialog_apeals = Все поступившие обращения
+dialog_hast_apeals = Новых обращений не поступило!
+dialog_sender_user = Вы
+dialog_sender_support = Поддержка
+dialog_answer =
+    Вы получили ответ на ваше обращение. Для деталей /startdialog '📋 Показать историю'
+    { $answer }
+
+## Broadcasts
+
+broadcast_input_text = 📣 Отправьте текст рассылки (или 'skip' для отмены):
+broadcast_cancelled = ❌ Рассылка отменена
+broadcast_no_users = 📭 Нет пользователей для рассылки
+broadcast_error = ❌ Не удалось запустить рассылку
+broadcast_text_only = ⚠️ Рассылать можно только текст, отправьте текстовое сообщение (или 'skip' для отмены)
+broadcast_cancel_usage = Использование: /cancelbroadcast [id], без id - все идущие рассылки
+broadcast_not_running = 📭 Нет идущих рассылок
+broadcast_stopping = 🛑 Рассылка #{ $id } остановится после текущей пачки
+broadcast_already_running = ⏳ Рассылка #{ $id } уже выполняется
+broadcast_started =
+    📣 Рассылка #{ $id } запущена: { $total } получателей
+    Остановить: /cancelbroadcast { $id }
+broadcast_eta = { $minutes } мин { $seconds } сек
+broadcast_progress =
+    📣 Рассылка #{ $id } - { $status }
+
+    📊 Обработано: { $processed } из { $total }
+    ✅ Доставлено: { $sent }
+    🚫 Заблокировали бота: { $blocked }
+    ❌ Ошибки: { $failed }
+
+    ⚡ Скорость: { $throughput } сообщ./сек
+    ⏱ Осталось: { $eta }
+
+## Sales statistics
+
+stats_no_data = —
+stats_error = ❌ Не удалось построить отчёт
+stats_usage = Использование: /stats [дней], например /stats 7
+stats_empty = 📊 С { $start } по { $end } продаж не было
+stats_best_day = { $date } ({ $revenue } $)
+stats_product_line = { $position }. { $name } - { $units } шт., { $revenue } $
+stats_status_line = { $status }: { $count }
+stats_export_usage = Использование: /exportorders [дней], без числа - вся история
+stats_export_empty = 📭 Нет заказов для выгрузки
+stats_export_error = ❌ Не удалось выгрузить заказы
+stats_export_caption = 📤 Заказы с { $since }: { $orders } (строк: { $rows })
+stats_export_caption_all = 📤 Все заказы: { $orders } (строк: { $rows })
+stats_report =
+    📊 Продажи с { $start } по { $end } ({ $days } дн.)
+
+    🧾 Заказов (без отменённых): { $orders }
+    📦 Товаров: { $units }
+    💳 Выручка: { $revenue } $
+    💵 Средний чек: { $average } $
+    🏆 Лучший день: { $best_day }
+
+    🛒 Топ товаров:
+    { $products }
+
+    📋 Смены статусов:
+    { $statuses }
+
+## Update tracing
+
+tracing_no_data = —
+tracing_slow_updates_empty = ✅ Медленных апдейтов нет (порог { $threshold } с)
+tracing_slow_update_line =
+    { $time } · { $latency } с · { $handler }
+    { $event }, пользователь { $user } · SQL: { $sql_count } за { $sql_time } с · API: { $api_count } за { $api_time } с · ⬆ { $upload } КБ
+tracing_slow_updates =
+    🐢 Медленные апдейты (порог { $threshold } с), последние { $count }:
+
+    { $lines }
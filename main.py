@@ -4,10 +4,12 @@ from aiogram import Bot
 from aiogram.client.default import DefaultBotProperties
 from aiogram.enums import ParseMode
 
-from config import load_settings
+from config import SendSchedulerConfig, load_settings
+from core.infrastructure import update_tracer
 from data import CommandList
 from dispatcher import create_dispatcher
 from logger import LoggerBuilder
+from middleware import SendSchedulerMiddleware, TracingRequestMiddleware
 
 logger = LoggerBuilder("TelegramBot").add_stream_handler().build()
 
@@ -20,6 +22,8 @@ async def main() -> None:
         token=telegram_settings.bot_token,
         default=DefaultBotProperties(parse_mode=ParseMode.HTML),
     )
+    bot.session.middleware(TracingRequestMiddleware(update_tracer))
+    bot.session.middleware(SendSchedulerMiddleware(SendSchedulerConfig()))
 
     # Set commands
     commands = CommandList()
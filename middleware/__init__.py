@@ -1,4 +1,18 @@
 from .service_middleware import ServiceMiddleware
 from .admin_middleware import AdminMiddleware
+from .throttling_middleware import ThrottlingMiddleware
+from .send_scheduler_middleware import SendSchedulerMiddleware
+from .callback_args_middleware import CallbackArgsMiddleware
+from .user_registration_middleware import UserRegistrationMiddleware
+from .tracing_middleware import TracingMiddleware, TracingRequestMiddleware
 
-__all__ = ["ServiceMiddleware",  "AdminMiddleware"]
\ No newline at end of file
+__all__ = [
+    "ServiceMiddleware",
+    "AdminMiddleware",
+    "ThrottlingMiddleware",
+    "SendSchedulerMiddleware",
+    "CallbackArgsMiddleware",
+    "UserRegistrationMiddleware",
+    "TracingMiddleware",
+    "TracingRequestMiddleware",
+]
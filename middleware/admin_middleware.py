@@ -1,7 +1,7 @@
-from typing import Any, Awaitable, Callable, Dict
+from typing import Any, Awaitable, Callable, Dict, Optional
 
 from aiogram import BaseMiddleware
-from aiogram.types import CallbackQuery, Message, TelegramObject
+from aiogram.types import TelegramObject, User
 
 from config import AdminConfig
 from logger import LoggerBuilder
@@ -10,6 +10,14 @@ logger = LoggerBuilder("AdminMiddleware").add_stream_handler().build()
 
 
 class AdminMiddleware(BaseMiddleware):
+    """
+    Resolves the admin flag for the update sender and injects it into handler data.
+
+    The flag is taken from the in-memory ``AdminConfig`` cache on every update and
+    is never persisted into FSM storage, so updates that do not change state cost
+    no storage reads or writes.
+    """
+
     def __init__(self, admin_config: AdminConfig):
         self.admin_config = admin_config
 
@@ -20,11 +28,10 @@ class AdminMiddleware(BaseMiddleware):
         data: Dict[str, Any],
     ) -> Any:
         try:
-            if isinstance(event, (Message, CallbackQuery)):
-                data["is_admin"] = self.admin_config.is_admin(event.from_user.id)
-                state = data.get("state")
-                if state:
-                    await state.update_data(is_admin=data["is_admin"])
+            user: Optional[User] = data.get("event_from_user")
+            data["is_admin"] = (
+                self.admin_config.is_admin(user.id) if user is not None else False
+            )
 
             return await handler(event, data)
         except Exception as e:
@@ -0,0 +1,24 @@
+from typing import Any, Awaitable, Callable, Dict
+
+from aiogram import BaseMiddleware
+from aiogram.types import CallbackQuery
+
+from filters import resolve_callback
+
+
+class CallbackArgsMiddleware(BaseMiddleware):
+    """
+    Resolves callback data once per callback, before any router filter runs.
+
+    The result is stored as ``callback_args`` (``None`` for unknown data) and
+    consumed by ``CallbackPrefixFilter`` and the handlers.
+    """
+
+    async def __call__(
+        self,
+        handler: Callable[[CallbackQuery, Dict[str, Any]], Awaitable[Any]],
+        event: CallbackQuery,
+        data: Dict[str, Any],
+    ) -> Any:
+        data["callback_args"] = resolve_callback(event.data)
+        return await handler(event, data)
@@ -0,0 +1,121 @@
+import asyncio
+from time import monotonic
+from typing import Dict, Optional, Union
+
+from aiogram import Bot
+from aiogram.client.session.middlewares.base import (
+    BaseRequestMiddleware,
+    NextRequestMiddlewareType,
+)
+from aiogram.exceptions import TelegramRetryAfter
+from aiogram.methods import Response, TelegramMethod
+from aiogram.methods.base import TelegramType
+
+from config import SendSchedulerConfig
+from core.internal.enums import SendPriority
+from logger import LoggerBuilder
+from utils import LRUCache, TokenBucket, current_send_priority
+
+logger = LoggerBuilder("SendScheduler").add_stream_handler().build()
+
+
+class SendSchedulerMiddleware(BaseRequestMiddleware):
+    """
+    Paces outbound Bot API requests that target a chat.
+
+    Requests take a token from a global bucket and from a per-chat bucket before
+    they are sent. Requests waiting for the global bucket are served by lane
+    (``SendPriority``): a lane only sends while no higher-priority lane is
+    waiting, so replies to users are not stuck behind a broadcast. A request
+    still waiting for its own chat's bucket does not hold back other lanes.
+    ``RetryAfter`` pauses every lane for the time Telegram asks for and the
+    request is retried.
+
+    Registered on the bot session (``bot.session.middleware(...)``), so it can be
+    exercised with any fake session implementation. Use ``utils.send_priority``
+    to pick the lane for a block of requests.
+    """
+
+    poll_interval: float = 0.05
+
+    def __init__(self, config: Optional[SendSchedulerConfig] = None):
+        self.config = config or SendSchedulerConfig()
+        self._global = TokenBucket(self.config.global_rate, self.config.global_burst)
+        self._chats: LRUCache[Union[int, str], TokenBucket] = LRUCache(
+            maxsize=self.config.max_chats
+        )
+        self._waiting: Dict[SendPriority, int] = {lane: 0 for lane in SendPriority}
+        self._paused_until = 0.0
+
+    def _chat_bucket(self, chat_id: Union[int, str]) -> TokenBucket:
+        bucket = self._chats.get(chat_id)
+        if bucket is None:
+            is_group = isinstance(chat_id, str) or chat_id < 0
+            bucket = (
+                TokenBucket(self.config.group_rate, self.config.group_burst)
+                if is_group
+                else TokenBucket(self.config.chat_rate, self.config.chat_burst)
+            )
+            self._chats.set(chat_id, bucket)
+        return bucket
+
+    def _has_priority_waiters(self, priority: SendPriority) -> bool:
+        return any(self._waiting[lane] for lane in SendPriority if lane < priority)
+
+    async def _acquire(self, chat_id: Union[int, str], priority: SendPriority) -> None:
+        # Only a request its own chat bucket would let through waits in its
+        # lane: one held back by its chat's rate must not hold up other chats
+        queued = False
+        try:
+            while True:
+                now = monotonic()
+                chat_bucket = self._chat_bucket(chat_id)
+                chat_delay = chat_bucket.delay(now=now)
+                if queued != (chat_delay <= 0):
+                    queued = not queued
+                    self._waiting[priority] += 1 if queued else -1
+
+                if not queued:
+                    delay = max(chat_delay, self._paused_until - now)
+                elif now < self._paused_until:
+                    delay = self._paused_until - now
+                elif self._has_priority_waiters(priority):
+                    delay = self.poll_interval
+                else:
+                    delay = self._global.delay(now=now)
+                    if delay <= 0:
+                        self._global.consume(now=now)
+                        chat_bucket.consume(now=now)
+                        return
+                await asyncio.sleep(delay)
+        finally:
+            if queued:
+                self._waiting[priority] -= 1
+
+    async def __call__(
+        self,
+        make_request: NextRequestMiddlewareType[TelegramType],
+        bot: Bot,
+        method: TelegramMethod[TelegramType],
+    ) -> Response[TelegramType]:
+        chat_id = getattr(method, "chat_id", None)
+        if chat_id is None:
+            return await make_request(bot, method)
+
+        priority = current_send_priority()
+        attempt = 0
+        while True:
+            await self._acquire(chat_id, priority)
+            try:
+                return await make_request(bot, method)
+            except TelegramRetryAfter as e:
+                attempt += 1
+                if attempt > self.config.max_retries:
+                    raise
+                logger.warning(
+                    f"{type(method).__name__} to {chat_id} hit flood control, "
+                    f"retry {attempt}/{self.config.max_retries} in {e.retry_after}s"
+                )
+                self._paused_until = max(
+                    self._paused_until, monotonic() + e.retry_after
+                )
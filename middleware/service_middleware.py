@@ -1,25 +1,48 @@
+from functools import partial
 from typing import Any, Awaitable, Callable, Dict, Optional
 
 from aiogram import BaseMiddleware
 from aiogram.types import TelegramObject
+from aiogram_i18n import I18nContext
 
 from config import AdminConfig
+from core.infrastructure.cache import CartCache, CatalogCache, UserCache
 from core.infrastructure.database import DatabaseManager
+from core.infrastructure.i18n import TextCatalog
 from core.infrastructure.services import (
+    AnalyticsService,
+    BroadcastDisplayFormatter,
+    BroadcastService,
     CatalogService,
+    DialogDisplayFormatter,
     DialogService,
+    OrderDisplayFormatter,
+    OrderExportService,
     OrderService,
+    ProductDisplayFormatter,
     ShopCardService,
     ShopService,
+    StatsDisplayFormatter,
 )
+from core.infrastructure.tracing import TracingDisplayFormatter
 
 
 class ServiceMiddleware(BaseMiddleware):
     def __init__(
-        self, db_manager: DatabaseManager, admin_config: Optional[AdminConfig] = None
+        self,
+        db_manager: DatabaseManager,
+        text_catalog: TextCatalog,
+        admin_config: Optional[AdminConfig] = None,
+        catalog_cache: Optional[CatalogCache] = None,
+        cart_cache: Optional[CartCache] = None,
+        user_cache: Optional[UserCache] = None,
     ):
         self.db_manager = db_manager
+        self.text_catalog = text_catalog
         self.admin_config = admin_config
+        self.catalog_cache = catalog_cache or CatalogCache()
+        self.cart_cache = cart_cache or CartCache()
+        self.user_cache = user_cache or UserCache()
 
     async def __call__(
         self,
@@ -27,12 +50,37 @@ class ServiceMiddleware(BaseMiddleware):
         event: TelegramObject,
         data: Dict[str, Any],
     ) -> Any:
+        i18n: Optional[I18nContext] = data.get("i18n")
+        locale = i18n.locale if i18n else None
+        formatter = partial(self.text_catalog.formatter, locale=locale)
+
+        shop_service = ShopService(
+            self.db_manager, self.catalog_cache, self.cart_cache
+        )
         services = {
-            "dialog_service": DialogService(self.db_manager, self.admin_config),
-            "catalog_service": CatalogService(ShopService(self.db_manager)),
-            "shop_service": ShopService(self.db_manager),
-            "shop_card_service": ShopCardService(self.db_manager),
-            "order_service": OrderService(self.db_manager),
+            "dialog_service": DialogService(
+                self.db_manager, self.admin_config, formatter(DialogDisplayFormatter)
+            ),
+            "catalog_service": CatalogService(
+                shop_service, formatter(ProductDisplayFormatter), self.catalog_cache
+            ),
+            "shop_service": shop_service,
+            "shop_card_service": ShopCardService(self.db_manager, self.cart_cache),
+            "order_service": OrderService(
+                self.db_manager, formatter(OrderDisplayFormatter), self.cart_cache
+            ),
+            "broadcast_service": BroadcastService(
+                self.db_manager,
+                formatter(BroadcastDisplayFormatter),
+                user_cache=self.user_cache,
+            ),
+            "analytics_service": AnalyticsService(
+                self.db_manager, formatter(StatsDisplayFormatter)
+            ),
+            "order_export_service": OrderExportService(
+                self.db_manager, formatter(StatsDisplayFormatter)
+            ),
+            "tracing_formatter": formatter(TracingDisplayFormatter),
         }
 
         data.update(services)
@@ -0,0 +1,75 @@
+from typing import Any, Awaitable, Callable, Dict, Optional, Set, Tuple
+
+from aiogram import BaseMiddleware
+from aiogram.types import CallbackQuery, Chat, TelegramObject, User
+
+from config import ThrottlingConfig
+from logger import LoggerBuilder
+from utils import LRUCache, TokenBucket
+
+logger = LoggerBuilder("ThrottlingMiddleware").add_stream_handler().build()
+
+ThrottleKey = Tuple[int, int]
+
+
+class ThrottlingMiddleware(BaseMiddleware):
+    """
+    Per-user flood control for a router.
+
+    Every (user, chat) pair gets a token bucket; updates arriving with an empty
+    bucket are dropped before the handler runs. A callback identical to one that
+    is still being handled for the same user is coalesced: it is acknowledged
+    and dropped instead of running the handler (and its DB queries) again.
+    """
+
+    throttled_text: str = "⏳ Слишком много запросов, подождите немного"
+
+    def __init__(self, config: Optional[ThrottlingConfig] = None):
+        self.config = config or ThrottlingConfig()
+        self._buckets: LRUCache[ThrottleKey, TokenBucket] = LRUCache(
+            maxsize=self.config.max_buckets
+        )
+        self._in_flight: Set[Tuple[ThrottleKey, str]] = set()
+
+    def _get_bucket(self, key: ThrottleKey) -> TokenBucket:
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            bucket = TokenBucket(rate=self.config.rate, capacity=self.config.burst)
+            self._buckets.set(key, bucket)
+        return bucket
+
+    async def __call__(
+        self,
+        handler: Callable[[TelegramObject, Dict[str, Any]], Awaitable[Any]],
+        event: TelegramObject,
+        data: Dict[str, Any],
+    ) -> Any:
+        user: Optional[User] = data.get("event_from_user")
+        if user is None:
+            return await handler(event, data)
+
+        chat: Optional[Chat] = data.get("event_chat")
+        key = (user.id, chat.id if chat else user.id)
+
+        in_flight_key = None
+        if isinstance(event, CallbackQuery):
+            in_flight_key = (key, event.data or "")
+            if in_flight_key in self._in_flight:
+                logger.debug(f"Coalesced duplicate callback from {user.id}: {event.data}")
+                await event.answer()
+                return None
+
+        if not self._get_bucket(key).consume():
+            logger.debug(f"Throttled update from user {user.id}")
+            if isinstance(event, CallbackQuery):
+                await event.answer(self.throttled_text)
+            return None
+
+        if in_flight_key is None:
+            return await handler(event, data)
+
+        self._in_flight.add(in_flight_key)
+        try:
+            return await handler(event, data)
+        finally:
+            self._in_flight.discard(in_flight_key)
@@ -0,0 +1,125 @@
+import os
+from datetime import datetime, timezone
+from time import perf_counter
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+from aiogram import BaseMiddleware, Bot, Router
+from aiogram.client.session.middlewares.base import (
+    BaseRequestMiddleware,
+    NextRequestMiddlewareType,
+)
+from aiogram.methods import Response, TelegramMethod
+from aiogram.methods.base import TelegramType
+from aiogram.types import (
+    BufferedInputFile,
+    FSInputFile,
+    InputFile,
+    InputMedia,
+    TelegramObject,
+    Update,
+    User,
+)
+
+from core.infrastructure.tracing import UpdateTracer
+from core.internal.types import UpdateTrace
+
+
+class TracingMiddleware(BaseMiddleware):
+    """
+    Opens an ``UpdateTrace`` for every update and names its handler.
+
+    ``setup`` registers the same instance twice: as an outer middleware of
+    ``update``, where the trace is opened around every other middleware, and
+    as an inner middleware of every event observer, where the matched handler
+    is known. Bot API calls are counted by ``TracingRequestMiddleware``.
+    """
+
+    def __init__(self, tracer: UpdateTracer):
+        self.tracer = tracer
+
+    def setup(self, router: Router) -> None:
+        router.update.outer_middleware(self)
+        for name, observer in router.observers.items():
+            if name not in ("update", "error"):
+                observer.middleware(self)
+
+    async def __call__(
+        self,
+        handler: Callable[[TelegramObject, Dict[str, Any]], Awaitable[Any]],
+        event: TelegramObject,
+        data: Dict[str, Any],
+    ) -> Any:
+        if isinstance(event, Update):
+            user: Optional[User] = data.get("event_from_user")
+            trace = UpdateTrace(
+                update_id=event.update_id,
+                event_type=event.event_type,
+                user_id=user.id if user else None,
+                started_at=datetime.now(timezone.utc),
+            )
+            with self.tracer.trace(trace):
+                return await handler(event, data)
+
+        trace = self.tracer.current()
+        handler_object = data.get("handler")
+        if trace is not None and handler_object is not None:
+            trace.handler = handler_object.callback.__qualname__
+        return await handler(event, data)
+
+
+class TracingRequestMiddleware(BaseRequestMiddleware):
+    """
+    Adds Bot API calls made while handling an update to its trace.
+
+    Register it first on the bot session so the time includes waiting in
+    ``SendSchedulerMiddleware``. Upload size is the size of the files sent
+    from memory or disk; files sent by URL or file id count as zero.
+    """
+
+    def __init__(self, tracer: UpdateTracer):
+        self.tracer = tracer
+
+    async def __call__(
+        self,
+        make_request: NextRequestMiddlewareType[TelegramType],
+        bot: Bot,
+        method: TelegramMethod[TelegramType],
+    ) -> Response[TelegramType]:
+        trace = self.tracer.current()
+        if trace is None:
+            return await make_request(bot, method)
+
+        started = perf_counter()
+        try:
+            return await make_request(bot, method)
+        finally:
+            trace.api_count += 1
+            trace.api_time += perf_counter() - started
+            trace.upload_bytes += _upload_size(method)
+
+
+def _file_size(value: Any) -> int:
+    if isinstance(value, BufferedInputFile):
+        return len(value.data)
+    if isinstance(value, FSInputFile):
+        try:
+            return os.path.getsize(value.path)
+        except OSError:
+            return 0
+    return 0
+
+
+def _upload_size(method: TelegramMethod) -> int:
+    size = 0
+    for value in method.__dict__.values():
+        if isinstance(value, InputFile):
+            size += _file_size(value)
+        elif isinstance(value, InputMedia):
+            size += _file_size(value.media)
+        elif isinstance(value, list):
+            size += sum(
+                _file_size(item.media)
+                for item in value
+                if isinstance(item, InputMedia)
+            )
+    return size
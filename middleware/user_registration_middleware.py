@@ -0,0 +1,51 @@
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+from aiogram import BaseMiddleware
+from aiogram.types import TelegramObject, User
+
+from core.infrastructure.cache import UserCache
+from core.infrastructure.database import DatabaseManager
+from core.infrastructure.services import ShopService
+from core.internal.models import UserCreate
+from logger import LoggerBuilder
+
+logger = LoggerBuilder("UserRegistrationMiddleware").add_stream_handler().build()
+
+
+class UserRegistrationMiddleware(BaseMiddleware):
+    """
+    Makes sure the update sender exists in ``users`` before any handler runs.
+
+    Users can reach the cart or the inline catalog without ever sending
+    ``/start``, so registration cannot be left to that command. Senders whose
+    profile is already in the ``UserCache`` cost no database calls; otherwise a
+    single upsert creates the row or refreshes its profile.
+    """
+
+    def __init__(self, db_manager: DatabaseManager, user_cache: UserCache):
+        self.shop_service = ShopService(db_manager)
+        self.user_cache = user_cache
+
+    async def __call__(
+        self,
+        handler: Callable[[TelegramObject, Dict[str, Any]], Awaitable[Any]],
+        event: TelegramObject,
+        data: Dict[str, Any],
+    ) -> Any:
+        user: Optional[User] = data.get("event_from_user")
+        if user is not None and not user.is_bot:
+            profile = (user.username, user.full_name)
+            if not self.user_cache.is_known(user.id, profile):
+                try:
+                    await self.shop_service.register_user(
+                        UserCreate(
+                            telegram_id=user.id,
+                            username=user.username,
+                            full_name=user.full_name,
+                        )
+                    )
+                    self.user_cache.remember(user.id, profile)
+                except Exception as e:
+                    logger.error(f"Failed to register user {user.id}: {e}")
+
+        return await handler(event, data)
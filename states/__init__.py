@@ -4,6 +4,7 @@ from .states import (
     EditProduct,
     DialogStates,
     OrderConfirm,
+    BroadcastStates,
 )
 
 __all__ = [
@@ -12,4 +13,5 @@ __all__ = [
     "EditProduct",
     "DialogStates",
     "OrderConfirm",
+    "BroadcastStates",
 ]
@@ -17,6 +17,7 @@ class EditProduct(StatesGroup):
     waiting_for_description = State()
     waiting_for_price = State()
     waiting_for_image = State()
+    waiting_for_stock = State()
 
 
 class DialogStates(StatesGroup):
@@ -25,4 +26,8 @@ class DialogStates(StatesGroup):
 
 class OrderConfirm(StatesGroup):
     waiting_for_order_note = State()
-    waiting_for_address_delivery = State()
\ No newline at end of file
+    waiting_for_address_delivery = State()
+
+
+class BroadcastStates(StatesGroup):
+    waiting_for_text = State()
@@ -0,0 +1,107 @@
+import asyncio
+import inspect
+import os
+import tempfile
+from pathlib import Path
+
+import pytest
+from aiogram import Bot
+from aiogram.client.session.base import BaseSession
+from alembic import command
+from alembic.config import Config
+from sqlalchemy import create_engine
+
+# Settings are read when core.infrastructure is imported
+os.environ.setdefault("TELEGRAM_BOT_TOKEN", "123456:test-token")
+os.environ.setdefault(
+    "DB_NAME", os.path.join(tempfile.mkdtemp(prefix="bot-tests-"), "app.db")
+)
+os.environ.setdefault("DB_USER", "test")
+os.environ.setdefault("DB_PASSWORD", "test")
+
+from config import DatabaseSettings  # noqa: E402
+from core.infrastructure import repositories  # noqa: E402
+from core.infrastructure.database import DatabaseManager  # noqa: E402
+from core.infrastructure.database.models import BaseModel  # noqa: E402
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_pyfunc_call(pyfuncitem: pytest.Function):
+    """Run ``async def`` tests on a fresh event loop, then close their engines."""
+    if not inspect.iscoroutinefunction(pyfuncitem.obj):
+        return None
+
+    kwargs = {
+        name: pyfuncitem.funcargs[name] for name in pyfuncitem._fixtureinfo.argnames
+    }
+
+    async def run() -> None:
+        try:
+            await pyfuncitem.obj(**kwargs)
+        finally:
+            for value in kwargs.values():
+                if isinstance(value, DatabaseManager):
+                    await value.dispose()
+
+    asyncio.run(run())
+    return True
+
+
+def _manager(path: Path) -> DatabaseManager:
+    return DatabaseManager(
+        DatabaseSettings(name=str(path), user="test", password="test"),
+        repositories=[
+            getattr(repositories, name)
+            for name in repositories.__all__
+            if name != "SQLAlchemyRepository"
+        ],
+    )
+
+
+@pytest.fixture
+def db_manager(tmp_path) -> DatabaseManager:
+    """Manager of an empty SQLite database with the current schema."""
+    path = tmp_path / "test.db"
+    engine = create_engine(f"sqlite:///{path}")
+    BaseModel.metadata.create_all(engine)
+    engine.dispose()
+    return _manager(path)
+
+
+@pytest.fixture
+def migrated_db_manager(tmp_path, monkeypatch) -> DatabaseManager:
+    """
+    Manager of an empty SQLite database built by the alembic migrations.
+
+    Unlike ``db_manager`` it has the objects only migrations create, such
+    as the ``product_fts`` search index and its triggers.
+    """
+    path = tmp_path / "test.db"
+    # alembic/env.py reads the database from the settings
+    monkeypatch.setenv("DB_NAME", str(path))
+    command.upgrade(Config(Path(__file__).parents[1] / "alembic.ini"), "head")
+    return _manager(path)
+
+
+class FakeSession(BaseSession):
+    """Bot session that records API calls instead of sending them."""
+
+    def __init__(self):
+        super().__init__()
+        self.requests = []
+
+    async def make_request(self, bot, method, timeout=None):
+        self.requests.append(method)
+        return True
+
+    async def stream_content(self, url, headers=None, timeout=30, **kwargs):
+        yield b""
+
+    async def close(self) -> None:
+        pass
+
+
+@pytest.fixture
+def bot() -> Bot:
+    """Bot whose API calls land in ``bot.session.requests``."""
+    return Bot("123456:test-token", session=FakeSession())
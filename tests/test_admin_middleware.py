@@ -0,0 +1,77 @@
+from datetime import datetime
+
+from aiogram import Bot, Dispatcher
+from aiogram.fsm.storage.memory import MemoryStorage
+from aiogram.types import Chat, Message, Update, User
+
+from config import AdminConfig
+from core.infrastructure.services import AdminService
+from middleware import AdminMiddleware
+
+
+class CountingStorage(MemoryStorage):
+    """Memory storage counting reads and writes."""
+
+    def __init__(self):
+        super().__init__()
+        self.reads = 0
+        self.writes = 0
+
+    async def get_state(self, key):
+        self.reads += 1
+        return await super().get_state(key)
+
+    async def get_data(self, key):
+        self.reads += 1
+        return await super().get_data(key)
+
+    async def set_state(self, key, state=None):
+        self.writes += 1
+        await super().set_state(key, state)
+
+    async def set_data(self, key, data):
+        self.writes += 1
+        await super().set_data(key, data)
+
+
+def _update(update_id: int, user_id: int) -> Update:
+    user = User(id=user_id, is_bot=False, first_name="U")
+    return Update(
+        update_id=update_id,
+        message=Message(
+            message_id=update_id,
+            date=datetime.now(),
+            chat=Chat(id=user_id, type="private"),
+            from_user=user,
+            text="hello",
+        ),
+    )
+
+
+async def test_admin_flag_costs_no_storage_writes(tmp_path):
+    config_path = tmp_path / "admin_ids.txt"
+    config_path.write_text("42")
+    admin_config = AdminConfig(config_path=config_path)
+    storage = CountingStorage()
+    dispatcher = Dispatcher(storage=storage)
+    dispatcher.update.middleware(AdminMiddleware(admin_config))
+    seen = []
+
+    @dispatcher.message()
+    async def handler(message: Message, is_admin: bool) -> None:
+        seen.append(is_admin)
+
+    bot = Bot("123456:test-token")
+    for update_id, user_id in enumerate((42, 7, 42), start=1):
+        await dispatcher.feed_update(bot, _update(update_id, user_id))
+    await bot.session.close()
+
+    assert seen == [True, False, True]
+    assert storage.writes == 0
+    # Only the state read aiogram's FSM middleware does for every update
+    assert storage.reads == 3
+
+    assert await AdminService(admin_config).add_admin(7)
+    assert not await AdminService(admin_config).add_admin(7)
+    assert admin_config.is_admin(7)
+    assert config_path.read_text() == "42,7"
@@ -0,0 +1,67 @@
+from core.infrastructure import text_catalog
+from core.infrastructure.database.models import Order
+from core.infrastructure.services import (
+    AnalyticsService,
+    OrderDisplayFormatter,
+    OrderService,
+    ShopCardService,
+    ShopService,
+)
+from core.internal.enums import OrderStatus
+from core.internal.models import ProductCreate, ShopCardItemCreate, UserCreate
+
+
+async def _checkout(db_manager, orders: OrderService, user_id: int, quantity: int):
+    shop = ShopService(db_manager)
+    product = await shop.add_product(ProductCreate(name="Tea", price=10))
+    await shop.register_user(
+        UserCreate(telegram_id=user_id, username=None, full_name="U")
+    )
+    await ShopCardService(db_manager).add_to_card(
+        user_id, ShopCardItemCreate(product_id=product.id, quantity=quantity)
+    )
+    order, _ = await orders.checkout(user_id, f"key-{user_id}")
+    return order, product.id
+
+
+async def test_cancelled_orders_leave_the_sales(db_manager):
+    await text_catalog.startup()
+    orders = OrderService(db_manager, text_catalog.formatter(OrderDisplayFormatter))
+    analytics = AnalyticsService(db_manager, None)
+    _, kept_product_id = await _checkout(db_manager, orders, 1, quantity=2)
+    cancelled, _ = await _checkout(db_manager, orders, 2, quantity=3)
+    # Folded before and after the cancellation
+    await analytics.refresh()
+    await orders.update_order_status(cancelled.id, OrderStatus.CANCELLED)
+    await analytics.refresh()
+
+    report = await analytics.get_report(1)
+    assert (report.orders_count, report.units, report.revenue) == (1, 2, 20.0)
+    assert [(p.product_id, p.units) for p in report.top_products] == [
+        (kept_product_id, 2)
+    ]
+    assert report.status_counts == {
+        OrderStatus.PENDING: 2,
+        OrderStatus.CANCELLED: 1,
+    }
+
+
+async def test_orders_committed_out_of_id_order_are_folded(db_manager):
+    analytics = AnalyticsService(db_manager, None)
+    await ShopService(db_manager).register_user(
+        UserCreate(telegram_id=1, username=None, full_name="U")
+    )
+
+    async def add_order(order_id: int) -> None:
+        async with db_manager.get_db_session() as session:
+            session.add(
+                Order(id=order_id, user_id=1, total_price=5, total_count=1)
+            )
+
+    await add_order(2)
+    assert await analytics.refresh() == 1
+    # A lower id committed after a higher one was folded
+    await add_order(1)
+    assert await analytics.refresh() == 1
+    assert await analytics.refresh() == 0
+    assert (await analytics.get_report(1)).orders_count == 2
@@ -0,0 +1,24 @@
+"""Run every benchmark with a few iterations so they keep working."""
+
+from benchmarks import callback_dispatch, checkout_memory, i18n_render
+
+
+async def test_callback_dispatch_benchmark():
+    results = await callback_dispatch.run(iterations=60)
+    assert set(results) == set(callback_dispatch.DISPATCHERS)
+    assert all(micros > 0 for micros in results.values())
+
+
+async def test_checkout_memory_benchmark():
+    results = await checkout_memory.run(lines=30, image_size=200_000)
+    assert results["units"] == 60
+    # Loading the images once would take all of image_bytes
+    assert results["peak_bytes"] < results["image_bytes"] / 4
+
+
+async def test_i18n_render_benchmark():
+    startup, renders = await i18n_render.run(iterations=20)
+    assert all(seconds > 0 for seconds in startup.values())
+    locales = {locale for _, locale, _ in renders}
+    assert locales == {"en", "ru"}
+    assert len(renders) == 2 * len(locales) * len(i18n_render.MESSAGES)
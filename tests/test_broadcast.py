@@ -0,0 +1,93 @@
+from types import SimpleNamespace
+
+from core.infrastructure import text_catalog
+from core.infrastructure.services import (
+    BroadcastDisplayFormatter,
+    BroadcastService,
+    ShopService,
+)
+from core.internal.enums import BroadcastStatus
+from core.internal.models import UserCreate
+from handlers.broadcast import command_broadcast
+from states import BroadcastStates
+
+ADMIN_ID = 1000
+
+
+class FakeBot:
+    """Records sent texts; ``on_send`` runs before every send."""
+
+    def __init__(self, on_send=None):
+        self.sent = []
+        self.on_send = on_send
+
+    async def send_message(self, chat_id, text):
+        if self.on_send is not None:
+            await self.on_send(chat_id)
+        self.sent.append(chat_id)
+        return SimpleNamespace(message_id=len(self.sent))
+
+    async def edit_message_text(self, chat_id, message_id, text):
+        self.sent.append(chat_id)
+
+
+async def test_cancelled_broadcast_stops_after_its_batch(db_manager):
+    await text_catalog.startup()
+    service = BroadcastService(
+        db_manager, text_catalog.formatter(BroadcastDisplayFormatter), batch_size=2
+    )
+    shop = ShopService(db_manager)
+    for user_id in range(1, 7):
+        await shop.register_user(
+            UserCreate(telegram_id=user_id, username=None, full_name="U")
+        )
+    broadcast = await service.create_broadcast(ADMIN_ID, "News")
+
+    async def cancel_on_first_user(chat_id):
+        if chat_id == 1:
+            assert await service.cancel_broadcast(broadcast.id)
+
+    bot = FakeBot(cancel_on_first_user)
+    await service.run(bot, broadcast.id)
+
+    broadcast = await service.get_broadcast(broadcast.id)
+    assert broadcast.status == BroadcastStatus.CANCELLED
+    assert broadcast.sent_count == 2
+    assert sorted(chat_id for chat_id in bot.sent if chat_id != ADMIN_ID) == [1, 2]
+    assert not await service.cancel_broadcast(broadcast.id)
+
+
+class FakeMessage:
+    def __init__(self):
+        self.answers = []
+
+    async def answer(self, text):
+        self.answers.append(text)
+
+
+class FakeState:
+    def __init__(self):
+        self.state = None
+
+    async def set_state(self, state):
+        self.state = state
+
+
+async def test_second_broadcast_is_refused_while_one_runs(db_manager):
+    await text_catalog.startup()
+    formatter = text_catalog.formatter(BroadcastDisplayFormatter)
+    service = BroadcastService(db_manager, formatter)
+    await ShopService(db_manager).register_user(
+        UserCreate(telegram_id=1, username=None, full_name="U")
+    )
+    broadcast = await service.create_broadcast(ADMIN_ID, "News")
+
+    message, state = FakeMessage(), FakeState()
+    await command_broadcast(message, state, service)
+    assert message.answers == [await formatter.get_already_running_text(broadcast.id)]
+    assert state.state is None
+
+    assert await service.cancel_broadcast(broadcast.id)
+    await command_broadcast(message, state, service)
+    assert message.answers[-1] == formatter.input_text
+    assert state.state == BroadcastStates.waiting_for_text
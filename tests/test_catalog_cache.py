@@ -0,0 +1,48 @@
+from core.infrastructure.cache import CartCache, CatalogCache
+from core.infrastructure.services import ShopCardService, ShopService
+from core.internal.models import (
+    ProductCreate,
+    ProductUpdate,
+    ShopCardItemCreate,
+    UserCreate,
+)
+
+
+async def test_product_writes_retire_only_what_shows_them(db_manager):
+    catalog_cache, cart_cache = CatalogCache(), CartCache()
+    shop = ShopService(db_manager, catalog_cache, cart_cache)
+    cards = ShopCardService(db_manager, cart_cache)
+    tea = await shop.add_product(ProductCreate(name="Tea", price=2, stock=5))
+    cake = await shop.add_product(ProductCreate(name="Cake", price=3))
+    for user_id, product in ((1, tea), (2, cake)):
+        await shop.register_user(
+            UserCreate(telegram_id=user_id, username=None, full_name="U")
+        )
+        await cards.add_to_card(user_id, ShopCardItemCreate(product_id=product.id))
+        await cards.get_card_total(user_id)
+    await shop.get_product(cake.id)
+    version = catalog_cache.version
+
+    await shop.update_product(tea.id, ProductUpdate(stock=3))
+    await shop.update_product(tea.id, ProductUpdate(image_file_id="file"))
+    assert catalog_cache.version == version
+    assert cart_cache.get(1) is not None
+    assert cart_cache.get(2) is not None
+
+    await shop.update_product(tea.id, ProductUpdate(price=4))
+    assert catalog_cache.version > version
+    assert cart_cache.get(1) is None
+    assert cart_cache.get(2) is not None
+    assert catalog_cache.products.get(cake.id) is not None
+    assert (await cards.get_card_total(1)).total_price == 4
+
+
+async def test_cached_products_do_not_carry_the_image(db_manager):
+    shop = ShopService(db_manager, CatalogCache())
+    product = await shop.add_product(
+        ProductCreate(name="Tea", price=2, image=b"\xff\xd8 photo")
+    )
+
+    cached = await shop.get_product(product.id)
+    assert "image" not in cached.__dict__
+    assert await shop.get_product_image(product.id) == b"\xff\xd8 photo"
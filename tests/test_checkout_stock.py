@@ -0,0 +1,73 @@
+import asyncio
+
+import pytest
+
+from core.infrastructure import text_catalog
+from core.infrastructure.cache import CartCache
+from core.infrastructure.database.models import Product
+from core.infrastructure.services import (
+    InventoryService,
+    OrderDisplayFormatter,
+    OrderService,
+    OrderStatusError,
+    OutOfStockError,
+    ShopCardService,
+    ShopService,
+)
+from core.internal.enums import OrderStatus
+from core.internal.models import ProductCreate, ShopCardItemCreate, UserCreate
+
+
+async def _fill_carts(db_manager, user_ids, stock: int) -> int:
+    """One product with ``stock`` units, one unit of it in each user's cart."""
+    shop = ShopService(db_manager)
+    cards = ShopCardService(db_manager)
+    product = await shop.add_product(
+        ProductCreate(name="Tea", price=10, stock=stock)
+    )
+    for user_id in user_ids:
+        await shop.register_user(
+            UserCreate(telegram_id=user_id, username=None, full_name=f"User {user_id}")
+        )
+        await cards.add_to_card(
+            user_id, ShopCardItemCreate(product_id=product.id, quantity=1)
+        )
+    return product.id
+
+
+async def _stock(db_manager, product_id: int) -> int:
+    async with db_manager.get_db_session() as session:
+        return (await session.get(Product, product_id)).stock
+
+
+async def test_concurrent_checkouts_do_not_oversell(db_manager):
+    user_ids = range(1, 11)
+    product_id = await _fill_carts(db_manager, user_ids, stock=4)
+    orders = OrderService(db_manager, None, CartCache())
+
+    results = await asyncio.gather(
+        *(orders.checkout(user_id, f"key-{user_id}") for user_id in user_ids),
+        return_exceptions=True,
+    )
+
+    created = [r for r in results if isinstance(r, tuple)]
+    refused = [r for r in results if isinstance(r, OutOfStockError)]
+    assert len(created) == 4
+    assert len(refused) == 6
+    assert all(order.stock_reserved for order, _ in created)
+    assert await _stock(db_manager, product_id) == 0
+
+
+async def test_cancelled_order_is_final(db_manager):
+    await text_catalog.startup()
+    product_id = await _fill_carts(db_manager, [1], stock=1)
+    orders = OrderService(db_manager, text_catalog.formatter(OrderDisplayFormatter))
+    order, _ = await orders.checkout(1, "key")
+
+    await orders.update_order_status(order.id, OrderStatus.CANCELLED)
+    assert await InventoryService(db_manager).release_cancelled() == 1
+    assert await _stock(db_manager, product_id) == 1
+
+    with pytest.raises(OrderStatusError):
+        await orders.update_order_status(order.id, OrderStatus.DELIVERED)
+    assert (await orders.get_order(order.id)).status == OrderStatus.CANCELLED
@@ -0,0 +1,55 @@
+import csv
+import gzip
+
+from core.infrastructure.services import (
+    OrderExportService,
+    OrderService,
+    ShopCardService,
+    ShopService,
+)
+from core.internal.models import ProductCreate, ShopCardItemCreate, UserCreate
+
+
+async def _two_orders_of_two_lines(db_manager) -> None:
+    shop = ShopService(db_manager)
+    cards = ShopCardService(db_manager)
+    orders = OrderService(db_manager, None)
+    tea = await shop.add_product(ProductCreate(name="Tea", price=2))
+    cake = await shop.add_product(ProductCreate(name="Cake", price=3))
+    for user_id in (1, 2):
+        await shop.register_user(
+            UserCreate(telegram_id=user_id, username=None, full_name="U")
+        )
+        for product in (tea, cake):
+            await cards.add_to_card(
+                user_id, ShopCardItemCreate(product_id=product.id, quantity=user_id)
+            )
+        await orders.checkout(user_id, f"key-{user_id}")
+
+
+async def test_export_counts_orders_across_chunks(db_manager):
+    await _two_orders_of_two_lines(db_manager)
+    service = OrderExportService(db_manager, None, chunk_size=1)
+
+    async with service.export_orders() as export:
+        assert (export.orders, export.rows, export.since) == (2, 4, None)
+        with gzip.open(export.path, "rt", encoding="utf-8", newline="") as fp:
+            rows = list(csv.DictReader(fp))
+    assert not export.path.exists()
+
+    assert [(row["order_id"], row["product_name"]) for row in rows] == [
+        ("1", "Tea"),
+        ("1", "Cake"),
+        ("2", "Tea"),
+        ("2", "Cake"),
+    ]
+    assert [row["line_total"] for row in rows] == ["2.0", "3.0", "4.0", "6.0"]
+
+
+async def test_export_of_zero_days_is_empty(db_manager):
+    await _two_orders_of_two_lines(db_manager)
+    service = OrderExportService(db_manager, None)
+
+    async with service.export_orders(0) as export:
+        assert (export.orders, export.rows) == (0, 0)
+        assert export.since is not None
@@ -0,0 +1,48 @@
+from sqlalchemy import func, update
+
+from core.infrastructure.database.models import Order
+from core.infrastructure.services import OrderService, ShopService
+from core.internal.enums import OrderStatus
+from core.internal.models import UserCreate
+from core.internal.types import OrderCursor
+
+
+async def _orders_of_one_second(db_manager, count: int) -> None:
+    await ShopService(db_manager).register_user(
+        UserCreate(telegram_id=1, username=None, full_name="User")
+    )
+    async with db_manager.get_db_session() as session:
+        session.add_all(
+            Order(total_price=10, total_count=1, user_id=1) for _ in range(count)
+        )
+        await session.flush()
+        # Server-side timestamp, as the column default stores it
+        await session.execute(update(Order).values(created_at=func.now()))
+
+
+def _callback_cursor(cursor: OrderCursor) -> OrderCursor:
+    """The cursor as it comes back from the page buttons."""
+    return OrderCursor.from_args(*cursor.to_args())
+
+
+async def test_queue_pages_through_orders_of_one_second(db_manager):
+    await _orders_of_one_second(db_manager, 10)
+    orders = OrderService(db_manager, None)
+
+    page = await orders.get_order_queue(OrderStatus.PENDING)
+    pages = [[row.id for row in page.items]]
+    while page.has_next:
+        page = await orders.get_order_queue(
+            OrderStatus.PENDING, page=page.page + 1, after=_callback_cursor(page.last)
+        )
+        pages.append([row.id for row in page.items])
+    assert pages == [[1, 2, 3], [4, 5, 6], [7, 8, 9], [10]]
+
+    back = []
+    while page.has_prev:
+        page = await orders.get_order_queue(
+            OrderStatus.PENDING, page=page.page - 1, before=_callback_cursor(page.first)
+        )
+        back.append([row.id for row in page.items])
+    assert back == pages[-2::-1]
+    assert page.page == 0
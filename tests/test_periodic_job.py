@@ -0,0 +1,34 @@
+import asyncio
+
+from core.infrastructure.jobs import JobRunner, PeriodicJob
+
+
+class Backlog(PeriodicJob):
+    job_name = "backlog"
+
+    def __init__(self, db_manager, items: int):
+        super().__init__(db_manager, interval=3600)
+        self.items = items
+        self.batches = 0
+
+    async def run_batch(self, batch_size: int) -> bool:
+        self.batches += 1
+        taken = min(batch_size, self.items)
+        self.items -= taken
+        if self.batches == 2:
+            raise RuntimeError("transient")
+        return taken >= batch_size
+
+
+async def test_periodic_job_drains_then_waits_for_wake(db_manager):
+    job, runner = Backlog(db_manager, items=5), JobRunner()
+    assert job.start(runner, 2)
+    assert not job.start(runner, 2)
+    await asyncio.sleep(0.01)
+    # Two full batches, the second failing: then it waits for the interval
+    assert (job.batches, job.items) == (2, 1)
+
+    job.wake()
+    await asyncio.sleep(0.01)
+    assert (job.batches, job.items) == (3, 0)
+    await runner.stop()
@@ -0,0 +1,39 @@
+from core.infrastructure import text_catalog
+from core.infrastructure.cache import CatalogCache
+from core.infrastructure.services import (
+    CatalogService,
+    ProductDisplayFormatter,
+    ShopService,
+)
+from core.internal.models import ProductCreate, ProductUpdate
+
+
+async def _found(catalog: CatalogService, query: str) -> list:
+    page = await catalog.search_inline(query)
+    return [result.title for result in page.results]
+
+
+async def test_search_follows_product_writes(migrated_db_manager):
+    await text_catalog.startup()
+    catalog_cache = CatalogCache()
+    shop = ShopService(migrated_db_manager, catalog_cache)
+    catalog = CatalogService(
+        shop, text_catalog.formatter(ProductDisplayFormatter), catalog_cache
+    )
+    tea = await shop.add_product(
+        ProductCreate(name="Green tea", description="Loose leaf", price=5)
+    )
+    coffee = await shop.add_product(ProductCreate(name="Black coffee", price=7))
+
+    assert await _found(catalog, "te") == ["Green tea"]
+    assert await _found(catalog, "LOOSE lea") == ["Green tea"]
+    assert await _found(catalog, "tea coffee") == []
+    assert await _found(catalog, "catalog") == ["Green tea", "Black coffee"]
+
+    # Cached pages are retired by the rename, the index by the trigger
+    await shop.update_product(coffee.id, ProductUpdate(name="Black tea"))
+    assert sorted(await _found(catalog, "tea")) == ["Black tea", "Green tea"]
+    assert await _found(catalog, "coffee") == []
+
+    await shop.delete_product(tea.id)
+    assert await _found(catalog, "tea") == ["Black tea"]
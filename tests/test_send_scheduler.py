@@ -0,0 +1,57 @@
+import asyncio
+from time import monotonic
+
+from aiogram.methods import SendMessage
+
+from config import SendSchedulerConfig
+from core.internal.enums import SendPriority
+from middleware.send_scheduler_middleware import SendSchedulerMiddleware
+from utils import send_priority
+
+
+async def test_reply_waiting_for_its_chat_does_not_block_other_chats():
+    scheduler = SendSchedulerMiddleware(SendSchedulerConfig(chat_rate=2, chat_burst=1))
+    sent = []
+
+    async def make_request(bot, method):
+        sent.append((method.chat_id, monotonic()))
+
+    async def send(chat_id: int, priority: SendPriority) -> None:
+        with send_priority(priority):
+            await scheduler(make_request, None, SendMessage(chat_id=chat_id, text="-"))
+
+    await send(1, SendPriority.REPLY)
+    started = monotonic()
+    # The second reply to chat 1 waits ~0.5 s for its chat bucket
+    reply = asyncio.create_task(send(1, SendPriority.REPLY))
+    await asyncio.sleep(0.01)
+    await send(2, SendPriority.NOTIFICATION)
+    await reply
+
+    assert [chat_id for chat_id, _ in sent] == [1, 2, 1]
+    assert sent[1][1] - started < 0.2
+    assert all(count == 0 for count in scheduler._waiting.values())
+
+
+async def test_replies_go_first_when_the_global_bucket_is_short():
+    scheduler = SendSchedulerMiddleware(
+        SendSchedulerConfig(global_rate=20, global_burst=1)
+    )
+    sent = []
+
+    async def make_request(bot, method):
+        sent.append(method.chat_id)
+
+    async def send(chat_id: int, priority: SendPriority) -> None:
+        with send_priority(priority):
+            await scheduler(make_request, None, SendMessage(chat_id=chat_id, text="-"))
+
+    await send(1, SendPriority.BROADCAST)
+    broadcast = [
+        asyncio.create_task(send(chat_id, SendPriority.BROADCAST))
+        for chat_id in (2, 3)
+    ]
+    await asyncio.sleep(0)
+    await asyncio.gather(send(4, SendPriority.REPLY), *broadcast)
+
+    assert sent[:2] == [1, 4]
@@ -0,0 +1,57 @@
+import asyncio
+from datetime import datetime
+
+from sqlalchemy import select, update
+
+from core.infrastructure.database.models import ShopCard, ShopCardItem
+from core.infrastructure.services import ShopCardService, ShopService
+from core.internal.models import (
+    ProductCreate,
+    ProductUpdate,
+    ShopCardItemCreate,
+    UserCreate,
+)
+
+
+async def test_concurrent_adds_keep_one_line(db_manager):
+    shop = ShopService(db_manager)
+    cards = ShopCardService(db_manager)
+    product = await shop.add_product(ProductCreate(name="Tea", price=2.5))
+    await shop.register_user(UserCreate(telegram_id=1, username=None, full_name="A"))
+
+    await asyncio.gather(
+        *(
+            cards.add_to_card(1, ShopCardItemCreate(product_id=product.id, quantity=1))
+            for _ in range(20)
+        )
+    )
+
+    async with db_manager.get_db_session() as session:
+        items = (await session.scalars(select(ShopCardItem))).all()
+        card = await session.scalar(select(ShopCard))
+    assert [(item.product_id, item.quantity) for item in items] == [(product.id, 20)]
+    assert (card.items_count, card.lines_count, card.total_price) == (20, 1, 50.0)
+
+    assert await cards.remove_from_card(1, product.id)
+    assert not await cards.remove_from_card(1, product.id)
+    total = await cards.get_card_total(1)
+    assert (total.items, total.items_count, total.total_price) == ([], 0, 0.0)
+
+
+async def test_price_edit_refreshes_carts_without_touching_them(db_manager):
+    shop = ShopService(db_manager)
+    cards = ShopCardService(db_manager)
+    product = await shop.add_product(ProductCreate(name="Tea", price=2.5))
+    await shop.register_user(UserCreate(telegram_id=1, username=None, full_name="A"))
+    await cards.add_to_card(1, ShopCardItemCreate(product_id=product.id, quantity=4))
+    idle_since = datetime(2020, 1, 1)
+    async with db_manager.get_db_session() as session:
+        await session.execute(update(ShopCard).values(updated_at=idle_since))
+
+    updated = await shop.update_product(product.id, ProductUpdate(price=3))
+
+    assert updated.price == 3
+    async with db_manager.get_db_session() as session:
+        card = await session.scalar(select(ShopCard))
+    assert card.total_price == 12.0
+    assert card.updated_at == idle_since
@@ -0,0 +1,75 @@
+import asyncio
+from time import monotonic
+
+from aiogram import Dispatcher, Router
+from aiogram.methods import AnswerCallbackQuery
+from aiogram.types import CallbackQuery, Update, User
+from sqlalchemy import event
+
+from config import ThrottlingConfig
+from core.infrastructure.services import ShopService
+from core.internal.models import ProductCreate
+from middleware import ThrottlingMiddleware
+
+CONFIG = ThrottlingConfig(rate=2.0, burst=6)  # the catalog router's limits
+
+
+def _callback(update_id: int, user_id: int, data: str) -> Update:
+    return Update(
+        update_id=update_id,
+        callback_query=CallbackQuery(
+            id=str(update_id),
+            from_user=User(id=user_id, is_bot=False, first_name="U"),
+            chat_instance="storm",
+            data=data,
+        ),
+    )
+
+
+async def test_callback_storm_keeps_db_queries_bounded(db_manager, bot):
+    shop = ShopService(db_manager)
+    for number in range(20):
+        await shop.add_product(ProductCreate(name=f"Product {number}", price=1))
+
+    queries = 0
+
+    def count_query(*args) -> None:
+        nonlocal queries
+        queries += 1
+
+    event.listen(db_manager.engine.sync_engine, "before_cursor_execute", count_query)
+
+    handled = 0
+    router = Router()
+    throttling = ThrottlingMiddleware(CONFIG)
+    router.callback_query.middleware(throttling)
+
+    @router.callback_query()
+    async def catalog_page(callback: CallbackQuery) -> None:
+        nonlocal handled
+        handled += 1
+        await shop.get_all_products()
+
+    dispatcher = Dispatcher()
+    dispatcher.include_router(router)
+
+    started = monotonic()
+    # 100 taps on the same button while the first one is still running,
+    # then 100 taps on different pages, from one user
+    same = [_callback(i, 1, "catalog_next_1") for i in range(100)]
+    pages = [_callback(100 + i, 1, f"catalog_next_{i}") for i in range(100)]
+    await asyncio.gather(*(dispatcher.feed_update(bot, u) for u in same))
+    await asyncio.gather(*(dispatcher.feed_update(bot, u) for u in pages))
+    elapsed = monotonic() - started
+
+    # A second user is throttled on their own bucket
+    await dispatcher.feed_update(bot, _callback(1000, 2, "catalog_next_1"))
+
+    allowed = CONFIG.burst + CONFIG.rate * elapsed
+    assert 1 < handled - 1 <= allowed
+    assert queries == handled
+    # Every dropped callback was still answered, so no client spinner hangs
+    answers = [
+        m for m in bot.session.requests if isinstance(m, AnswerCallbackQuery)
+    ]
+    assert len(answers) == 201 - handled
@@ -2,5 +2,21 @@ from .string_builder import StringBuilder
 from .image_selector import ImageSelector
 from .state_to_model import StateToModel
 from .exec import handle_shopcard_errors
+from .lru_cache import LRUCache
+from .token_bucket import TokenBucket
+from .callback_trie import CallbackTrie
+from .callback_codec import CallbackCodec
+from .send_priority import current_send_priority, send_priority
 
-__all__ = ["StringBuilder", "ImageSelector", "StateToModel", "handle_shopcard_errors"]
\ No newline at end of file
+__all__ = [
+    "StringBuilder",
+    "ImageSelector",
+    "StateToModel",
+    "handle_shopcard_errors",
+    "LRUCache",
+    "TokenBucket",
+    "send_priority",
+    "current_send_priority",
+    "CallbackTrie",
+    "CallbackCodec",
+]
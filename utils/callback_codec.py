@@ -0,0 +1,74 @@
+from base64 import urlsafe_b64decode, urlsafe_b64encode
+from binascii import Error as BinasciiError
+from typing import Dict, Generic, Optional, Sequence, Tuple, TypeVar
+
+A = TypeVar("A")
+
+MAX_CALLBACK_DATA_BYTES = 64
+
+
+class CallbackCodec(Generic[A]):
+    """
+    Packs an action and unsigned integer arguments into callback data.
+
+    Layout before base64: one version byte, one action byte (the position of
+    the action in ``actions``) and the arguments as LEB128 varints. The result
+    is ``marker`` followed by unpadded url-safe base64, so it never collides
+    with plain string payloads. Decoding is a base64 decode and a byte loop.
+    """
+
+    def __init__(self, actions: Sequence[A], version: int = 1, marker: str = "!"):
+        if len(actions) > 0xFF:
+            raise ValueError("at most 255 actions can be packed")
+        if not 0 <= version <= 0xFF:
+            raise ValueError("version must fit in one byte")
+        self.actions: Tuple[A, ...] = tuple(actions)
+        self.version = version
+        self.marker = marker
+        self._codes: Dict[A, int] = {action: code for code, action in enumerate(self.actions)}
+
+    def is_packed(self, data: str) -> bool:
+        return data.startswith(self.marker)
+
+    def encode(self, action: A, *args: int) -> str:
+        payload = bytearray((self.version, self._codes[action]))
+        for value in args:
+            if value < 0:
+                raise ValueError(f"cannot pack negative argument {value}")
+            while value > 0x7F:
+                payload.append((value & 0x7F) | 0x80)
+                value >>= 7
+            payload.append(value)
+
+        data = self.marker + urlsafe_b64encode(payload).rstrip(b"=").decode()
+        if len(data) > MAX_CALLBACK_DATA_BYTES:
+            raise ValueError(f"callback data is {len(data)} bytes, limit is 64")
+        return data
+
+    def decode(self, data: str) -> Optional[Tuple[A, Tuple[int, ...]]]:
+        """Return the action and arguments, None for foreign or outdated data."""
+        if not self.is_packed(data):
+            return None
+
+        encoded = data[len(self.marker) :]
+        try:
+            payload = urlsafe_b64decode(encoded + "=" * (-len(encoded) % 4))
+        except (BinasciiError, ValueError):
+            return None
+
+        if len(payload) < 2 or payload[0] != self.version or payload[1] >= len(self.actions):
+            return None
+
+        args = []
+        value = shift = 0
+        for byte in payload[2:]:
+            value |= (byte & 0x7F) << shift
+            if byte & 0x80:
+                shift += 7
+            else:
+                args.append(value)
+                value = shift = 0
+        if shift:
+            return None
+
+        return self.actions[payload[1]], tuple(args)
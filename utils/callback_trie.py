@@ -0,0 +1,53 @@
+from typing import Dict, Generic, Iterable, List, Optional, Tuple, TypeVar
+
+V = TypeVar("V")
+
+
+class _Node(Generic[V]):
+    __slots__ = ("children", "value")
+
+    def __init__(self) -> None:
+        self.children: Dict[str, "_Node[V]"] = {}
+        self.value: Optional[V] = None
+
+
+class CallbackTrie(Generic[V]):
+    """
+    Trie over ``separator``-delimited segments answering longest-prefix lookups.
+
+    A lookup is a single walk with one dict access per segment, and overlapping
+    prefixes (``received_orders_`` and ``received_orders_next_``) are resolved
+    by length, never by registration order.
+    """
+
+    def __init__(self, items: Iterable[Tuple[str, V]] = (), separator: str = "_"):
+        self.separator = separator
+        self._root: _Node[V] = _Node()
+        for prefix, value in items:
+            self.insert(prefix, value)
+
+    def _segments(self, key: str) -> List[str]:
+        return key.split(self.separator)
+
+    def insert(self, prefix: str, value: V) -> None:
+        node = self._root
+        for segment in self._segments(prefix.rstrip(self.separator)):
+            node = node.children.setdefault(segment, _Node())
+        node.value = value
+
+    def longest_prefix(self, key: str) -> Optional[Tuple[V, List[str]]]:
+        """Return the value of the longest prefix of ``key`` and the remaining segments."""
+        segments = self._segments(key)
+        node = self._root
+        match: Optional[Tuple[V, int]] = None
+        for index, segment in enumerate(segments):
+            node = node.children.get(segment)
+            if node is None:
+                break
+            if node.value is not None:
+                match = (node.value, index + 1)
+
+        if match is None:
+            return None
+        value, end = match
+        return value, segments[end:]
@@ -0,0 +1,23 @@
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterator
+
+from core.internal.enums import SendPriority
+
+_current_priority: ContextVar[SendPriority] = ContextVar(
+    "send_priority", default=SendPriority.REPLY
+)
+
+
+@contextmanager
+def send_priority(priority: SendPriority) -> Iterator[None]:
+    """Send every Bot API request made inside the block through the given lane."""
+    token = _current_priority.set(priority)
+    try:
+        yield
+    finally:
+        _current_priority.reset(token)
+
+
+def current_send_priority() -> SendPriority:
+    return _current_priority.get()
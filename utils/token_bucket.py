@@ -0,0 +1,39 @@
+from time import monotonic
+from typing import Optional
+
+
+class TokenBucket:
+    """Token bucket refilled continuously at ``rate`` tokens per second."""
+
+    __slots__ = ("rate", "capacity", "tokens", "updated_at")
+
+    def __init__(self, rate: float, capacity: float):
+        if rate <= 0 or capacity <= 0:
+            raise ValueError("rate and capacity must be positive")
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated_at = monotonic()
+
+    def _refill(self, now: float) -> None:
+        elapsed = now - self.updated_at
+        if elapsed > 0:
+            self.tokens = min(self.capacity, self.tokens + elapsed * self.rate)
+            self.updated_at = now
+
+    def consume(self, amount: float = 1, now: Optional[float] = None) -> bool:
+        """Take ``amount`` tokens if available. Returns False when throttled."""
+        self._refill(monotonic() if now is None else now)
+        if self.tokens >= amount:
+            self.tokens -= amount
+            return True
+        return False
+
+    def delay(self, amount: float = 1, now: Optional[float] = None) -> float:
+        """Seconds until ``amount`` tokens are available (0 if available now)."""
+        self._refill(monotonic() if now is None else now)
+        missing = amount - self.tokens
+        return missing / self.rate if missing > 0 else 0.0
+
+    def __repr__(self) -> str:
+        return f"TokenBucket(rate={self.rate}, capacity={self.capacity}, tokens={self.tokens:.2f})"